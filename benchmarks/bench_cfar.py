@@ -0,0 +1,39 @@
+"""
+Compare the per-cell loop and vectorized CA-CFAR detectors.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_cfar
+"""
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.signalProcessing import ca_cfar_detector
+
+CFAR_PARAMS = {'num_train': 35, 'num_guard': 5, 'pfa': 8e-3, 'peak_guard': 1}
+
+# The reference loop is too slow to be worth timing on the largest records
+MAX_LOOP_CELLS = 100_000
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print(f"{'cells':>9} {'loop (ms)':>10} {'vectorized (ms)':>16} {'speedup':>8} {'match':>6}")
+    for n in (1_000, 10_000, 100_000, 1_000_000):
+        x = rng.standard_normal(n) + 1j * rng.standard_normal(n)
+        x[rng.integers(0, n, max(n // 2000, 1))] *= 50   # sprinkle targets
+
+        t_vec = best_of(lambda: ca_cfar_detector(x, **CFAR_PARAMS))
+        if n <= MAX_LOOP_CELLS:
+            t_loop = best_of(lambda: ca_cfar_detector(x, **CFAR_PARAMS, method='loop'), repeat=1)
+            match = np.array_equal(ca_cfar_detector(x, **CFAR_PARAMS, method='loop'),
+                                   ca_cfar_detector(x, **CFAR_PARAMS))
+            print(f"{n:>9} {t_loop*1e3:>10.1f} {t_vec*1e3:>16.2f} "
+                  f"{t_loop/t_vec:>7.0f}x {str(match):>6}")
+        else:
+            print(f"{n:>9} {'-':>10} {t_vec*1e3:>16.2f} {'-':>8} {'-':>6}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""
+Time and peak memory of RadarSimulator.coherent_integration, with and
+without keeping the range-line matrix, for growing pulse counts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_coherent_integration
+"""
+import contextlib
+import io
+import time
+import tracemalloc
+
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+
+def _run(radar, pulse, targets, keep_matrix):
+    tracemalloc.start()
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        integrated, _ = radar.coherent_integration(pulse, targets, keep_matrix=keep_matrix)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return integrated, elapsed, peak
+
+
+def main() -> None:
+    targets = create_target_scenario("dense")
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator()
+    pulse, _ = radar.generate_pulse()
+
+    print(f"{'pulses':>7} {'matrix (s)':>11} {'peak (MB)':>10} "
+          f"{'integrate-only (s)':>19} {'peak (MB)':>10}")
+    for n_pulses in (128, 512, 2048):
+        radar.n_pulses = n_pulses
+        _, t_full, peak_full = _run(radar, pulse, targets, keep_matrix=True)
+        _, t_lean, peak_lean = _run(radar, pulse, targets, keep_matrix=False)
+        print(f"{n_pulses:>7} {t_full:>11.2f} {peak_full/2**20:>10.0f} "
+              f"{t_lean:>19.2f} {peak_lean/2**20:>10.0f}")
+
+
+if __name__ == "__main__":
+    main()
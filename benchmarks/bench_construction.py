@@ -0,0 +1,68 @@
+"""
+Import and construction cost: cold import time of the CLI and plotting
+modules with and without the eagerly imported modules they now defer
+(scipy.optimize, scipy.ndimage, seaborn), and the time to create one
+RadarSimulator printing its parameters, quietly, quietly with its noise
+generator created (what every construction used to pay), from a shared
+RadarConfig, and of a bare RadarConfig.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_construction
+"""
+import contextlib
+import io
+import subprocess
+import sys
+
+from benchmarks.common import best_of
+from radar.config import RadarConfig
+from radar.radarSimulator import RadarSimulator
+
+N_CONFIGS = 10000
+
+
+def _import_seconds(modules, repeat=5):
+    """Best cold import time of *modules* in a fresh interpreter."""
+    code = ("import time; start = time.perf_counter(); "
+            f"import {', '.join(modules)}; print(time.perf_counter() - start)")
+    return min(float(subprocess.run([sys.executable, '-c', code], capture_output=True,
+                                    text=True, check=True).stdout)
+               for _ in range(repeat))
+
+
+def main() -> None:
+    deferred = ['scipy.optimize', 'scipy.ndimage']
+    print(f"{'import':<28} {'now (ms)':>9} {'eager (ms)':>11}")
+    for module, eager in (('radar.radarSimulator', deferred),
+                          ('main', deferred),
+                          ('visualizations.plotResults', deferred + ['seaborn'])):
+        now = _import_seconds([module])
+        before = _import_seconds([module] + eager)
+        print(f"{module:<28} {now * 1e3:>9.0f} {before * 1e3:>11.0f}")
+
+    config = RadarConfig(range_gate=(3000, 5000))
+    sink = io.StringIO()
+
+    def printing():
+        with contextlib.redirect_stdout(sink):
+            RadarSimulator(seed=0)
+        sink.seek(0)
+        sink.truncate()
+
+    cases = {
+        'printing': printing,
+        'quiet': lambda: RadarSimulator(seed=0, quiet=True),
+        'quiet + rng': lambda: RadarSimulator(seed=0, quiet=True).rng,
+        'from_config, quiet': lambda: RadarSimulator.from_config(config, seed=0, quiet=True),
+        'RadarConfig': lambda: RadarConfig(n_pulses=64),
+    }
+    print(f"\nConstruction, best of 5 x {N_CONFIGS}:")
+    print(f"{'variant':<20} {'us/object':>10}")
+    for name, func in cases.items():
+        t = best_of(func, repeat=5, number=N_CONFIGS)
+        print(f"{name:<20} {t * 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
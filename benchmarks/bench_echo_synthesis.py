@@ -0,0 +1,60 @@
+"""
+Echo synthesis: allocating records vs writing into a reused PRI buffer,
+and time-domain synthesis + matched filtering vs compressed-domain
+synthesis (|P(f)|²·H(f)) for growing target counts.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_echo_synthesis
+"""
+import contextlib
+import io
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.radarSimulator import RadarSimulator
+from radar.targets import simulate_echoes, simulate_into
+
+
+def main() -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(seed=0)
+    pulse, _ = radar.generate_pulse()
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+    rng = np.random.default_rng(0)
+
+    print("Single pulse into one PRI")
+    print(f"{'targets':>8} {'allocate+pad (µs)':>18} {'into buffer (µs)':>17}")
+    buffer = np.empty(pri_samples, dtype=complex)
+    for n_targets in (7, 100):
+        targets = list(rng.uniform(500, 25_000, n_targets))
+
+        def allocate():
+            record, _ = simulate_echoes(pulse, radar.sample_rate, targets, noise_std=3e-7, rng=radar.rng)
+            record = record[:pri_samples]
+            np.pad(record, (0, pri_samples - len(record)))
+
+        def into():
+            simulate_into(buffer, pulse, radar.sample_rate, targets, noise_std=3e-7, rng=radar.rng)
+
+        print(f"{n_targets:>8} {best_of(allocate)*1e6:>18.0f} {best_of(into)*1e6:>17.0f}")
+
+    print(f"\nCPI of {radar.n_pulses} pulses, range-Doppler matrix kept")
+    print(f"{'targets':>8} {'motion':>11} {'time + MF (ms)':>15} {'frequency (ms)':>15}")
+    for n_targets in (7, 50, 200):
+        ranges = rng.uniform(500, 25_000, n_targets)
+        for motion, velocities in (("stationary", np.zeros(n_targets)),
+                                   ("moving", rng.uniform(-30, 30, n_targets))):
+            targets = list(zip(ranges, velocities))
+            times = {}
+            for synthesis in ("time", "frequency"):
+                def cpi():
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        radar.coherent_integration(pulse, targets, synthesis=synthesis)
+                times[synthesis] = best_of(cpi, repeat=3)
+            print(f"{n_targets:>8} {motion:>11} {times['time']*1e3:>15.1f} "
+                  f"{times['frequency']*1e3:>15.1f}")
+
+if __name__ == "__main__":
+    main()
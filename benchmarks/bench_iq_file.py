@@ -0,0 +1,53 @@
+"""
+Recording and memory-mapped replay throughput for the raw I/Q file format,
+with the peak Python heap used while replaying.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_iq_file
+"""
+import contextlib
+import io
+import os
+import tempfile
+import time
+import tracemalloc
+
+from radar.iqFile import IQReader
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+
+def main() -> None:
+    targets = create_target_scenario("dense")
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(seed=0)
+    pulse, _ = radar.generate_pulse()
+
+    print(f"{'CPIs':>5} {'file (MB)':>10} {'write (MB/s)':>13} {'replay (MB/s)':>14} "
+          f"{'replay peak (MB)':>17}")
+    with tempfile.TemporaryDirectory() as tmp:
+        for n_cpis in (1, 4, 16):
+            path = os.path.join(tmp, f"bench_{n_cpis}.iq")
+            start = time.perf_counter()
+            with radar.open_recording(path) as recorder, contextlib.redirect_stdout(io.StringIO()):
+                for _ in range(n_cpis):
+                    radar.coherent_integration(pulse, targets, keep_matrix=False, recorder=recorder)
+            write_time = time.perf_counter() - start
+            size = os.path.getsize(path) / 2**20
+
+            tracemalloc.start()
+            start = time.perf_counter()
+            with IQReader(path) as reader:
+                for first in range(0, len(reader), radar.n_pulses):
+                    radar.integrate_recording(reader, pulse, first=first)
+            replay_time = time.perf_counter() - start
+            _, peak = tracemalloc.get_traced_memory()
+            tracemalloc.stop()
+
+            print(f"{n_cpis:>5} {size:>10.1f} {size/write_time:>13.1f} {size/replay_time:>14.1f} "
+                  f"{peak/2**20:>17.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,48 @@
+"""
+Time a 10^4-trial Monte Carlo Pd/Pfa sweep and print the resulting curves.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_monte_carlo
+"""
+import contextlib
+import io
+import time
+
+import numpy as np
+
+from radar.monteCarlo import monte_carlo_sweep
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+NOISE_STDS = (3e-7, 1e-6, 3e-6, 1e-5, 3e-5)
+CFAR_PARAM_SETS = (
+    {'num_train': 35, 'num_guard': 5, 'pfa': 8e-3, 'peak_guard': 1},
+    {'num_train': 35, 'num_guard': 5, 'pfa': 1e-4, 'peak_guard': 1},
+)
+TRIALS_PER_POINT = 1000
+
+
+def main() -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator()
+    pulse, _ = radar.generate_pulse()
+    scenarios = {"extended": create_target_scenario("extended")}
+
+    start = time.perf_counter()
+    results = monte_carlo_sweep(radar, pulse, scenarios, NOISE_STDS, CFAR_PARAM_SETS,
+                                n_trials=TRIALS_PER_POINT, seed=0)
+    elapsed = time.perf_counter() - start
+
+    n_total = TRIALS_PER_POINT * len(results)
+    print(f"{n_total} trials in {elapsed:.1f} s ({elapsed / n_total * 1e3:.2f} ms/trial)\n")
+    print(f"{'noise_std':>9} {'cfar pfa':>9} {'min SNR (dB)':>13} {'mean Pd':>8} "
+          f"{'min Pd':>7} {'Pfa':>9} {'RMSE (m)':>9}")
+    for row in results:
+        print(f"{row['noise_std']:>9.0e} {row['cfar_params']['pfa']:>9.0e} "
+              f"{np.min(row['snr_db']):>13.1f} {np.mean(row['pd']):>8.3f} "
+              f"{np.min(row['pd']):>7.3f} {row['pfa']:>9.2e} {row['range_rmse']:>9.2f}")
+
+
+if __name__ == "__main__":
+    main()
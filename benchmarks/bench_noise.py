@@ -0,0 +1,58 @@
+"""
+Compare legacy two-draw noise generation with the in-place Generator path
+on a full 128 x 20,000 pulse matrix.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_noise
+"""
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.noise import BIT_GENERATORS, add_noise_inplace, fill_complex_noise, make_rng
+
+SHAPE = (128, 20_000)
+NOISE_STD = 3e-7
+
+
+def legacy(signal):
+    """The original add_complex_noise: two global draws, four allocations."""
+    sigma = NOISE_STD / np.sqrt(2)
+    noise_i = np.random.normal(0, sigma, size=signal.shape)
+    noise_q = np.random.normal(0, sigma, size=signal.shape)
+    return signal + (noise_i + 1j * noise_q)
+
+
+def peak_mb(func):
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return peak / 2**20
+
+
+def main() -> None:
+    signal = np.zeros(SHAPE, dtype=complex)
+    buffer = np.empty(SHAPE, dtype=complex)
+    rng = make_rng(0)
+
+    rows = [
+        ("legacy np.random.normal x2", lambda: legacy(signal)),
+        ("fill_complex_noise (pcg64)", lambda: fill_complex_noise(buffer, NOISE_STD, rng)),
+        ("add_noise_inplace (pcg64)", lambda: add_noise_inplace(buffer, NOISE_STD, rng)),
+    ]
+    for name in BIT_GENERATORS:
+        if name != 'pcg64':
+            gen = make_rng(0, name)
+            rows.append((f"fill_complex_noise ({name})",
+                         lambda gen=gen: fill_complex_noise(buffer, NOISE_STD, gen)))
+
+    print(f"{'method':<30} {'time (ms)':>10} {'extra peak (MB)':>16}")
+    for name, func in rows:
+        print(f"{name:<30} {best_of(func)*1e3:>10.1f} {peak_mb(func):>16.1f}")
+
+
+if __name__ == "__main__":
+    main()
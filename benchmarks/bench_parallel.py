@@ -0,0 +1,43 @@
+"""
+Scaling of parallel coherent integration at 1/2/4/8 workers.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_parallel
+"""
+import contextlib
+import io
+import os
+
+from benchmarks.common import best_of
+from radar.parallel import integrate_cpis, parallel_coherent_integration
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+WORKER_COUNTS = (1, 2, 4, 8)
+
+
+def main() -> None:
+    targets = create_target_scenario("dense")
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(n_pulses=1024)
+    pulse, _ = radar.generate_pulse()
+
+    print(f"CPUs available: {os.cpu_count()}, {radar.n_pulses} pulses per CPI")
+    print(f"{'workers':>8} {'backend':>8} {'one CPI (s)':>12} {'speedup':>8} "
+          f"{'8 CPIs (s)':>11} {'speedup':>8}")
+    for backend in ('process', 'thread'):
+        base_cpi = base_batch = None
+        for n_workers in WORKER_COUNTS:
+            t_cpi = best_of(lambda: parallel_coherent_integration(
+                radar, pulse, targets, n_workers=n_workers, backend=backend, seed=0), repeat=2)
+            t_batch = best_of(lambda: integrate_cpis(
+                radar, pulse, targets, 8, n_workers=n_workers, backend=backend, seed=0), repeat=1)
+            base_cpi = base_cpi or t_cpi
+            base_batch = base_batch or t_batch
+            print(f"{n_workers:>8} {backend:>8} {t_cpi:>12.2f} {base_cpi/t_cpi:>7.2f}x "
+                  f"{t_batch:>11.2f} {base_batch/t_batch:>7.2f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+"""
+Rendering cost of the results figure with every sample plotted versus
+min/max decimation to the pixel width, for growing record lengths, plus
+the cost of an in-place live update and of a decimated range-Doppler map.
+
+Renders to PNG files with the Agg canvas (no window). Run from the
+repository root:
+
+    python -m benchmarks.bench_plotting
+"""
+import os
+import tempfile
+
+import numpy as np
+
+from benchmarks.common import best_of
+from visualizations.plotResults import (
+    LiveRangeProfile,
+    plot_comprehensive_results,
+    plot_range_doppler,
+)
+
+
+def _signals(n: int, rng: np.random.Generator):
+    noise = lambda: rng.standard_normal(n) + 1j * rng.standard_normal(n)
+    echo_time = np.arange(n) / 100e6
+    peaks = np.sort(rng.choice(np.arange(n // 10, n), 5, replace=False))
+    integrated = noise()
+    integrated[peaks] *= 50
+    distances = echo_time[peaks] * 3e8 / 2
+    return dict(received_signal=noise(), mf_single=noise(), integrated=integrated,
+                n_pulses=128, echo_time=echo_time, peaks=peaks,
+                distances=distances, targets=distances)
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "results.png")
+
+        print(f"{'samples':>9} {'full (s)':>9} {'decimated (s)':>14} {'speedup':>8}")
+        for n in (20_000, 200_000, 2_000_000):
+            kwargs = _signals(n, rng)
+            t_full = best_of(lambda: plot_comprehensive_results(
+                **kwargs, output=path, max_points=n), repeat=3)
+            t_dec = best_of(lambda: plot_comprehensive_results(**kwargs, output=path), repeat=3)
+            print(f"{n:>9} {t_full:>9.2f} {t_dec:>14.2f} {t_full / t_dec:>7.1f}x")
+
+        kwargs = _signals(200_000, rng)
+        live = LiveRangeProfile(kwargs['echo_time'], min_interval=0.0, output=path)
+        t_update = best_of(lambda: live.update(kwargs['integrated'], kwargs['peaks']))
+        print(f"\nLive update of a 200000-sample profile: {t_update * 1e3:.1f} ms")
+
+        rd_map = rng.standard_normal((128, 20_000)) + 1j * rng.standard_normal((128, 20_000))
+        velocities = np.linspace(-37.5, 37.5, 128)
+        ranges = np.arange(20_000) * 1.5
+        t_rd_full = best_of(lambda: plot_range_doppler(rd_map, velocities, ranges, output=path,
+                                                       max_points=20_000), repeat=3)
+        t_rd = best_of(lambda: plot_range_doppler(rd_map, velocities, ranges, output=path),
+                       repeat=3)
+        print(f"Range-Doppler map 128 x 20000: full {t_rd_full:.2f} s, "
+              f"max-pooled {t_rd:.2f} s ({t_rd_full / t_rd:.1f}x)")
+
+
+if __name__ == "__main__":
+    main()
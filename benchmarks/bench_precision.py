@@ -0,0 +1,92 @@
+"""
+Single- versus double-precision processing: accuracy of the complex64
+chain against the complex128 reference, and throughput of each.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_precision
+"""
+import contextlib
+import io
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.monteCarlo import monte_carlo_point
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+
+def _radar(precision: str, **kwargs) -> RadarSimulator:
+    with contextlib.redirect_stdout(io.StringIO()):
+        return RadarSimulator(seed=0, precision=precision, **kwargs)
+
+
+def accuracy() -> None:
+    print("Accuracy: noise-free line error, and worst nearest-detection range error")
+    print(f"{'scenario':>9} {'max rel. error':>15} {'double (m)':>11} {'single (m)':>11}")
+    for name in ("simple", "dense", "extended"):
+        targets = np.array(create_target_scenario(name), dtype=float)
+        lines, range_errors = {}, {}
+        for precision in ("double", "single"):
+            radar = _radar(precision)
+            pulse, _ = radar.generate_pulse()
+            with contextlib.redirect_stdout(io.StringIO()):
+                lines[precision], _ = radar.coherent_integration(pulse, targets, noise_std=0,
+                                                                 keep_matrix=False)
+                integrated, _ = radar.coherent_integration(pulse, targets, keep_matrix=False)
+            distances = radar.detect_targets(integrated, None, len(pulse))[1]
+            range_errors[precision] = np.max(np.min(np.abs(distances[None, :] - targets[:, None]),
+                                                    axis=1))
+        rel_error = np.max(np.abs(lines["single"] - lines["double"])) / np.max(np.abs(lines["double"]))
+        print(f"{name:>9} {rel_error:>15.2e} {range_errors['double']:>11.2f} "
+              f"{range_errors['single']:>11.2f}")
+
+    print("\nMonte Carlo range RMSE at noise_std = 3e-7 (500 trials)")
+    targets = create_target_scenario("dense")
+    for precision in ("double", "single"):
+        radar = _radar(precision)
+        pulse, _ = radar.generate_pulse()
+        metrics = monte_carlo_point(radar, pulse, targets, 3e-7, n_trials=500, seed=1)
+        print(f"{precision:>9}: RMSE {metrics['range_rmse']:.3f} m, "
+              f"mean Pd {np.mean(metrics['pd']):.3f}, Pfa {metrics['pfa']:.2e}")
+
+
+def throughput() -> None:
+    targets = create_target_scenario("dense")
+    print("\nThroughput (128-pulse CPI, 20,000-sample PRI)")
+    print(f"{'stage':>28} {'double (ms)':>12} {'single (ms)':>12} {'speedup':>8}")
+    stages = {}
+    for precision in ("double", "single"):
+        radar = _radar(precision)
+        pulse, _ = radar.generate_pulse()
+        mf = radar.matched_filter_engine(pulse)
+        with contextlib.redirect_stdout(io.StringIO()):
+            _, rd_matrix = radar.coherent_integration(pulse, targets)
+        pri_samples = rd_matrix.shape[1]
+        received = rd_matrix.copy()
+
+        def cpi():
+            with contextlib.redirect_stdout(io.StringIO()):
+                radar.coherent_integration(pulse, targets)
+
+        def range_doppler():
+            radar.range_doppler_processing(rd_matrix, len(pulse))
+
+        stages.setdefault("coherent integration (CPI)", {})[precision] = best_of(cpi, repeat=3)
+        stages.setdefault("matched filter (matrix)", {})[precision] = best_of(
+            lambda: mf(received, n_samples=pri_samples), repeat=3)
+        stages.setdefault("range-Doppler + 2-D CFAR", {})[precision] = best_of(range_doppler, repeat=3)
+
+    for stage, times in stages.items():
+        print(f"{stage:>28} {times['double']*1e3:>12.1f} {times['single']*1e3:>12.1f} "
+              f"{times['double']/times['single']:>7.2f}x")
+
+
+def main() -> None:
+    accuracy()
+    throughput()
+
+
+if __name__ == "__main__":
+    main()
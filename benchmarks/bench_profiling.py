@@ -0,0 +1,61 @@
+"""
+Overhead of the stage profiler: the coherent-integration chain and a
+small-input hot path with profiling disabled, enabled, and enabled with
+tracemalloc.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_profiling
+"""
+import contextlib
+import io
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.profiling import PROFILER, profile
+from radar.radarSimulator import RadarSimulator
+from radar.signalProcessing import ca_cfar_detector, matched_filter
+
+
+def main() -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(n_pulses=64, seed=0)
+    pulse, _ = radar.generate_pulse()
+    targets = [(3000, 20), (4500, -10), (12000, 0)]
+    rng = np.random.default_rng(0)
+    short = rng.standard_normal(256) + 1j * rng.standard_normal(256)
+    reference = pulse[:32]
+
+    def chain():
+        with contextlib.redirect_stdout(io.StringIO()):
+            integrated, _ = radar.coherent_integration(pulse, targets)
+            radar.detect_targets(integrated, None, len(pulse))
+
+    def hot_path():
+        # Small inputs, so the per-call wrapper cost is not hidden by the work
+        for _ in range(100):
+            ca_cfar_detector(np.abs(matched_filter(short, reference)))
+
+    cases = {'disabled': None, 'enabled': False, 'enabled + tracemalloc': True}
+    print(f"{'mode':>22} {'chain (ms)':>11} {'hot path (ms)':>14}")
+    baseline = None
+    for mode, trace_memory in cases.items():
+        if trace_memory is None:
+            ctx = contextlib.nullcontext()
+        else:
+            ctx = profile(trace_memory=trace_memory)
+        with ctx:
+            t_chain = best_of(chain)
+            t_hot = best_of(hot_path)
+        if baseline is None:
+            baseline = (t_chain, t_hot)
+        print(f"{mode:>22} {t_chain * 1e3:>11.1f} {t_hot * 1e3:>14.2f}"
+              f"   ({t_chain / baseline[0]:.2f}x, {t_hot / baseline[1]:.2f}x)")
+
+    print("\nStages recorded in the last run:")
+    PROFILER.print_summary()
+
+
+if __name__ == "__main__":
+    main()
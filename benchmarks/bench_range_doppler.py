@@ -0,0 +1,29 @@
+"""
+Time range-Doppler map formation and 2-D CA-CFAR on a full CPI.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_range_doppler
+"""
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.signalProcessing import ca_cfar_2d, range_doppler_map
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+
+    print(f"{'pulses':>7} {'range bins':>11} {'map (ms)':>9} {'2-D CFAR (ms)':>14}")
+    for n_pulses, n_range in ((64, 20_000), (128, 20_000), (256, 20_000)):
+        rd_matrix = (rng.standard_normal((n_pulses, n_range))
+                     + 1j * rng.standard_normal((n_pulses, n_range)))
+        rd_map = range_doppler_map(rd_matrix)
+
+        t_map = best_of(lambda: range_doppler_map(rd_matrix))
+        t_cfar = best_of(lambda: ca_cfar_2d(rd_map), repeat=3)
+        print(f"{n_pulses:>7} {n_range:>11} {t_map*1e3:>9.1f} {t_cfar*1e3:>14.1f}")
+
+
+if __name__ == "__main__":
+    main()
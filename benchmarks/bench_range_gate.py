@@ -0,0 +1,96 @@
+"""
+Range-gated processing: time and peak memory of simulating, compressing
+and detecting one CPI over gates of growing width, against the full PRI
+(20000 samples at 100 MHz / 5 kHz), and overlap-save segment sizes.
+Finally checks that targets at both edges of a gate are detected by the
+1-D and range-Doppler CFAR (the exit status is 1 if any is missed).
+
+Run from the repository root:
+
+    python -m benchmarks.bench_range_gate
+"""
+import contextlib
+import io
+import sys
+import tracemalloc
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario, split_targets
+
+
+def _radar(range_gate):
+    with contextlib.redirect_stdout(io.StringIO()):
+        return RadarSimulator(seed=0, range_gate=range_gate)
+
+
+def _cpi(radar, pulse, targets):
+    with contextlib.redirect_stdout(io.StringIO()):
+        integrated, _ = radar.coherent_integration(pulse, targets)
+        _, distances = radar.detect_targets(integrated, None, len(pulse))
+    return integrated, distances
+
+
+def _peak_mb(func):
+    tracemalloc.start()
+    func()
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    return peak / 1e6
+
+
+def edge_misses() -> int:
+    """Detect the extended scenario through gates whose edges sit on targets; return the number of misses."""
+    targets = create_target_scenario("extended")
+    true_ranges, _ = split_targets(targets)
+    misses = 0
+    print(f"\n{'gate (m)':>14} {'targets in gate':<24} {'1-D CFAR':<24} range-Doppler CFAR")
+    for gate in ((2950, 6050), (3000, 6000), (0, 3000), (6000, 9000)):
+        radar = _radar(gate)
+        pulse, _ = radar.generate_pulse()
+        with contextlib.redirect_stdout(io.StringIO()):
+            integrated, rd_matrix = radar.coherent_integration(pulse, targets)
+        _, distances = radar.detect_targets(integrated, None, len(pulse))
+        _, _, rd_distances, _ = radar.range_doppler_processing(rd_matrix, len(pulse))
+        expected = true_ranges[radar.in_gate(true_ranges)]
+        for found in (distances, rd_distances):
+            misses += sum(np.min(np.abs(found - r), initial=np.inf) > radar.range_resolution
+                          for r in expected)
+        print(f"{gate[0]:>6}-{gate[1]:<7} {str(expected):<24} {str(distances):<24} {rd_distances}")
+    return misses
+
+
+def main() -> None:
+    targets = create_target_scenario("dense")
+    print(f"Targets (m): {targets}\n")
+    print(f"{'gate (m)':>14} {'samples':>8} {'time (ms)':>10} {'peak MB':>8}  detections")
+    for gate in (None, (500, 10000), (900, 5000), (3000, 5000), (3400, 3700)):
+        radar = _radar(gate)
+        pulse, _ = radar.generate_pulse()
+        integrated, distances = _cpi(radar, pulse, targets)
+        t = best_of(lambda: _cpi(radar, pulse, targets), repeat=3)
+        peak = _peak_mb(lambda: _cpi(radar, pulse, targets))
+        label = "full PRI" if gate is None else f"{gate[0]}-{gate[1]}"
+        print(f"{label:>14} {len(integrated):>8} {t * 1e3:>10.1f} {peak:>8.1f}  {distances}")
+
+    radar = _radar((900, 10000))
+    pulse, _ = radar.generate_pulse()
+    mf = radar.matched_filter_engine(pulse)
+    first, n_lags = radar.gate_lags(len(pulse))
+    records = radar._simulate_records(pulse, targets, radar.n_pulses, 3e-7)
+    print(f"\nOverlap-save of {radar.n_pulses} x {records.shape[1]}-sample gated spans:")
+    print(f"{'nfft':>8} {'time (ms)':>10}")
+    for nfft in (None, 2048, 4096, 8192, 16384):
+        t = best_of(lambda: mf.overlap_save(records, nfft), repeat=3)
+        print(f"{'one' if nfft is None else nfft:>8} {t * 1e3:>10.1f}")
+
+    misses = edge_misses()
+    if misses:
+        print(f"\n{misses} target(s) at the gate edges missed")
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""
+Sub-sample range refinement: accuracy of each interpolator on echoes at
+fractional-sample delays, and cost against upsampling the whole record.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_refinement
+"""
+import contextlib
+import io
+
+import numpy as np
+from scipy import fft as sp_fft
+
+from benchmarks.common import best_of
+from radar.radarSimulator import RadarSimulator
+from radar.signalProcessing import refine_peaks
+from radar.targets import compressed_echoes
+
+METHODS = ('parabolic', 'sinc', 'fft')
+UPSAMPLE = 16
+
+
+def main() -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(seed=0)
+    pulse, _ = radar.generate_pulse()
+    mf = radar.matched_filter_engine(pulse)
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+    rng = np.random.default_rng(0)
+
+    # One isolated echo per line at a random fractional delay
+    ranges = rng.uniform(1000, 20000, 100)
+    lines = compressed_echoes(pulse, radar.sample_rate, [ranges[0]], pri_samples, matched_filter=mf)
+    errors = {name: [] for name in ('integer',) + METHODS}
+    for r in ranges:
+        line = compressed_echoes(pulse, radar.sample_rate, [r], pri_samples, matched_filter=mf)[0]
+        true_peak = 2 * r / radar.c * radar.sample_rate + len(pulse) // 2
+        peak = np.array([np.argmax(np.abs(line))])
+        errors['integer'].append(peak[0] - true_peak)
+        for method in METHODS:
+            errors[method].append(refine_peaks(line, peak, method)[0] - true_peak)
+
+    metres_per_sample = radar.c / (2 * radar.sample_rate)
+    print("Noise-free range RMSE")
+    for name, err in errors.items():
+        print(f"{name:>10}: {np.sqrt(np.mean(np.square(err))) * metres_per_sample:.5f} m")
+
+    print(f"\nCost on one {pri_samples}-sample line")
+    print(f"{'detections':>11} " + " ".join(f"{m + ' (µs)':>16}" for m in METHODS)
+          + f" {'upsample x' + str(UPSAMPLE) + ' (µs)':>19}")
+    line = lines[0]
+    full = best_of(lambda: sp_fft.ifft(sp_fft.fft(line), pri_samples * UPSAMPLE), repeat=3)
+    for n_peaks in (1, 10, 100, 1000):
+        peaks = rng.integers(100, pri_samples - 100, n_peaks)
+        times = [best_of(lambda: refine_peaks(line, peaks, method)) for method in METHODS]
+        print(f"{n_peaks:>11} " + " ".join(f"{t*1e6:>16.0f}" for t in times) + f" {full*1e6:>19.0f}")
+
+
+if __name__ == "__main__":
+    main()
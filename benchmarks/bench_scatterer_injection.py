@@ -0,0 +1,50 @@
+"""
+Echo injection time against scatterer count: per-target loop vs delay
+histogram convolved once with the pulse.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scatterer_injection
+"""
+import contextlib
+import io
+
+from benchmarks.common import best_of
+from radar.radarSimulator import RadarSimulator
+from radar.scatterers import generate_scenario
+from radar.targets import simulate_pulse_matrix
+
+LOOP_MAX_SCATTERERS = 10_000   # the loop is too slow to time beyond this
+
+
+def main() -> None:
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(seed=0)
+    pulse, _ = radar.generate_pulse()
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+    n_pulses = 16
+
+    for kind, label in (("target_field", "stationary field"), ("ground_clutter", "moving clutter")):
+        print(f"\n{label} ({kind}), {n_pulses} pulses x {pri_samples} samples")
+        print(f"{'scatterers':>11} {'loop (ms)':>10} {'histogram (ms)':>15} {'speedup':>8}")
+        for n_scatterers in (100, 1_000, 10_000, 100_000, 1_000_000):
+            overrides = {'velocity_std': 0.0} if kind == "target_field" else {}
+            scatterers = generate_scenario(kind, n_scatterers=n_scatterers, seed=1, **overrides)
+
+            def inject(method):
+                return lambda: simulate_pulse_matrix(pulse, radar.sample_rate, scatterers, n_pulses,
+                                                     max_samples=pri_samples, pri=radar.pri,
+                                                     carrier_freq=radar.carrier_freq,
+                                                     injection=method)
+
+            histogram = best_of(inject('histogram'), repeat=3)
+            if n_scatterers <= LOOP_MAX_SCATTERERS:
+                loop = best_of(inject('loop'), repeat=1)
+                print(f"{n_scatterers:>11} {loop*1e3:>10.1f} {histogram*1e3:>15.1f} "
+                      f"{loop/histogram:>7.1f}x")
+            else:
+                print(f"{n_scatterers:>11} {'-':>10} {histogram*1e3:>15.1f} {'-':>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,69 @@
+"""
+Bulk truth-to-detection scoring: score_trials on millions of Monte Carlo
+trials at once, against a per-trial Python loop with all-pairs matching.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_scoring
+"""
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.scoring import score_trials, summarize_trials, trial_index_from_offsets
+from radar.targets import create_target_scenario
+
+GATE = 7.5
+
+
+def _trials(true_ranges, n_trials, rng, pd=0.9, false_alarm_rate=0.5):
+    """Flattened detections: noisy hits with probability pd plus Poisson false alarms."""
+    seen = rng.random((n_trials, len(true_ranges))) < pd
+    trial, target = np.nonzero(seen)
+    hits = true_ranges[target] + 0.75 * rng.standard_normal(len(target))
+    n_false = rng.poisson(false_alarm_rate, n_trials)
+    false_trial = np.repeat(np.arange(n_trials), n_false)
+    false = rng.uniform(0, 30000, len(false_trial))
+    trial_index = np.concatenate([trial, false_trial])
+    detections = np.concatenate([hits, false])
+    order = np.argsort(trial_index, kind='stable')
+    counts = np.bincount(trial_index, minlength=n_trials)
+    offsets = np.concatenate([[0], np.cumsum(counts)])
+    return detections[order], offsets
+
+
+def _loop(true_ranges, detections, offsets):
+    """Reference: per-trial nearest matching with an all-pairs distance matrix."""
+    hits = np.zeros(len(true_ranges))
+    for i in range(len(offsets) - 1):
+        trial = detections[offsets[i]:offsets[i + 1]]
+        if len(trial):
+            distance = np.abs(np.subtract.outer(true_ranges, trial))
+            hits += distance.min(axis=1) <= GATE
+    return hits
+
+
+def main() -> None:
+    rng = np.random.default_rng(0)
+    true_ranges = np.array(create_target_scenario("dense"), dtype=float)
+
+    print(f"{'trials':>9} {'detections':>11} {'bulk (s)':>9} {'trials/s':>11} {'loop (s)':>9}")
+    for n_trials in (10_000, 100_000, 1_000_000):
+        detections, offsets = _trials(true_ranges, n_trials, rng)
+        trial_index = trial_index_from_offsets(offsets)
+        score = lambda: score_trials(true_ranges, detections, trial_index, n_trials, gate=GATE)
+        t_bulk = best_of(score, repeat=3)
+        if n_trials <= 100_000:
+            t_loop = best_of(lambda: _loop(true_ranges, detections, offsets), repeat=1)
+            loop = f"{t_loop:>9.2f}"
+        else:
+            loop = f"{'-':>9}"
+        print(f"{n_trials:>9} {len(detections):>11} {t_bulk:>9.3f} {n_trials / t_bulk:>11.0f} {loop}")
+
+    summary = summarize_trials(score())
+    print(f"\nPd per target: {np.round(summary['pd'], 3)}")
+    print(f"False alarms per trial: {summary['false_alarms_per_trial']:.3f}, "
+          f"range RMSE: {summary['range_rmse']:.3f} m")
+
+
+if __name__ == "__main__":
+    main()
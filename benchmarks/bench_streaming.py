@@ -0,0 +1,49 @@
+"""
+Streaming throughput against the real-time pulse rate, and peak memory
+for growing dwell lengths.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_streaming
+"""
+import contextlib
+import io
+import itertools
+import time
+import tracemalloc
+
+from radar.radarSimulator import RadarSimulator
+from radar.targets import create_target_scenario
+
+
+def main() -> None:
+    targets = create_target_scenario("dense")
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(seed=0)
+    pulse, _ = radar.generate_pulse()
+
+    print(f"Real-time requirement: {radar.prf:.0f} pulses/s\n")
+    print(f"{'pulses':>7} {'sim+process (pulses/s)':>23} {'process only (pulses/s)':>24} "
+          f"{'peak (MB)':>10} {'events':>7}")
+    for n_pulses in (1_000, 5_000, 20_000):
+        tracemalloc.start()
+        start = time.perf_counter()
+        events = list(radar.process_stream(radar.stream_range_lines(pulse, targets, n_pulses=n_pulses),
+                                           len(pulse)))
+        elapsed = time.perf_counter() - start
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+
+        # Processing alone: integrate/detect externally supplied lines
+        line = next(radar.stream_range_lines(pulse, targets, n_pulses=1))
+        start = time.perf_counter()
+        for _ in radar.process_stream(itertools.repeat(line, n_pulses), len(pulse)):
+            pass
+        process_only = time.perf_counter() - start
+
+        print(f"{n_pulses:>7} {n_pulses/elapsed:>23.0f} {n_pulses/process_only:>24.0f} "
+              f"{peak/2**20:>10.1f} {len(events):>7}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Per-CPI latency and accuracy of RangeTracker with thousands of
+simultaneous targets, and sorted-index gating against all-pairs gating.
+
+Detections are synthesized directly (true range and velocity plus noise,
+with missed detections and uniform false alarms), so only the tracker is
+timed. The budget is one CPI: n_pulses × PRI = 128 × 200 µs = 25.6 ms.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_tracking
+"""
+import time
+
+import numpy as np
+
+from benchmarks.common import best_of
+from radar.tracking import RangeTracker, gate_pairs
+
+CPI = 128 / 5e3
+N_CPIS = 20
+PD = 0.9
+FALSE_ALARMS = 200
+RANGE_STD = 0.75
+VELOCITY_STD = 0.6
+
+
+def _scene(n_targets, rng):
+    ranges = rng.uniform(1000, 29000, n_targets)
+    velocities = rng.uniform(-30, 30, n_targets)
+    return ranges, velocities
+
+
+def _detections(ranges, velocities, rng):
+    seen = rng.random(len(ranges)) < PD
+    d = ranges[seen] + RANGE_STD * rng.standard_normal(np.count_nonzero(seen))
+    v = velocities[seen] + VELOCITY_STD * rng.standard_normal(np.count_nonzero(seen))
+    d = np.concatenate([d, rng.uniform(1000, 29000, FALSE_ALARMS)])
+    v = np.concatenate([v, rng.uniform(-37.5, 37.5, FALSE_ALARMS)])
+    return d, v
+
+
+def _all_pairs(predicted, detections, gate):
+    det, trk = np.nonzero(np.abs(np.subtract.outer(detections, predicted)) <= gate)
+    return det, trk
+
+
+def main() -> None:
+    print(f"CPI budget: {CPI * 1e3:.1f} ms\n")
+    print(f"{'targets':>8} {'method':>10} {'mean (ms)':>10} {'max (ms)':>9} "
+          f"{'confirmed':>10} {'rmse (m)':>9}")
+    for n_targets in (100, 1000, 5000):
+        for method in ('alpha-beta', 'kalman'):
+            rng = np.random.default_rng(0)
+            ranges, velocities = _scene(n_targets, rng)
+            tracker = RangeTracker(dt=CPI, method=method, range_std=RANGE_STD,
+                                   velocity_std=VELOCITY_STD, gate=5.0, velocity_gate=3.0)
+            latencies = []
+            for k in range(N_CPIS):
+                truth = ranges - velocities * k * CPI
+                distances, vels = _detections(truth, velocities, rng)
+                start = time.perf_counter()
+                tracks = tracker.update(distances, vels)
+                latencies.append(time.perf_counter() - start)
+
+            # Accuracy of confirmed tracks against the nearest true target
+            truth = np.sort(ranges - velocities * (N_CPIS - 1) * CPI)
+            idx = np.clip(np.searchsorted(truth, tracks['ranges']), 1, len(truth) - 1)
+            nearest = np.where(np.abs(truth[idx] - tracks['ranges']) < np.abs(truth[idx - 1] - tracks['ranges']),
+                               truth[idx], truth[idx - 1])
+            rmse = np.sqrt(np.mean((tracks['ranges'] - nearest)**2))
+            print(f"{n_targets:>8} {method:>10} {np.mean(latencies) * 1e3:>10.2f} "
+                  f"{np.max(latencies) * 1e3:>9.2f} {len(tracks['ids']):>10} {rmse:>9.3f}")
+
+    print(f"\n{'tracks':>8} {'sorted gate (ms)':>17} {'all pairs (ms)':>15}")
+    for n_tracks in (1000, 5000, 20000):
+        rng = np.random.default_rng(1)
+        predicted = rng.uniform(1000, 29000, n_tracks)
+        detections = predicted + rng.standard_normal(n_tracks)
+        t_sorted = best_of(lambda: gate_pairs(predicted, detections, 5.0))
+        if n_tracks <= 5000:   # the all-pairs matrix is n² floats
+            t_pairs = best_of(lambda: _all_pairs(predicted, detections, 5.0), repeat=3)
+            all_pairs = f"{t_pairs * 1e3:>15.1f}"
+        else:
+            all_pairs = f"{'(skipped)':>15}"
+        print(f"{n_tracks:>8} {t_sorted * 1e3:>17.2f} {all_pairs}")
+
+
+if __name__ == "__main__":
+    main()
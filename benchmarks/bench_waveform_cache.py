@@ -0,0 +1,49 @@
+"""
+Per-run waveform setup cost (pulse generation + reference spectrum) in a
+scenario sweep with fixed waveform parameters, with and without the cache.
+
+Run from the repository root:
+
+    python -m benchmarks.bench_waveform_cache
+"""
+import contextlib
+import io
+
+from benchmarks.common import best_of
+from radar.radarSimulator import RadarSimulator
+from radar.signalProcessing import MatchedFilter
+from radar.simulator import generate_lfm_pulse
+from radar.waveformCache import WaveformCache
+
+N_RUNS = 200
+
+
+def main() -> None:
+    cache = WaveformCache()
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(waveform_cache=cache)
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+
+    def uncached():
+        for _ in range(N_RUNS):
+            pulse, _ = generate_lfm_pulse(start_freq=-radar.bandwidth/2, bandwidth=radar.bandwidth,
+                                          duration=radar.pulse_duration,
+                                          sample_rate=radar.sample_rate)
+            MatchedFilter(pulse).reference(pri_samples)
+
+    def cached():
+        for _ in range(N_RUNS):
+            pulse, _ = radar.generate_pulse()
+            radar.matched_filter_engine(pulse).reference(pri_samples)
+
+    t_uncached = best_of(uncached, repeat=3) / N_RUNS
+    cache.clear()
+    t_cached = best_of(cached, repeat=3) / N_RUNS
+
+    print(f"uncached setup per run: {t_uncached*1e6:8.1f} µs")
+    print(f"cached setup per run  : {t_cached*1e6:8.1f} µs  ({t_uncached/t_cached:.0f}x)")
+    print(f"cache stats           : {cache.stats()}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,27 @@
+import time
+from typing import Callable, List
+
+
+def round_times(func: Callable[[], object], repeat: int = 5, number: int = 1) -> List[float]:
+    """
+    Time ``func`` and return the per-call wall time of each round in seconds.
+
+    Each of the ``repeat`` rounds calls ``func`` ``number`` times.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(number):
+            func()
+        times.append((time.perf_counter() - start) / number)
+    return times
+
+
+def best_of(func: Callable[[], object], repeat: int = 5, number: int = 1) -> float:
+    """
+    Time ``func`` and return the best per-call wall time in seconds.
+
+    The best of ``repeat`` rounds is reported because it is the least
+    affected by scheduler noise; each round calls ``func`` ``number`` times.
+    """
+    return min(round_times(func, repeat, number))
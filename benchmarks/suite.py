@@ -0,0 +1,269 @@
+"""
+Reproducible benchmark suite for the radar pipeline.
+
+Times ``generate_lfm_pulse``, ``simulate_echoes``, ``matched_filter``,
+``ca_cfar_detector`` and ``RadarSimulator.coherent_integration`` over a
+grid of pulse lengths, PRI lengths, pulse counts and target counts. All
+inputs are seeded. Results are written as JSON together with environment
+metadata, and can be compared against a stored baseline: any case whose
+best time grew by more than ``--threshold`` is reported as a regression
+and the exit status is 1. Only the ``radar`` package is imported, so the
+suite runs headless.
+
+Run from the repository root:
+
+    python -m benchmarks.suite --output results.json
+    python -m benchmarks.suite --quick --baseline baseline.json --threshold 0.2
+
+To store a baseline, keep the ``--output`` of a run on a quiet machine.
+"""
+import argparse
+import contextlib
+import datetime
+import io
+import json
+import os
+import platform
+import statistics
+import subprocess
+import sys
+from typing import Callable, Dict, Iterator, Optional, Tuple
+
+import numpy as np
+import scipy
+
+from benchmarks.common import round_times
+from radar.radarSimulator import RadarSimulator
+from radar.signalProcessing import ca_cfar_detector, matched_filter
+from radar.simulator import generate_lfm_pulse
+from radar.targets import simulate_echoes
+
+SAMPLE_RATE = 100e6
+BANDWIDTH = 20e6
+NOISE_STD = 3e-7
+SEED = 0
+
+GRID = {
+    'pulse_us': (1, 10, 50),
+    'pri_us': (50, 200, 1000),
+    'n_pulses': (16, 128),
+    'n_targets': (1, 10, 100),
+}
+
+QUICK_GRID = {
+    'pulse_us': (1, 10),
+    'pri_us': (50, 200),
+    'n_pulses': (16,),
+    'n_targets': (1, 10),
+}
+
+# Pulse length used by the coherent-integration cases
+INTEGRATION_PULSE_US = 10
+
+
+def _case_id(stage: str, params: Dict[str, int]) -> str:
+    return f"{stage}[{','.join(f'{k}={v}' for k, v in params.items())}]"
+
+
+def _target_ranges(n_targets: int, pri_us: float, pulse_us: float) -> np.ndarray:
+    """Seeded target ranges whose echoes end inside the PRI."""
+    c = 3e8
+    max_range = c * (pri_us - pulse_us) * 1e-6 / 2
+    rng = np.random.default_rng(SEED)
+    return np.sort(rng.uniform(0.1 * max_range, 0.9 * max_range, n_targets))
+
+
+def _pulse(pulse_us: float) -> np.ndarray:
+    pulse, _ = generate_lfm_pulse(start_freq=-BANDWIDTH / 2, bandwidth=BANDWIDTH,
+                                  duration=pulse_us * 1e-6, sample_rate=SAMPLE_RATE)
+    return pulse
+
+
+def _record(pulse: np.ndarray, pri_us: float, n_targets: int, pulse_us: float) -> np.ndarray:
+    """One seeded received PRI with ``n_targets`` echoes."""
+    received, _ = simulate_echoes(pulse, SAMPLE_RATE, _target_ranges(n_targets, pri_us, pulse_us),
+                                  noise_std=NOISE_STD, rng=np.random.default_rng(SEED))
+    out = np.zeros(int(round(pri_us * 1e-6 * SAMPLE_RATE)), dtype=complex)
+    n = min(len(out), len(received))
+    out[:n] = received[:n]
+    return out
+
+
+def cases(grid: Dict[str, Tuple[int, ...]]) -> Iterator[Tuple[str, str, Dict[str, int], Callable[[], object]]]:
+    """Yield (case id, stage, parameters, timed callable) for every grid point."""
+    for pulse_us in grid['pulse_us']:
+        params = {'pulse_us': pulse_us}
+        yield (_case_id('generate_lfm_pulse', params), 'generate_lfm_pulse', params,
+               lambda pulse_us=pulse_us: _pulse(pulse_us))
+
+    for pulse_us in grid['pulse_us']:
+        pulse = _pulse(pulse_us)
+        for pri_us in grid['pri_us']:
+            if pulse_us >= pri_us:
+                continue
+            for n_targets in grid['n_targets']:
+                params = {'pulse_us': pulse_us, 'pri_us': pri_us, 'n_targets': n_targets}
+                ranges = _target_ranges(n_targets, pri_us, pulse_us)
+                yield (_case_id('simulate_echoes', params), 'simulate_echoes', params,
+                       lambda pulse=pulse, ranges=ranges: simulate_echoes(
+                           pulse, SAMPLE_RATE, ranges, noise_std=NOISE_STD,
+                           rng=np.random.default_rng(SEED)))
+
+            params = {'pulse_us': pulse_us, 'pri_us': pri_us}
+            record = _record(pulse, pri_us, 1, pulse_us)
+            yield (_case_id('matched_filter', params), 'matched_filter', params,
+                   lambda record=record, pulse=pulse: matched_filter(record, pulse))
+
+    pulse_us = INTEGRATION_PULSE_US
+    pulse = _pulse(pulse_us)
+    for pri_us in grid['pri_us']:
+        if pulse_us >= pri_us:
+            continue
+        for n_targets in grid['n_targets']:
+            params = {'pri_us': pri_us, 'n_targets': n_targets}
+            power = np.abs(matched_filter(_record(pulse, pri_us, n_targets, pulse_us), pulse))
+            yield (_case_id('ca_cfar_detector', params), 'ca_cfar_detector', params,
+                   lambda power=power: ca_cfar_detector(power))
+
+    for pri_us in grid['pri_us']:
+        if pulse_us >= pri_us:
+            continue
+        for n_pulses in grid['n_pulses']:
+            for n_targets in grid['n_targets']:
+                params = {'pri_us': pri_us, 'n_pulses': n_pulses, 'n_targets': n_targets}
+                with contextlib.redirect_stdout(io.StringIO()):
+                    radar = RadarSimulator(sample_rate=SAMPLE_RATE, bandwidth=BANDWIDTH,
+                                           pulse_duration=pulse_us * 1e-6, n_pulses=n_pulses,
+                                           prf=1e6 / pri_us, seed=SEED)
+                radar_pulse, _ = radar.generate_pulse()
+                ranges = _target_ranges(n_targets, pri_us, pulse_us)
+
+                def integrate(radar=radar, radar_pulse=radar_pulse, ranges=ranges):
+                    with contextlib.redirect_stdout(io.StringIO()):
+                        radar.coherent_integration(radar_pulse, ranges, noise_std=NOISE_STD)
+                yield (_case_id('coherent_integration', params), 'coherent_integration',
+                       params, integrate)
+
+
+def _git_revision() -> Optional[Dict[str, object]]:
+    try:
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        commit = subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=root, capture_output=True,
+                                text=True, check=True).stdout.strip()
+        status = subprocess.run(['git', 'status', '--porcelain', '--untracked-files=no'],
+                                cwd=root, capture_output=True, text=True, check=True).stdout
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return {'commit': commit, 'dirty': bool(status.strip())}
+
+
+def environment() -> Dict[str, object]:
+    """Metadata needed to judge whether two result files are comparable."""
+    return {
+        'timestamp': datetime.datetime.now(datetime.timezone.utc).isoformat(timespec='seconds'),
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'numpy': np.__version__,
+        'scipy': scipy.__version__,
+        'platform': platform.platform(),
+        'machine': platform.machine(),
+        'processor': platform.processor(),
+        'cpu_count': os.cpu_count(),
+        'git': _git_revision(),
+    }
+
+
+def run(grid: Dict[str, Tuple[int, ...]], repeat: int = 5,
+        only: Optional[str] = None) -> Dict[str, Dict[str, object]]:
+    """Time every case of ``grid`` and return {case id: result}."""
+    results = {}
+    for case, stage, params, func in cases(grid):
+        if only is not None and stage != only:
+            continue
+        func()   # warm caches, FFT plans and allocations
+        times = round_times(func, repeat=repeat)
+        results[case] = {
+            'stage': stage,
+            'params': params,
+            'best_s': min(times),
+            'median_s': statistics.median(times),
+            'times_s': times,
+        }
+        print(f"{case:<60} {min(times) * 1e3:>10.3f} ms")
+    return results
+
+
+def compare(results: Dict[str, Dict[str, object]], baseline: Dict[str, Dict[str, object]],
+            threshold: float) -> Dict[str, float]:
+    """
+    Compare best times against a baseline.
+
+    Returns {case id: current/baseline ratio} for the cases slower than
+    ``1 + threshold`` times their baseline.
+    """
+    regressions = {}
+    print(f"\n{'case':<60} {'baseline (ms)':>14} {'now (ms)':>10} {'ratio':>7}")
+    for case, result in results.items():
+        if case not in baseline:
+            print(f"{case:<60} {'-':>14} {result['best_s'] * 1e3:>10.3f}     new")
+            continue
+        ratio = result['best_s'] / baseline[case]['best_s']
+        flag = '  REGRESSION' if ratio > 1 + threshold else ''
+        print(f"{case:<60} {baseline[case]['best_s'] * 1e3:>14.3f} "
+              f"{result['best_s'] * 1e3:>10.3f} {ratio:>6.2f}x{flag}")
+        if flag:
+            regressions[case] = ratio
+    return regressions
+
+
+def _parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Radar pipeline benchmark suite")
+    parser.add_argument("--output", metavar="PATH", default=None,
+                        help="Write the results as JSON to PATH")
+    parser.add_argument("--baseline", metavar="PATH", default=None,
+                        help="Compare against a previous --output file")
+    parser.add_argument("--threshold", type=float, default=0.25,
+                        help="Relative slowdown reported as a regression (default 0.25)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="Timed rounds per case (default 5)")
+    parser.add_argument("--quick", action="store_true",
+                        help="Run the reduced grid")
+    parser.add_argument("--stage", default=None,
+                        choices=['generate_lfm_pulse', 'simulate_echoes', 'matched_filter',
+                                 'ca_cfar_detector', 'coherent_integration'],
+                        help="Only run the cases of one stage")
+    return parser.parse_args()
+
+
+def main() -> None:
+    args = _parse_args()
+    grid = QUICK_GRID if args.quick else GRID
+
+    report = {
+        'environment': environment(),
+        'config': {'grid': grid, 'repeat': args.repeat, 'sample_rate': SAMPLE_RATE,
+                   'bandwidth': BANDWIDTH, 'noise_std': NOISE_STD, 'seed': SEED},
+        'results': run(grid, repeat=args.repeat, only=args.stage),
+    }
+
+    if args.output:
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=2)
+        print(f"\nResults written to {args.output}")
+
+    if args.baseline:
+        with open(args.baseline) as f:
+            stored = json.load(f)
+        env, stored_env = report['environment'], stored.get('environment', {})
+        for key in ('python', 'numpy', 'scipy', 'machine', 'cpu_count'):
+            if env.get(key) != stored_env.get(key):
+                print(f"Warning: baseline {key} {stored_env.get(key)!r} differs from {env.get(key)!r}")
+        regressions = compare(report['results'], stored['results'], args.threshold)
+        if regressions:
+            print(f"\n{len(regressions)} case(s) slower than {1 + args.threshold:.2f}x baseline")
+            sys.exit(1)
+        print("\nNo regressions")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,10 +1,7 @@
 import argparse
 
-from radar.targets import create_target_scenario
-from visualizations.plotResults import (
-    plot_complex_pulse,
-    plot_comprehensive_results,
-)
+from radar.targets import create_target_scenario, split_targets
+from radar.profiling import PROFILER
 from radar.radarSimulator import RadarSimulator
 
 
@@ -18,27 +15,171 @@ def _parse_args() -> argparse.Namespace:
     parser.add_argument(
         "-s",
         "--scenario",
-        choices=["simple", "dense", "extended"],
+        choices=["simple", "dense", "extended", "moving"],
         default="extended",
         help="Target distribution to simulate",
     )
+    parser.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for coherent integration (1 = in-process batch)",
+    )
+    parser.add_argument(
+        "--seed",
+        type=int,
+        default=None,
+        help="Seed for the noise generator (reproducible runs)",
+    )
+    parser.add_argument(
+        "--precision",
+        choices=["double", "single"],
+        default="double",
+        help="Sample precision of the whole chain (single = complex64)",
+    )
+    parser.add_argument(
+        "--synthesis",
+        choices=["time", "frequency"],
+        default="time",
+        help="Echo synthesis: time-domain records, or compressed lines with "
+             "fractional-sample delays (in-process only)",
+    )
+    parser.add_argument(
+        "--range-gate",
+        nargs=2,
+        type=float,
+        metavar=("MIN_M", "MAX_M"),
+        default=None,
+        help="Simulate, compress and detect only between these ranges (in-process only)",
+    )
+    parser.add_argument(
+        "--mti",
+        choices=["2-pulse", "3-pulse"],
+        default=None,
+        help="Cancel stationary clutter across pulses before integration "
+             "(in-process only; the profile is then a non-coherent sum)",
+    )
+    parser.add_argument(
+        "--record",
+        metavar="PATH",
+        default=None,
+        help="Write the raw received I/Q pulses to PATH (runs in-process)",
+    )
+    parser.add_argument(
+        "--profile",
+        metavar="PATH",
+        default=None,
+        help="Time every processing stage and write the report to PATH "
+             "(CSV if it ends in .csv, JSON otherwise)",
+    )
+    parser.add_argument(
+        "--track",
+        metavar="N_CPIS",
+        type=int,
+        default=0,
+        help="Track the targets over N_CPIS consecutive CPIs and print the confirmed tracks",
+    )
     parser.add_argument(
         "--show-pulse",
         action="store_true",
         help="Plot the transmitted LFM chirp",
     )
-    return parser.parse_args()
+    parser.add_argument(
+        "--plot-file",
+        metavar="PATH",
+        default=None,
+        help="Render the results figure to an image file instead of a window",
+    )
+
+    subparsers = parser.add_subparsers(dest="command")
+    batch = subparsers.add_parser(
+        "batch",
+        help="Run a headless sweep of scenarios without plotting",
+        description="Run every scenario × noise level × pulse count × CFAR "
+                    "setting combination in parallel and save detections, "
+                    "errors and timings. Flags override the SPEC file.",
+    )
+    batch.add_argument(
+        "spec",
+        nargs="?",
+        default=None,
+        help="JSON sweep specification (see radar.batch.DEFAULT_SWEEP)",
+    )
+    batch.add_argument(
+        "-o",
+        "--output",
+        default="batch_results.npz",
+        help="Results file: .npz, or CSV for any other extension",
+    )
+    batch.add_argument(
+        "--scenarios",
+        nargs="+",
+        choices=["simple", "dense", "extended", "moving"],
+        default=None,
+    )
+    batch.add_argument("--noise-std", nargs="+", type=float, default=None)
+    batch.add_argument("--n-pulses", nargs="+", type=int, default=None)
+    batch.add_argument(
+        "--pfa",
+        nargs="+",
+        type=float,
+        default=None,
+        help="CA-CFAR false-alarm rates (other CFAR settings need a SPEC file)",
+    )
+    batch.add_argument(
+        "-w",
+        "--workers",
+        type=int,
+        default=None,
+        help="Worker processes (default: all cores)",
+    )
+    batch.add_argument("--seed", type=int, default=None)
+    args = parser.parse_args()
+    if args.command == "batch":
+        return args
+    if args.record and args.synthesis != "time":
+        parser.error("--record needs --synthesis time")
+    return args
 
 
 # ----------------------------------------------------------------------
 # Main simulation driver
 # ----------------------------------------------------------------------
+def run_batch(args: argparse.Namespace) -> None:
+    from radar.batch import expand_sweep, load_sweep, print_results, run_sweep, write_results
+
+    cfar = None
+    if args.pfa is not None:
+        cfar = [{"num_train": 35, "num_guard": 5, "pfa": pfa, "peak_guard": 1} for pfa in args.pfa]
+    spec = load_sweep(
+        args.spec,
+        scenarios=args.scenarios,
+        noise_std=args.noise_std,
+        n_pulses=args.n_pulses,
+        cfar=cfar,
+        seed=args.seed,
+    )
+    cases = expand_sweep(spec)
+    print(f"Running {len(cases)} cases...")
+    results = run_sweep(cases, n_workers=args.workers)
+    print_results(results)
+    write_results(results, args.output)
+    print(f"Results written to {args.output}")
+
+
 def main() -> None:
     args = _parse_args()
+    if args.command == "batch":
+        run_batch(args)
+        return
 
     print("RADAR SIGNAL PROCESSING SIMULATOR")
     print("=" * 50)
 
+    if args.profile:
+        PROFILER.enable()
+
     # ------------------------------------------------------------------
     # 1. Instantiate simulator
     # ------------------------------------------------------------------
@@ -48,14 +189,20 @@ def main() -> None:
         pulse_duration=10e-6, # 10 μs
         n_pulses=128,
         prf=5e3, # 5 KHz
+        seed=args.seed,
+        precision=args.precision,
+        range_gate=args.range_gate,
     )
 
     # ------------------------------------------------------------------
     # 2. Create targets according to the chosen scenario
     # ------------------------------------------------------------------
     targets = create_target_scenario(args.scenario)
+    target_ranges, target_velocities = split_targets(targets)
     print(f"\nTarget Scenario: {args.scenario!r}")
-    print(f"Simulating {len(targets)} targets at ranges: {targets} m")
+    print(f"Simulating {len(targets)} targets at ranges: {target_ranges.tolist()} m")
+    if target_velocities.any():
+        print(f"Radial velocities: {target_velocities.tolist()} m/s")
 
     # ------------------------------------------------------------------
     # 3. Generate one transmit pulse
@@ -63,6 +210,8 @@ def main() -> None:
     pulse, t_pulse = radar.generate_pulse(window="hanning")
 
     if args.show_pulse:
+        from visualizations.plotResults import plot_complex_pulse
+
         plot_complex_pulse(
             pulse=pulse,
             t=t_pulse,
@@ -80,17 +229,59 @@ def main() -> None:
     # ------------------------------------------------------------------
     # 5. Coherently integrate many pulses
     # ------------------------------------------------------------------
-    integrated, _ = radar.coherent_integration(pulse, targets, noise_std=3e-7)
+    if args.record:
+        with radar.open_recording(args.record) as recorder:
+            integrated, rd_matrix = radar.coherent_integration(
+                pulse, targets, noise_std=3e-7, recorder=recorder, mti=args.mti
+            )
+        print(f"Raw I/Q ({recorder.n_records} pulses) written to {args.record}")
+    elif (args.workers > 1 and args.synthesis == "time" and args.mti is None
+          and args.range_gate is None):
+        integrated, rd_matrix = radar.parallel_integration(
+            pulse, targets, noise_std=3e-7, n_workers=args.workers
+        )
+    else:
+        integrated, rd_matrix = radar.coherent_integration(
+            pulse, targets, noise_std=3e-7, synthesis=args.synthesis, mti=args.mti
+        )
 
     # ------------------------------------------------------------------
     # 6. CA‑CFAR detection and performance analysis
     # ------------------------------------------------------------------
     peaks, distances = radar.detect_targets(integrated, echo_time, len(pulse))
-    radar.analyze_performance(targets, distances)
+    _, refined_distances = radar.detect_targets(integrated, echo_time, len(pulse), refine="sinc")
+    radar.analyze_performance(target_ranges, distances, refined_distances)
+
+    # ------------------------------------------------------------------
+    # 7. Range-Doppler processing
+    # ------------------------------------------------------------------
+    _, _, rd_distances, rd_velocities = radar.range_doppler_processing(
+        rd_matrix, len(pulse)
+    )
+    print("\nRange-Doppler detections (range m, velocity m/s):")
+    for distance, velocity in zip(rd_distances, rd_velocities):
+        print(f"  {distance:8.1f}  {velocity:+6.1f}")
+
+    if args.track:
+        tracker, _ = radar.track_targets(pulse, targets, args.track, noise_std=3e-7)
+        confirmed = tracker.tracks()
+        print(f"\nConfirmed tracks after {args.track} CPIs (id, range m, velocity m/s, hits):")
+        for track_id, distance, velocity, hits in zip(
+            confirmed["ids"], confirmed["ranges"], confirmed["velocities"], confirmed["hits"]
+        ):
+            print(f"  {track_id:4d}  {distance:8.1f}  {velocity:+6.1f}  {hits:3d}")
+
+    if args.profile:
+        PROFILER.disable()
+        PROFILER.print_summary()
+        PROFILER.export(args.profile)
+        print(f"Stage profile written to {args.profile}")
 
     # ------------------------------------------------------------------
     # 7. Visualisation
     # ------------------------------------------------------------------
+    from visualizations.plotResults import plot_comprehensive_results
+
     plot_comprehensive_results(
         received_signal=received_signal,
         mf_single=mf_single,
@@ -99,8 +290,11 @@ def main() -> None:
         echo_time=echo_time,
         peaks=peaks,
         distances=distances,
-        targets=targets,
+        targets=target_ranges[radar.in_gate(target_ranges)],
+        output=args.plot_file,
     )
+    if args.plot_file:
+        print(f"Results figure written to {args.plot_file}")
 
     print("\n" + "=" * 50)
     print("SIMULATION COMPLETE")
@@ -0,0 +1,175 @@
+import contextlib
+import csv
+import io
+import itertools
+import json
+import os
+import time
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor
+from typing import Dict, List, Optional, Sequence
+
+from radar.noise import as_seed_sequence
+from radar.radarSimulator import RadarSimulator
+from radar.scoring import score_detections
+from radar.targets import create_target_scenario, split_targets
+
+# Sweep used for any key a specification leaves out
+DEFAULT_SWEEP = {
+    'scenarios': ['simple', 'dense', 'extended', 'moving'],
+    'noise_std': [3e-7],
+    'n_pulses': [128],
+    'cfar': [None],          # None = RadarSimulator.detect_targets defaults
+    'refine': None,          # 'parabolic', 'sinc' or 'fft'
+    'synthesis': 'time',
+    'radar': {},             # extra RadarSimulator keyword arguments
+    'gate': 7.5,             # m; a detection this close to a target is a hit
+    'seed': None,
+}
+
+# Per-case scalar columns, in output order
+RESULT_FIELDS = ('case', 'scenario', 'noise_std', 'n_pulses', 'cfar', 'n_targets',
+                 'n_detections', 'n_hits', 'n_missed', 'n_false', 'mean_error',
+                 'range_rmse', 'integration_s', 'detection_s', 'total_s')
+
+
+def load_sweep(path: Optional[str] = None, **overrides) -> dict:
+    """
+    Build a sweep specification.
+
+    Parameters
+    ----------
+    path : str, optional
+        JSON file with any of the ``DEFAULT_SWEEP`` keys.
+    **overrides
+        Keys that replace both the defaults and the file; None values are
+        ignored.
+
+    Returns
+    -------
+    dict
+        Complete specification.
+    """
+    spec = dict(DEFAULT_SWEEP)
+    if path is not None:
+        with open(path) as f:
+            loaded = json.load(f)
+        unknown = set(loaded) - set(DEFAULT_SWEEP)
+        if unknown:
+            raise ValueError(f"Unknown sweep keys: {sorted(unknown)}")
+        spec.update(loaded)
+    spec.update({k: v for k, v in overrides.items() if v is not None})
+    return spec
+
+
+def expand_sweep(spec: dict) -> List[dict]:
+    """
+    Expand a specification into one case per (scenario, noise_std,
+    n_pulses, cfar) combination.
+
+    Every case gets an independent child of ``spec['seed']``, so a single
+    case can be rerun on its own with the same noise.
+    """
+    grid = list(itertools.product(spec['scenarios'], spec['noise_std'],
+                                  spec['n_pulses'], spec['cfar']))
+    seeds = as_seed_sequence(spec['seed']).spawn(len(grid))
+    return [{
+        'case': i,
+        'scenario': scenario,
+        'noise_std': float(noise_std),
+        'n_pulses': int(n_pulses),
+        'cfar': cfar,
+        'refine': spec['refine'],
+        'synthesis': spec['synthesis'],
+        'radar': spec['radar'],
+        'gate': spec['gate'],
+        'seed': seed,
+    } for i, ((scenario, noise_std, n_pulses, cfar), seed) in enumerate(zip(grid, seeds))]
+
+
+def run_case(case: dict) -> Dict[str, object]:
+    """
+    Simulate, integrate and detect one case without printing or plotting.
+
+    Returns
+    -------
+    dict
+        The ``RESULT_FIELDS`` plus 'detections' (ranges in m).
+    """
+    start = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+        radar = RadarSimulator(n_pulses=case['n_pulses'], seed=case['seed'], **case['radar'])
+        pulse, _ = radar.generate_pulse()
+        targets = create_target_scenario(case['scenario'])
+
+        integrated, _ = radar.coherent_integration(pulse, targets, noise_std=case['noise_std'],
+                                                   keep_matrix=False,
+                                                   synthesis=case['synthesis'])
+        integrated_at = time.perf_counter()
+        _, distances = radar.detect_targets(integrated, None, len(pulse),
+                                            cfar_params=case['cfar'], refine=case['refine'])
+    detected_at = time.perf_counter()
+
+    true_ranges, _ = split_targets(targets)
+    score = score_detections(true_ranges, distances, case['gate'])
+    return {
+        'case': case['case'],
+        'scenario': case['scenario'],
+        'noise_std': case['noise_std'],
+        'n_pulses': case['n_pulses'],
+        'cfar': json.dumps(case['cfar'], sort_keys=True),
+        'n_targets': len(true_ranges),
+        'n_detections': len(distances),
+        **{key: score[key] for key in ('n_hits', 'n_missed', 'n_false', 'mean_error', 'range_rmse')},
+        'integration_s': integrated_at - start,
+        'detection_s': detected_at - integrated_at,
+        'total_s': detected_at - start,
+        'detections': np.asarray(distances, dtype=float),
+    }
+
+
+def run_sweep(cases: Sequence[dict], n_workers: Optional[int] = None) -> List[Dict[str, object]]:
+    """
+    Run ``cases`` on ``n_workers`` processes (default: all cores; 1 runs
+    in-process) and return their results in case order.
+    """
+    n_workers = n_workers or os.cpu_count()
+    if n_workers == 1 or len(cases) <= 1:
+        return [run_case(case) for case in cases]
+    with ProcessPoolExecutor(max_workers=min(n_workers, len(cases))) as pool:
+        return list(pool.map(run_case, cases))
+
+
+def write_results(results: Sequence[Dict[str, object]], path: str) -> None:
+    """
+    Save sweep results as NPZ (``path`` ends in .npz) or CSV.
+
+    The NPZ holds one array per ``RESULT_FIELDS`` column plus the
+    detections of all cases concatenated in 'detections', with case ``i``
+    at ``detections[offsets[i]:offsets[i + 1]]``. The CSV has one row per
+    case and the detections as a space-separated column.
+    """
+    if path.lower().endswith('.npz'):
+        columns = {field: np.array([r[field] for r in results]) for field in RESULT_FIELDS}
+        lengths = [len(r['detections']) for r in results]
+        offsets = np.concatenate([[0], np.cumsum(lengths)]).astype(np.int64)
+        detections = (np.concatenate([r['detections'] for r in results]) if results
+                      else np.array([]))
+        np.savez_compressed(path, detections=detections, offsets=offsets, **columns)
+    else:
+        with open(path, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(RESULT_FIELDS + ('detections',))
+            for r in results:
+                writer.writerow([r[field] for field in RESULT_FIELDS]
+                                + [' '.join(f"{d:.3f}" for d in r['detections'])])
+
+
+def print_results(results: Sequence[Dict[str, object]]) -> None:
+    """One summary line per case."""
+    print(f"{'case':>4} {'scenario':<9} {'noise':>8} {'pulses':>6} {'hits':>7} "
+          f"{'false':>5} {'rmse (m)':>8} {'time (s)':>8}  cfar")
+    for r in results:
+        print(f"{r['case']:>4} {r['scenario']:<9} {r['noise_std']:>8.1e} {r['n_pulses']:>6} "
+              f"{r['n_hits']:>3}/{r['n_targets']:<3} {r['n_false']:>5} {r['range_rmse']:>8.2f} "
+              f"{r['total_s']:>8.2f}  {r['cfar']}")
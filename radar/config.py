@@ -0,0 +1,146 @@
+from typing import Dict, List, Optional, Tuple
+
+SPEED_OF_LIGHT = 3e8   # m/s, as used throughout the simulator
+
+
+class _derived:
+    """Read-only attribute computed on first access and cached in the slot ``'_' + name``."""
+
+    def __init__(self, func):
+        self.func = func
+        self.slot = '_' + func.__name__
+        self.__doc__ = func.__doc__
+
+    def __get__(self, obj, cls=None):
+        if obj is None:
+            return self
+        try:
+            return getattr(obj, self.slot)
+        except AttributeError:
+            value = self.func(obj)
+            object.__setattr__(obj, self.slot, value)
+            return value
+
+
+class RadarConfig:
+    """
+    Immutable radar parameters with lazily derived quantities.
+
+    Construction only stores the parameters; the PRI, wavelength,
+    resolution, unambiguous range and velocity and the PRI length in
+    samples are computed the first time they are read and then cached.
+    Instances are hashable and compare by their parameters, so thousands
+    of them can be created, deduplicated or used as dictionary keys in a
+    parameter sweep. Use ``replace`` to derive a modified copy.
+
+    Parameters
+    ----------
+    sample_rate, bandwidth, pulse_duration, n_pulses, prf, carrier_freq
+        As for ``RadarSimulator``.
+    range_gate : tuple of float, optional
+        (min_range, max_range) in m, within the unambiguous range.
+    """
+
+    FIELDS = ('sample_rate', 'bandwidth', 'pulse_duration', 'n_pulses', 'prf',
+              'carrier_freq', 'range_gate')
+
+    __slots__ = FIELDS + ('_pri', '_wavelength', '_range_resolution', '_unambiguous_range',
+                          '_unambiguous_velocity', '_pri_samples')
+
+    def __init__(self, sample_rate: float = 100e6, bandwidth: float = 20e6,
+                 pulse_duration: float = 10e-6, n_pulses: int = 128, prf: float = 5e3,
+                 carrier_freq: float = 10e9,
+                 range_gate: Optional[Tuple[float, float]] = None):
+        if range_gate is not None:
+            range_gate = (float(range_gate[0]), float(range_gate[1]))
+        init = object.__setattr__
+        init(self, 'sample_rate', sample_rate)
+        init(self, 'bandwidth', bandwidth)
+        init(self, 'pulse_duration', pulse_duration)
+        init(self, 'n_pulses', n_pulses)
+        init(self, 'prf', prf)
+        init(self, 'carrier_freq', carrier_freq)
+        init(self, 'range_gate', range_gate)
+        if range_gate is not None:
+            min_range, max_range = range_gate
+            if not 0 <= min_range < max_range <= self.unambiguous_range:
+                raise ValueError(f"Range gate must satisfy 0 <= min < max <= "
+                                 f"{self.unambiguous_range:.0f} m: {range_gate}")
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f"RadarConfig is immutable; use replace({name}=...)")
+
+    def __delattr__(self, name):
+        raise AttributeError("RadarConfig is immutable")
+
+    def __reduce__(self):
+        return RadarConfig, tuple(getattr(self, name) for name in self.FIELDS)
+
+    def _key(self):
+        return tuple(getattr(self, name) for name in self.FIELDS)
+
+    def __eq__(self, other):
+        if not isinstance(other, RadarConfig):
+            return NotImplemented
+        return self._key() == other._key()
+
+    def __hash__(self):
+        return hash(self._key())
+
+    def __repr__(self):
+        return f"RadarConfig({', '.join(f'{k}={v!r}' for k, v in self.as_dict().items())})"
+
+    def replace(self, **changes) -> 'RadarConfig':
+        """Copy with the given parameters changed."""
+        unknown = set(changes) - set(self.FIELDS)
+        if unknown:
+            raise ValueError(f"Unknown radar parameters: {sorted(unknown)}")
+        return RadarConfig(**{**self.as_dict(), **changes})
+
+    def as_dict(self) -> Dict[str, object]:
+        """Parameters by name (the ``RadarConfig`` keyword arguments)."""
+        return {name: getattr(self, name) for name in self.FIELDS}
+
+    @_derived
+    def pri(self) -> float:
+        """Pulse repetition interval (s)."""
+        return 1.0 / self.prf
+
+    @_derived
+    def wavelength(self) -> float:
+        """Carrier wavelength (m)."""
+        return SPEED_OF_LIGHT / self.carrier_freq
+
+    @_derived
+    def range_resolution(self) -> float:
+        """Theoretical range resolution c / 2B (m)."""
+        return SPEED_OF_LIGHT / (2 * self.bandwidth)
+
+    @_derived
+    def unambiguous_range(self) -> float:
+        """Maximum unambiguous range c·PRI / 2 (m)."""
+        return SPEED_OF_LIGHT * self.pri / 2
+
+    @_derived
+    def unambiguous_velocity(self) -> float:
+        """Maximum unambiguous radial speed λ·PRF / 4 (m/s)."""
+        return self.wavelength * self.prf / 4
+
+    @_derived
+    def pri_samples(self) -> int:
+        """Samples per PRI, i.e. the length of one raw record."""
+        return int(round(self.pri * self.sample_rate))
+
+    def describe(self) -> List[str]:
+        """Human-readable summary of the derived parameters, one line each."""
+        lines = [
+            f"Theoretical range resolution: {self.range_resolution:.2f} m",
+            f"PRF                         : {self.prf/1e3:.1f} kHz",
+            f"PRI                         : {self.pri*1e6:.1f} µs",
+            f"Max unambiguous range       : {self.unambiguous_range/1e3:.2f} km",
+            f"Max unambiguous velocity    : ±{self.unambiguous_velocity:.1f} m/s",
+        ]
+        if self.range_gate is not None:
+            min_range, max_range = self.range_gate
+            lines.append(f"Range gate                  : {min_range/1e3:.2f} - {max_range/1e3:.2f} km")
+        return lines
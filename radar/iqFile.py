@@ -0,0 +1,168 @@
+import json
+import os
+import numpy as np
+from typing import Iterator, Optional
+
+MAGIC = b'RADARIQ\0'
+VERSION = 1
+
+# Magic, version and JSON metadata live in a fixed, space-padded block so the
+# record count can be rewritten in place and the data stays page aligned.
+HEADER_BYTES = 4096
+
+
+def _encode_header(header: dict) -> bytes:
+    text = json.dumps(header, sort_keys=True).encode('utf-8')
+    prefix = MAGIC + np.array([VERSION, len(text)], dtype='<u4').tobytes()
+    if len(prefix) + len(text) > HEADER_BYTES:
+        raise ValueError(f"I/Q header exceeds {HEADER_BYTES} bytes")
+    return (prefix + text).ljust(HEADER_BYTES, b' ')
+
+
+class IQWriter:
+    """
+    Write raw I/Q pulse records to a binary file.
+
+    The file holds a ``HEADER_BYTES`` header (magic, version and JSON
+    metadata: sample_rate, prf, dtype, samples per record, record count and
+    any pulse parameters) followed by contiguous records of
+    ``n_samples`` complex samples each (complex64 by default). The record
+    length is fixed by the first write. Use as a context manager, or call
+    ``close`` to finalize the record count.
+
+    Parameters
+    ----------
+    path : str
+        Output file path.
+    sample_rate : float
+        Sampling frequency in Hz.
+    prf : float
+        Pulse repetition frequency in Hz.
+    metadata : dict, optional
+        Extra JSON-serializable fields, e.g. pulse parameters.
+    dtype : str
+        Sample type on disk, 'complex64' (default) or 'complex128'.
+    """
+
+    def __init__(self, path: str, sample_rate: float, prf: float,
+                 metadata: Optional[dict] = None, dtype: str = 'complex64'):
+        self.path = path
+        self.dtype = np.dtype(dtype)
+        self.header = {
+            'sample_rate': sample_rate,
+            'prf': prf,
+            'dtype': self.dtype.str,
+            'n_samples': None,
+            'n_records': 0,
+            'metadata': metadata or {},
+        }
+        self._file = open(path, 'wb')
+        self._file.write(_encode_header(self.header))
+
+    @property
+    def n_records(self) -> int:
+        return self.header['n_records']
+
+    def write(self, records: np.ndarray) -> None:
+        """Append one record (1-D) or a block of records (2-D, one per row)."""
+        records = np.atleast_2d(records)
+        if self.header['n_samples'] is None:
+            self.header['n_samples'] = records.shape[1]
+        elif records.shape[1] != self.header['n_samples']:
+            raise ValueError(f"Record length {records.shape[1]} does not match "
+                             f"{self.header['n_samples']}")
+        np.ascontiguousarray(records, dtype=self.dtype).tofile(self._file)
+        self.header['n_records'] += records.shape[0]
+
+    def close(self) -> None:
+        """Rewrite the header with the final record count and close the file."""
+        if self._file.closed:
+            return
+        self._file.seek(0)
+        self._file.write(_encode_header(self.header))
+        self._file.close()
+
+    def __enter__(self) -> "IQWriter":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+class IQReader:
+    """
+    Memory-mapped reader for files written by ``IQWriter``.
+
+    ``records`` is an ``np.memmap`` of shape (n_records, n_samples); rows
+    are read from disk on demand, so multi-GB captures can be replayed
+    without loading them into RAM. A file whose writer was never closed is
+    still readable; its record count is taken from the file size.
+
+    Parameters
+    ----------
+    path : str
+        File written by ``IQWriter``.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        with open(path, 'rb') as f:
+            block = f.read(HEADER_BYTES)
+        if block[:len(MAGIC)] != MAGIC:
+            raise ValueError(f"{path} is not a radar I/Q file")
+        version, length = np.frombuffer(block, dtype='<u4', count=2, offset=len(MAGIC))
+        if version > VERSION:
+            raise ValueError(f"Unsupported I/Q file version {version}")
+        start = len(MAGIC) + 8
+        self.header = json.loads(block[start:start + length].decode('utf-8'))
+
+        self.dtype = np.dtype(self.header['dtype'])
+        self.n_samples = self.header['n_samples'] or 0
+        n_records = self.header['n_records']
+        if self.n_samples:
+            on_disk = (os.path.getsize(path) - HEADER_BYTES) // (self.n_samples * self.dtype.itemsize)
+            n_records = max(n_records, on_disk)
+        self.n_records = n_records
+
+        if self.n_records and self.n_samples:
+            self.records = np.memmap(path, dtype=self.dtype, mode='r', offset=HEADER_BYTES,
+                                     shape=(self.n_records, self.n_samples))
+        else:
+            self.records = np.empty((0, self.n_samples), dtype=self.dtype)
+
+    @property
+    def sample_rate(self) -> float:
+        return self.header['sample_rate']
+
+    @property
+    def prf(self) -> float:
+        return self.header['prf']
+
+    @property
+    def metadata(self) -> dict:
+        return self.header['metadata']
+
+    def __len__(self) -> int:
+        return self.n_records
+
+    def __getitem__(self, index):
+        return self.records[index]
+
+    def range_lines(self, start: int = 0, stop: Optional[int] = None) -> Iterator[np.ndarray]:
+        """Yield records ``start:stop`` one at a time as zero-copy memmap views."""
+        stop = self.n_records if stop is None else min(stop, self.n_records)
+        for i in range(start, stop):
+            yield self.records[i]
+
+    def close(self) -> None:
+        """Release the memory map."""
+        mm = getattr(self.records, '_mmap', None)
+        self.records = None
+        if mm is not None:
+            mm.close()
+
+    def __enter__(self) -> "IQReader":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
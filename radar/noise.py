@@ -0,0 +1,126 @@
+import numpy as np
+from typing import List, Optional, Union
+
+from radar.profiling import profiled
+
+BIT_GENERATORS = {
+    'pcg64': np.random.PCG64,
+    'pcg64dxsm': np.random.PCG64DXSM,
+    'philox': np.random.Philox,
+    'sfc64': np.random.SFC64,
+    'mt19937': np.random.MT19937,
+}
+
+Seed = Union[None, int, np.random.SeedSequence]
+
+
+def as_seed_sequence(seed: Seed) -> np.random.SeedSequence:
+    """Wrap an int or None seed in a SeedSequence; pass SeedSequences through."""
+    if isinstance(seed, np.random.SeedSequence):
+        return seed
+    return np.random.SeedSequence(seed)
+
+
+def make_rng(seed: Seed = None, bit_generator: str = 'pcg64') -> np.random.Generator:
+    """
+    Create a random generator for noise synthesis.
+
+    Parameters
+    ----------
+    seed : int, SeedSequence or None
+        Seed for reproducible runs; None draws fresh OS entropy.
+    bit_generator : str
+        'pcg64' (default), 'pcg64dxsm', 'philox', 'sfc64' or 'mt19937'.
+        Philox is counter-based and well suited to many parallel streams.
+
+    Returns
+    -------
+    np.random.Generator
+    """
+    try:
+        bit_gen_cls = BIT_GENERATORS[bit_generator.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown bit generator: {bit_generator}") from None
+    return np.random.Generator(bit_gen_cls(as_seed_sequence(seed)))
+
+
+def spawn_rngs(seed: Seed, n_streams: int, bit_generator: str = 'pcg64') -> List[np.random.Generator]:
+    """Create ``n_streams`` statistically independent generators from one seed."""
+    return [make_rng(child, bit_generator) for child in as_seed_sequence(seed).spawn(n_streams)]
+
+
+@profiled()
+def fill_complex_noise(out: np.ndarray,
+                       noise_std: float,
+                       rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Overwrite ``out`` with complex Gaussian noise, in place.
+
+    The I and Q samples are drawn as one block of standard-normal float
+    pairs directly into the memory of ``out`` (viewed as floats) and
+    scaled by σ/√2, so no temporary arrays are created.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        C-contiguous complex buffer to fill (complex64 or complex128;
+        single-precision buffers are drawn as float32).
+    noise_std : float
+        Standard deviation of the complex noise.
+    rng : np.random.Generator, optional
+        Random generator to draw from (default: a fresh unseeded one).
+
+    Returns
+    -------
+    np.ndarray
+        ``out``.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    pairs = out.view(out.real.dtype)
+    rng.standard_normal(out=pairs, dtype=pairs.dtype)
+    # For complex Gaussian noise: σ_I = σ_Q = σ_total / √2
+    pairs *= noise_std / np.sqrt(2)
+    return out
+
+
+@profiled()
+def add_noise_inplace(signal: np.ndarray,
+                      noise_std: float,
+                      rng: Optional[np.random.Generator] = None,
+                      block_samples: int = 1 << 18) -> np.ndarray:
+    """
+    Add complex Gaussian noise to ``signal`` in place.
+
+    Noise is drawn into one reusable scratch buffer of at most
+    ``block_samples`` samples and accumulated block by block, so the extra
+    memory is bounded no matter how large ``signal`` is.
+
+    Parameters
+    ----------
+    signal : np.ndarray
+        Complex array to modify; 1-D or 2-D arrays may be strided views.
+    noise_std : float
+        Standard deviation of the complex noise.
+    rng : np.random.Generator, optional
+        Random generator to draw from (default: a fresh unseeded one).
+    block_samples : int
+        Size of the scratch buffer in samples.
+
+    Returns
+    -------
+    np.ndarray
+        ``signal``.
+    """
+    rng = np.random.default_rng() if rng is None else rng
+    rows = np.atleast_2d(signal) if signal.ndim <= 2 else signal.reshape(-1, signal.shape[-1])
+    if not np.shares_memory(rows, signal):
+        raise ValueError("add_noise_inplace needs a signal whose rows can be viewed in place")
+    n_cols = rows.shape[-1]
+    rows_per_block = max(block_samples // max(n_cols, 1), 1)
+
+    scratch = np.empty((min(rows_per_block, rows.shape[0]), n_cols), dtype=signal.dtype)
+    for first in range(0, rows.shape[0], rows_per_block):
+        block = rows[first:first + rows_per_block]
+        noise = fill_complex_noise(scratch[:len(block)], noise_std, rng)
+        block += noise
+    return signal
@@ -0,0 +1,215 @@
+import os
+import numpy as np
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from multiprocessing import shared_memory
+from typing import Dict, List, Optional, Tuple
+
+from radar.signalProcessing import MatchedFilter
+from radar.noise import Seed, as_seed_sequence, make_rng
+from radar.targets import simulate_pulse_matrix
+
+
+def split_pulses(n_pulses: int, n_blocks: int) -> List[Tuple[int, int]]:
+    """
+    Split ``n_pulses`` into at most ``n_blocks`` contiguous (first, stop) ranges.
+    """
+    edges = np.linspace(0, n_pulses, min(n_blocks, n_pulses) + 1).astype(int)
+    return [(int(a), int(b)) for a, b in zip(edges[:-1], edges[1:])]
+
+
+# Matched filters built in this worker process, keyed on the pulse samples,
+# so each worker computes the reference spectrum once instead of once per job
+_WORKER_FILTERS: Dict[Tuple[str, bytes], MatchedFilter] = {}
+
+
+def _worker_filter(pulse: np.ndarray) -> MatchedFilter:
+    """This worker's matched filter for ``pulse`` (a pickled copy in process workers)."""
+    key = (pulse.dtype.str, pulse.tobytes())
+    mf = _WORKER_FILTERS.get(key)
+    if mf is None:
+        if len(_WORKER_FILTERS) >= 8:
+            _WORKER_FILTERS.clear()
+        mf = _WORKER_FILTERS[key] = MatchedFilter(pulse)
+    return mf
+
+
+def _process_block(job: dict) -> None:
+    """
+    Worker: simulate and compress one block of pulses into the output matrix.
+
+    The output is either attached from shared memory by name (process
+    workers) or passed directly (thread workers). With ``job['integrate']``
+    the block's compressed lines are summed into a single output row.
+    """
+    shm = None
+    if job['shm_name'] is not None:
+        shm = shared_memory.SharedMemory(name=job['shm_name'])
+        out = np.ndarray(job['shape'], dtype=job['dtype'], buffer=shm.buf)
+    else:
+        out = job['out']
+
+    try:
+        first, stop = job['pulses']
+        pri_samples = job['pri_samples']
+        received = simulate_pulse_matrix(
+            job['pulse'], job['sample_rate'], job['targets'], stop - first,
+            noise_std=job['noise_std'], max_samples=pri_samples, first_pulse=first,
+            pri=job['pri'], carrier_freq=job['carrier_freq'],
+            rng=make_rng(job['seed'], job['bit_generator']), dtype=job['dtype']
+        )
+        mf = _worker_filter(job['pulse'])
+        row = job['row']
+        if job['integrate']:
+            out[row] = mf(np.sum(received, axis=0), n_samples=pri_samples)
+        else:
+            out[row:row + stop - first] = mf(received, n_samples=pri_samples)
+    finally:
+        if shm is not None:
+            del out
+            shm.close()
+
+
+def _run_jobs(jobs: List[dict], shape: Tuple[int, int], n_workers: int, backend: str,
+              dtype=complex) -> np.ndarray:
+    """Run ``jobs`` on a worker pool, each writing into one shared (shape) matrix."""
+    if backend not in ('process', 'thread'):
+        raise ValueError(f"Unknown parallel backend: {backend}")
+
+    if backend == 'thread' or n_workers == 1:
+        out = np.empty(shape, dtype=dtype)
+        for job in jobs:
+            job.update(shm_name=None, out=out)
+        if n_workers == 1:
+            for job in jobs:
+                _process_block(job)
+        else:
+            with ThreadPoolExecutor(max_workers=n_workers) as executor:
+                list(executor.map(_process_block, jobs))
+        return out
+
+    nbytes = int(np.prod(shape)) * np.dtype(dtype).itemsize
+    shm = shared_memory.SharedMemory(create=True, size=max(nbytes, 1))
+    try:
+        for job in jobs:
+            job.update(shm_name=shm.name, shape=shape)
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            list(executor.map(_process_block, jobs))
+        shared = np.ndarray(shape, dtype=dtype, buffer=shm.buf)
+        out = shared.copy()
+        del shared
+    finally:
+        shm.close()
+        shm.unlink()
+    return out
+
+
+def _base_job(radar, pulse: np.ndarray, targets: list, noise_std: float,
+              bit_generator: str) -> dict:
+    return {
+        'bit_generator': bit_generator,
+        'pulse': pulse,
+        'targets': targets,
+        'noise_std': noise_std,
+        'sample_rate': radar.sample_rate,
+        'pri': radar.pri,
+        'pri_samples': int(round(radar.pri * radar.sample_rate)),
+        'carrier_freq': radar.carrier_freq,
+        'dtype': radar.dtype,
+    }
+
+
+def parallel_coherent_integration(radar,
+                                  pulse: np.ndarray,
+                                  targets: list,
+                                  noise_std: float = 3e-7,
+                                  n_workers: Optional[int] = None,
+                                  backend: str = 'process',
+                                  keep_matrix: bool = True,
+                                  seed: Seed = None,
+                                  bit_generator: str = 'pcg64'
+                                  ) -> Tuple[np.ndarray, Optional[np.ndarray]]:
+    """
+    Coherent integration of one CPI with its pulses split across workers.
+
+    Each worker simulates and matched-filters a contiguous block of pulses
+    and writes the range lines straight into a shared pulse matrix
+    (``multiprocessing.shared_memory`` for processes), so no results are
+    pickled back. Every block draws noise from its own child of ``seed``.
+
+    Parameters
+    ----------
+    radar : RadarSimulator
+        Supplies sample_rate, pri, n_pulses, carrier_freq and dtype.
+    pulse : np.ndarray
+        Transmitted radar pulse.
+    targets : list
+        Target ranges or (range, radial_velocity) tuples.
+    noise_std : float
+        Standard deviation of complex Gaussian noise.
+    n_workers : int, optional
+        Worker count (default ``os.cpu_count()``).
+    backend : str
+        'process' (ProcessPoolExecutor + shared memory) or 'thread'.
+    keep_matrix : bool
+        If False, each worker only writes the sum of its block and
+        ``None`` is returned in place of ``rd_matrix``.
+    seed : int or SeedSequence, optional
+        Root seed for the per-block noise streams.
+    bit_generator : str
+        Bit generator of every stream (see ``radar.noise.make_rng``).
+
+    Returns
+    -------
+    tuple
+        (integrated, rd_matrix) as from ``RadarSimulator.coherent_integration``.
+    """
+    n_workers = n_workers or os.cpu_count()
+    blocks = split_pulses(radar.n_pulses, n_workers)
+    seeds = as_seed_sequence(seed).spawn(len(blocks))
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+
+    jobs = []
+    for i, ((first, stop), block_seed) in enumerate(zip(blocks, seeds)):
+        job = _base_job(radar, pulse, targets, noise_std, bit_generator)
+        job.update(pulses=(first, stop), seed=block_seed, integrate=not keep_matrix,
+                   row=first if keep_matrix else i)
+        jobs.append(job)
+
+    rows = radar.n_pulses if keep_matrix else len(blocks)
+    out = _run_jobs(jobs, (rows, pri_samples), n_workers, backend, radar.dtype)
+
+    integrated = np.sum(out, axis=0)
+    return integrated, (out if keep_matrix else None)
+
+
+def integrate_cpis(radar,
+                   pulse: np.ndarray,
+                   targets: list,
+                   n_cpis: int,
+                   noise_std: float = 3e-7,
+                   n_workers: Optional[int] = None,
+                   backend: str = 'process',
+                   seed: Seed = None,
+                   bit_generator: str = 'pcg64') -> np.ndarray:
+    """
+    Run ``n_cpis`` independent CPIs in parallel, one CPI per task.
+
+    Intended for Monte Carlo runs: each CPI gets its own noise stream and
+    its integrated line is written into row ``i`` of a shared output.
+
+    Returns
+    -------
+    np.ndarray
+        Integrated lines, shape (n_cpis, pri_samples).
+    """
+    n_workers = n_workers or os.cpu_count()
+    seeds = as_seed_sequence(seed).spawn(n_cpis)
+    pri_samples = int(round(radar.pri * radar.sample_rate))
+
+    jobs = []
+    for i, cpi_seed in enumerate(seeds):
+        job = _base_job(radar, pulse, targets, noise_std, bit_generator)
+        job.update(pulses=(0, radar.n_pulses), seed=cpi_seed, integrate=True, row=i)
+        jobs.append(job)
+
+    return _run_jobs(jobs, (n_cpis, pri_samples), n_workers, backend, radar.dtype)
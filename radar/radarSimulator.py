@@ -1,117 +1,572 @@
+import logging
 import numpy as np, time
-from radar.simulator import generate_lfm_pulse
-from radar.targets import simulate_echoes
-from radar.signalProcessing import matched_filter, ca_cfar_detector
+from radar.targets import compressed_echoes, simulate_into, simulate_pulse_matrix, split_scatterers
+from radar.config import SPEED_OF_LIGHT, RadarConfig
+from radar.noise import BIT_GENERATORS, make_rng
+from radar.iqFile import IQWriter
+from radar.parallel import parallel_coherent_integration
+from radar.profiling import profiled, stage
+from radar.scoring import score_detections
+from radar.streaming import StreamProcessor
+from radar.tracking import RangeTracker
+from radar.waveformCache import DEFAULT_WAVEFORM_CACHE
+from radar.signalProcessing import (MatchedFilterBank, ca_cfar_detector, ca_cfar_2d, cfar_mask,
+                                    doppler_frequencies, mti_filter, range_doppler_map, refine_peaks)
+
+# Complex sample type used through the whole chain for each precision policy
+PRECISIONS = {
+    'double': np.complex128,
+    'single': np.complex64,
+}
+
+logger = logging.getLogger(__name__)
+
+# Default CFAR parameters of detect_targets and range_doppler_processing
+DETECTION_CFAR = {'num_train': 35, 'num_guard': 5, 'pfa': 8e-3, 'peak_guard': 1}
+RANGE_DOPPLER_CFAR = {'num_train': (4, 20), 'num_guard': (2, 5), 'pfa': 1e-3, 'peak_guard': (1, 1)}
+
+# Range cells a CFAR window with the defaults above needs beyond a cell to test it
+GATE_MARGIN = max(DETECTION_CFAR['num_train'] + DETECTION_CFAR['num_guard'] + DETECTION_CFAR['peak_guard'],
+                  RANGE_DOPPLER_CFAR['num_train'][1] + RANGE_DOPPLER_CFAR['num_guard'][1]
+                  + RANGE_DOPPLER_CFAR['peak_guard'][1])
+
+def _from_config(name):
+    """Read-only simulator attribute mirroring ``self.config.<name>``."""
+    return property(lambda self: getattr(self.config, name),
+                    doc=f"``RadarConfig.{name}`` of this radar.")
+
 
 class RadarSimulator:
-    """Main radar simulation class with configurable parameters."""
-    
-    def __init__(self, sample_rate=100e6, bandwidth=20e6, pulse_duration=10e-6, n_pulses=128, prf=5e3):
-        self.sample_rate = sample_rate
-        self.bandwidth = bandwidth
-        self.pulse_duration = pulse_duration
-        self.n_pulses = n_pulses
-        self.prf = prf
-        self.pri = 1.0 / prf
-        self.c = 3e8  # Speed of light
-        
-        # Performance metrics
-        self.range_resolution = self.c / (2 * self.bandwidth)
-        print(f"Theoretical range resolution: {self.range_resolution:.2f} m")
-        self.unambiguous_range = self.c * self.pri / 2
-        print(f"PRF                         : {self.prf/1e3:.1f} kHz")
-        print(f"PRI                         : {self.pri*1e6:.1f} µs")
-        print(f"Max unambiguous range       : {self.unambiguous_range/1e3:.2f} km")
-        
-    def generate_pulse(self, window='hanning'):
-        """Generate LFM chirp pulse."""
-        pulse, t_pulse = generate_lfm_pulse(
-            start_freq=-self.bandwidth/2,
-            bandwidth=self.bandwidth,
-            duration=self.pulse_duration,
+    """Main radar simulation class with configurable parameters.
+
+    With *range_gate* = (min_range, max_range) in meters, echo synthesis,
+    matched filtering and CFAR cover only that window instead of the whole
+    PRI (see ``gate_lags``), and detected ranges are offset accordingly.
+
+    The radar parameters live in an immutable ``RadarConfig`` (``config``)
+    and are mirrored as read-only attributes. With *quiet* the parameter
+    summary is not printed; it is always logged to the ``radar.radarSimulator``
+    logger (record attribute ``radar_config``). The noise generator is only
+    created when first used.
+    """
+    
+    c = SPEED_OF_LIGHT
+    gate_margin = GATE_MARGIN   # delays processed beyond each end of a range gate
+    
+    sample_rate = _from_config('sample_rate')
+    bandwidth = _from_config('bandwidth')
+    pulse_duration = _from_config('pulse_duration')
+    prf = _from_config('prf')
+    carrier_freq = _from_config('carrier_freq')
+    range_gate = _from_config('range_gate')
+    pri = _from_config('pri')
+    pri_samples = _from_config('pri_samples')
+    wavelength = _from_config('wavelength')
+    range_resolution = _from_config('range_resolution')
+    unambiguous_range = _from_config('unambiguous_range')
+    unambiguous_velocity = _from_config('unambiguous_velocity')
+    
+    def __init__(self, sample_rate=100e6, bandwidth=20e6, pulse_duration=10e-6, n_pulses=128, prf=5e3,
+                 carrier_freq=10e9, seed=None, bit_generator='pcg64', waveform_cache=None,
+                 precision='double', range_gate=None, quiet=False):
+        self._setup(RadarConfig(sample_rate, bandwidth, pulse_duration, n_pulses, prf,
+                                carrier_freq, range_gate),
+                    seed, bit_generator, waveform_cache, precision, quiet)
+    
+    @classmethod
+    def from_config(cls, config, seed=None, bit_generator='pcg64', waveform_cache=None,
+                    precision='double', quiet=False):
+        """Simulator for an existing ``RadarConfig`` (shared, not copied)."""
+        radar = cls.__new__(cls)
+        radar._setup(config, seed, bit_generator, waveform_cache, precision, quiet)
+        return radar
+    
+    def _setup(self, config, seed, bit_generator, waveform_cache, precision, quiet):
+        if precision not in PRECISIONS:
+            raise ValueError(f"Unknown precision: {precision}")
+        if bit_generator.lower() not in BIT_GENERATORS:
+            raise ValueError(f"Unknown bit generator: {bit_generator}")
+        self.config = config
+        self.bit_generator = bit_generator
+        self.precision = precision
+        self.dtype = PRECISIONS[precision]   # pulses, records, noise and filter outputs
+        self.seed = seed
+        self._rng = None
+        self.waveform_cache = DEFAULT_WAVEFORM_CACHE if waveform_cache is None else waveform_cache
+        
+        if not quiet:
+            for line in config.describe():
+                print(line)
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Radar configured", extra={'radar_config': config.as_dict()})
+    
+    @property
+    def rng(self):
+        """Noise stream for every simulated pulse, created from *seed* on first use."""
+        if self._rng is None:
+            self._rng = make_rng(self.seed, self.bit_generator)
+        return self._rng
+    
+    @property
+    def n_pulses(self):
+        """Pulses per coherent integration (settable; replaces ``config``)."""
+        return self.config.n_pulses
+    
+    @n_pulses.setter
+    def n_pulses(self, n_pulses):
+        self.config = self.config.replace(n_pulses=n_pulses)
+        
+    def gate_lags(self, pulse_length):
+        """First delay (in samples) and number of delays inside the range gate, or None without one.
+
+        Gated outputs hold one matched-filter sample per delay: index *i*
+        is the echo delayed by ``first + i`` samples. The delays extend
+        ``gate_margin`` samples beyond each end of the gate, so CFAR has
+        training cells for targets at the gate edges; detections outside
+        the gate itself are dropped. Delays whose echo would not end inside
+        the PRI are excluded, as without a gate.
+        """
+        if self.range_gate is None:
+            return None
+        last = self.pri_samples - pulse_length + 1
+        min_range, max_range = self.range_gate
+        first = int(np.floor(2 * min_range / self.c * self.sample_rate))
+        stop = min(int(np.ceil(2 * max_range / self.c * self.sample_rate)) + 1, last)
+        if stop <= first:
+            raise ValueError(f"Range gate {self.range_gate} holds no complete {pulse_length}-sample echo")
+        first = max(first - self.gate_margin, 0)
+        stop = min(stop + self.gate_margin, last)
+        return first, stop - first
+    
+    def in_gate(self, ranges):
+        """Boolean mask of the *ranges* inside the range gate (all True without one).
+
+        The edges get 1 µm of slack, so a range computed from a delay that
+        falls exactly on an edge is not lost to floating-point round-off.
+        """
+        ranges = np.asarray(ranges, dtype=float)
+        if self.range_gate is None:
+            return np.ones(ranges.shape, dtype=bool)
+        return (ranges >= self.range_gate[0] - 1e-6) & (ranges <= self.range_gate[1] + 1e-6)
+    
+    def output_offset(self, pulse_length):
+        """Index in the full-PRI matched-filter output of sample 0 of this radar's range lines."""
+        lags = self.gate_lags(pulse_length)
+        return 0 if lags is None else lags[0] + pulse_length // 2
+    
+    def _simulate_records(self, pulse, targets, n_pulses, noise_std, first_pulse=0):
+        """Raw records of *n_pulses* pulses: one PRI each, or just the span feeding the range gate."""
+        pri_samples = self.pri_samples
+        lags = self.gate_lags(len(pulse))
+        if lags is None:
+            return simulate_pulse_matrix(pulse, self.sample_rate, targets, n_pulses,
+                                         noise_std=noise_std, max_samples=pri_samples,
+                                         first_pulse=first_pulse, pri=self.pri,
+                                         carrier_freq=self.carrier_freq, rng=self.rng,
+                                         dtype=self.dtype)
+        first, n_lags = lags
+        return simulate_pulse_matrix(pulse, self.sample_rate, targets, n_pulses,
+                                     noise_std=noise_std, max_samples=first + n_lags + len(pulse) - 1,
+                                     first_pulse=first_pulse, pri=self.pri,
+                                     carrier_freq=self.carrier_freq, rng=self.rng,
+                                     dtype=self.dtype, first_sample=first)
+    
+    def _compress(self, mf, records):
+        """Matched-filter records from ``_simulate_records`` (overlap-save over the gated span)."""
+        lags = self.gate_lags(len(mf.pulse))
+        if lags is None:
+            return mf(records, n_samples=self.pri_samples)
+        return mf.overlap_save(records, n_outputs=lags[1])
+    
+    def _compress_raw(self, mf, records):
+        """Range lines from full raw records (e.g. replayed): the whole PRI, or overlap-save over the gated span."""
+        pri_samples = self.pri_samples
+        m = len(mf.pulse)
+        lags = self.gate_lags(m)
+        if lags is None:
+            return mf(records[..., :pri_samples], n_samples=pri_samples)
+        first, n_lags = lags
+        return mf.overlap_save(records[..., first:first + n_lags + m - 1], n_outputs=n_lags)
+    
+    def _report_outside(self, targets, pulse_length):
+        """Say how many targets lie outside the processed range window (they produce no echo)."""
+        ranges, _, _ = split_scatterers(targets)
+        lags = self.gate_lags(pulse_length)
+        if lags is None:
+            window = (0.0, (self.pri_samples - pulse_length) / self.sample_rate * self.c / 2)
+        else:
+            first, n_lags = lags
+            window = (first / self.sample_rate * self.c / 2,
+                      (first + n_lags - 1) / self.sample_rate * self.c / 2)
+        outside = np.count_nonzero((ranges < window[0]) | (ranges > window[1]))
+        if outside:
+            print(f"{outside} of {len(ranges)} targets lie outside the processed "
+                  f"{window[0]:.0f}-{window[1]:.0f} m window and are not simulated")
+        
+    @profiled()
+    def generate_pulse(self, window='hanning', up_chirp=True, bandwidth=None, duration=None):
+        """Generate LFM chirp pulse (read-only, shared through the waveform cache).
+
+        *bandwidth* and *duration* default to the radar's; overriding them
+        or *up_chirp* yields the other members of a waveform bank.
+        """
+        entry = self.waveform_cache.get(
+            bandwidth=self.bandwidth if bandwidth is None else bandwidth,
+            duration=self.pulse_duration if duration is None else duration,
             sample_rate=self.sample_rate,
-            window=window
+            window=window,
+            up_chirp=up_chirp,
+            dtype=self.dtype
         )
-        return pulse, t_pulse
+        return entry.pulse, entry.t
+    
+    def matched_filter_engine(self, pulse):
+        """Matched filter for *pulse*, reusing cached reference spectra when the pulse came from ``generate_pulse``."""
+        return self.waveform_cache.matched_filter(pulse)
     
+    def matched_filter_bank(self, pulses):
+        """Batched matched filter against every pulse in *pulses* (see ``MatchedFilterBank``); cached pulses reuse their cached spectra."""
+        return MatchedFilterBank([self.matched_filter_engine(pulse) for pulse in pulses])
+    
+    @profiled()
     def process_single_pulse(self, pulse, targets, noise_std=3e-7):
-        """Transmit → receive → compress one pulse whose record length == PRI."""
-        pri_samples = int(round(self.pri * self.sample_rate))
+        """Transmit → receive → compress one pulse whose record length == PRI.
 
-        received_signal, _ = simulate_echoes(
-            pulse, self.sample_rate, targets, noise_std=noise_std
-        )
+        With a range gate only the gated span is simulated and compressed;
+        the received samples, filter output and time axis returned then
+        cover the gate, on the same time axis as the full-PRI outputs.
+        """
+        pri_samples = self.pri_samples
+        if self.range_gate is not None:
+            m = len(pulse)
+            received = self._simulate_records(pulse, targets, 1, noise_std)[0]
+            mf_output = self._compress(self.matched_filter_engine(pulse), received)
+            n_out = len(mf_output)
+            t = (self.output_offset(m) + np.arange(n_out)) / self.sample_rate
+            # Raw samples on the same time axis (zero past the simulated record)
+            received_signal = np.zeros(n_out, dtype=self.dtype)
+            shown = received[m // 2:m // 2 + n_out]
+            received_signal[:len(shown)] = shown
+            return received_signal, mf_output, t
 
-        # Force exactly one PRI of data (pad or truncate)
-        if len(received_signal) < pri_samples:
-            received_signal = np.pad(received_signal,
-                                     (0, pri_samples - len(received_signal)))
-        else:
-            received_signal = received_signal[:pri_samples]
-
-        mf_output = matched_filter(received_signal, pulse)
+        # Synthesize straight into exactly one PRI of data (zero beyond the record)
+        received_signal = np.empty(pri_samples, dtype=self.dtype)
+        simulate_into(received_signal, pulse, self.sample_rate, targets, noise_std=noise_std,
+                      carrier_freq=self.carrier_freq, rng=self.rng)
+        mf_output = self.matched_filter_engine(pulse)(received_signal)
         t = np.arange(pri_samples) / self.sample_rate
         return received_signal, mf_output, t
 
     
-    def coherent_integration(self, pulse, targets, noise_std=3e-7):
-        # """Perform coherent integration over multiple pulses."""
-        """Transmit *n_pulses* back-to-back at the chosen PRF and coherently add the matched-filter outputs."""
+    @profiled()
+    def coherent_integration(self, pulse, targets, noise_std=3e-7, keep_matrix=True, block_size=64,
+                             recorder=None, synthesis='time', mti=None):
+        """Transmit *n_pulses* back-to-back at the chosen PRF and coherently add the matched-filter outputs.
+
+        All pulses are synthesized into one (n_pulses, pri_samples) matrix and
+        matched-filtered along axis 1 in a single FFT call. With
+        ``keep_matrix=False`` the raw records are summed in blocks of
+        ``block_size`` pulses and compressed once (the matched filter is
+        linear), so the pulse matrix is never held in memory and ``None`` is
+        returned in place of ``rd_matrix``. If *recorder* (an ``IQWriter``,
+        see ``open_recording``) is given, every raw received record is
+        appended to it before compression.
+
+        With ``synthesis='frequency'`` the compressed range lines are
+        synthesized directly as |P(f)|²·H(f) (``radar.targets.compressed_echoes``):
+        fractional-sample delays, noise over the whole PRI, and no raw
+        records or matched filtering.
+
+        With a range gate only the gated span of every record is simulated
+        and it is compressed by overlap-save, so time and memory follow the
+        gate width; the range lines then cover just the gate (see
+        ``gate_lags``). Gating needs ``synthesis='time'`` and no recorder.
+
+        With *mti* ('2-pulse', '3-pulse' or FIR taps, see ``mti_filter``)
+        stationary clutter is cancelled across slow time in place on the
+        pulse matrix, ``rd_matrix`` holds the ``n_pulses - K + 1`` filtered
+        lines, and the returned profile is their non-coherent (magnitude)
+        sum: a coherent sum of canceller outputs would cancel moving echoes
+        too. This needs ``keep_matrix=True``.
+        """
         print(f"\nPerforming coherent integration over {self.n_pulses} pulses...")
         
-        range_lines = []
         start_time = time.time()
-        pri_samples = int(round(self.pri * self.sample_rate))
+        pri_samples = self.pri_samples
+        mf = self.matched_filter_engine(pulse)   # reference spectrum reused across CPIs
         
-        for i in range(self.n_pulses):
-            echoes, _ = simulate_echoes(pulse, self.sample_rate, targets, noise_std=noise_std)
-
-            if len(echoes) < pri_samples:                # pad / truncate
-                echoes = np.pad(echoes, (0, pri_samples - len(echoes)))
+        if synthesis not in ('time', 'frequency'):
+            raise ValueError(f"Unknown synthesis method: {synthesis}")
+        if mti is not None and not keep_matrix:
+            raise ValueError("MTI filtering requires keep_matrix=True")
+        if self.range_gate is not None and (synthesis != 'time' or recorder is not None):
+            raise ValueError("Range gating requires synthesis='time' and no recorder")
+        self._report_outside(targets, len(pulse))
+        if synthesis == 'frequency':
+            if recorder is not None:
+                raise ValueError("Recording raw I/Q requires synthesis='time'")
+            synthesize = lambda n_block, first, integrate: compressed_echoes(
+                pulse, self.sample_rate, targets, pri_samples, n_pulses=n_block,
+                noise_std=noise_std, first_pulse=first, pri=self.pri,
+                carrier_freq=self.carrier_freq, rng=self.rng, matched_filter=mf,
+                integrate=integrate)
+            if keep_matrix:
+                rd_matrix = synthesize(self.n_pulses, 0, False)
+                rd_matrix, integrated = self._integrate_matrix(rd_matrix, mti)
             else:
-                echoes = echoes[:pri_samples]
+                rd_matrix = None
+                integrated = 0
+                for first in range(0, self.n_pulses, block_size):
+                    integrated = integrated + synthesize(min(block_size, self.n_pulses - first),
+                                                         first, True)[0]
+        elif keep_matrix:
+            received = self._simulate_records(pulse, targets, self.n_pulses, noise_std)
+            if recorder is not None:
+                with stage('coherent_integration.record'):
+                    recorder.write(received)
+            rd_matrix = self._compress(mf, received)
+            del received
+            rd_matrix, integrated = self._integrate_matrix(rd_matrix, mti)
+        else:
+            rd_matrix = None
+            received_sum = 0
+            for first in range(0, self.n_pulses, block_size):
+                n_block = min(block_size, self.n_pulses - first)
+                block = self._simulate_records(pulse, targets, n_block, noise_std, first_pulse=first)
+                if recorder is not None:
+                    with stage('coherent_integration.record'):
+                        recorder.write(block)
+                with stage('coherent_integration.sum'):
+                    received_sum = received_sum + np.sum(block, axis=0)
+            integrated = self._compress(mf, received_sum)
+        
+        processing_time = time.time() - start_time
+        print(f"Processing completed in {processing_time:.2f} seconds")
+        
+        return integrated, rd_matrix
+    
+    def _integrate_matrix(self, rd_matrix, mti):
+        """Optionally MTI-filter *rd_matrix* in place, then sum it across pulses."""
+        if mti is None:
+            with stage('coherent_integration.sum'):
+                return rd_matrix, np.sum(rd_matrix, axis=0)
+        rd_matrix = mti_filter(rd_matrix, mti)
+        with stage('coherent_integration.sum'):
+            return rd_matrix, np.sum(np.abs(rd_matrix), axis=0)
+    
+    def open_recording(self, path, window='hanning', dtype='complex64'):
+        """Open an ``IQWriter`` at *path* whose header records this radar's parameters."""
+        return IQWriter(path, self.sample_rate, self.prf, dtype=dtype, metadata={
+            'bandwidth': self.bandwidth,
+            'pulse_duration': self.pulse_duration,
+            'window': window,
+            'carrier_freq': self.carrier_freq,
+            'n_pulses': self.n_pulses,
+        })
+    
+    @profiled()
+    def integrate_recording(self, reader, pulse, first=0, n_pulses=None, block_size=64):
+        """Coherently integrate recorded raw pulses from an ``IQReader``.
 
-            range_lines.append(matched_filter(echoes, pulse))
-            
-            # Progress indicator
-            if (i + 1) % 32 == 0:
-                print(f"  Processed {i + 1}/{self.n_pulses} pulses...")
+        Records *first* to *first + n_pulses* (default ``self.n_pulses``) are
+        summed straight from the memory map *block_size* at a time and
+        compressed once, so a capture larger than RAM can be replayed.
+        With a range gate only the gated span is compressed.
+        """
+        stop = min(first + (n_pulses or self.n_pulses), len(reader))
         
-        # Stack and integrate
-        rd_matrix = np.vstack(range_lines)
-        integrated = np.sum(rd_matrix, axis=0)
+        received_sum = np.zeros(reader.n_samples, dtype=self.dtype)
+        for start in range(first, stop, block_size):
+            received_sum += np.sum(reader[start:min(start + block_size, stop)], axis=0, dtype=self.dtype)
+        return self._compress_raw(self.matched_filter_engine(pulse), received_sum)
+    
+    @profiled()
+    def parallel_integration(self, pulse, targets, noise_std=3e-7, n_workers=None, backend='process',
+                             keep_matrix=True, seed=None):
+        """Coherent integration with the CPI's pulses split across *n_workers* processes or threads.
+
+        See ``radar.parallel.parallel_coherent_integration``; returns the same
+        ``(integrated, rd_matrix)`` pair as ``coherent_integration``. Without
+        an explicit *seed* the worker streams are seeded from ``self.rng``.
+        Range gating is not supported here; use ``coherent_integration``.
+        """
+        if self.range_gate is not None:
+            raise ValueError("parallel_integration does not support a range gate")
+        if seed is None:
+            seed = int(self.rng.integers(2**63))
+        print(f"\nPerforming parallel coherent integration over {self.n_pulses} pulses "
+              f"({n_workers or 'all'} {backend} workers)...")
+        start_time = time.time()
+        
+        integrated, rd_matrix = parallel_coherent_integration(
+            self, pulse, targets, noise_std=noise_std, n_workers=n_workers,
+            backend=backend, keep_matrix=keep_matrix, seed=seed,
+            bit_generator=self.bit_generator
+        )
         
         processing_time = time.time() - start_time
         print(f"Processing completed in {processing_time:.2f} seconds")
         
         return integrated, rd_matrix
     
-    def detect_targets(self, signal, echo_time, pulse_length, cfar_params=None):
-        """Detect targets using CA-CFAR."""
+    def stream_range_lines(self, pulse, targets, noise_std=3e-7, n_pulses=None, block_size=16):
+        """Yield matched-filtered range lines one pulse at a time.
+
+        Pulses are simulated and compressed *block_size* at a time, so memory
+        stays at O(block_size × pri_samples) however long the dwell (or the
+        gate width with a range gate). With ``n_pulses=None`` the stream
+        never ends.
+        """
+        mf = self.matched_filter_engine(pulse)
+        
+        first = 0
+        while n_pulses is None or first < n_pulses:
+            n_block = block_size if n_pulses is None else min(block_size, n_pulses - first)
+            block = self._simulate_records(pulse, targets, n_block, noise_std, first_pulse=first)
+            yield from self._compress(mf, block)
+            first += n_block
+    
+    def process_stream(self, range_lines, pulse_length, window=None, detect_every=None,
+                       cfar_params=None, pulse=None, mti=None):
+        """Integrate a stream of range lines and yield CA-CFAR detection events as they fall due.
+
+        *range_lines* may come from ``stream_range_lines`` or an external
+        source such as ``IQReader.range_lines``; if *pulse* is given they are
+        raw records and are matched-filtered first. Detection runs on the coherent sum of the last *window* pulses
+        (default ``n_pulses``) every *detect_every* pulses (default: once per
+        window). With *mti* each line first passes through a streaming MTI
+        canceller that keeps only the last few lines. See
+        ``radar.streaming.StreamProcessor``.
+        """
+        lags = self.gate_lags(pulse_length)
+        n_samples = self.pri_samples if lags is None else lags[1]
+        mf = None if pulse is None else self.matched_filter_engine(pulse)
+        processor = StreamProcessor(
+            n_samples, window or self.n_pulses,
+            detector=lambda line: self.detect_targets(line, None, pulse_length, cfar_params),
+            detect_every=detect_every,
+            dtype=self.dtype,
+            mti=mti
+        )
+        
+        for line in range_lines:
+            if mf is not None:
+                line = self._compress_raw(mf, line)
+            event = processor.push(line)
+            if event is not None:
+                yield event
+    
+    @profiled()
+    def detect_targets(self, signal, echo_time, pulse_length, cfar_params=None, refine=None,
+                       offset=None):
+        """Detect targets using CFAR.
+
+        *cfar_params* may hold a ``'variant'`` key selecting cell-averaging
+        ('ca', default), greatest-of ('go'), smallest-of ('so') or
+        ordered-statistic ('os', optional ``'rank'``) CFAR; the remaining
+        keys go to the detector. With *refine* ('parabolic', 'sinc' or
+        'fft', see ``refine_peaks``) the distances are interpolated between
+        samples around each detection instead of being quantized to c/(2·fs).
+        *offset* is the index of ``signal[0]`` in the full-PRI matched-filter
+        output (default: ``output_offset``, i.e. the start of the range gate);
+        the returned peaks index *signal* itself, one per distance.
+        """
         if cfar_params is None:
-            cfar_params = {
-                'num_train': 35,
-                'num_guard': 5,
-                'pfa': 8e-3,
-                'peak_guard': 1
-            }
+            cfar_params = DETECTION_CFAR
         
         # Detect peaks
-        peaks = ca_cfar_detector(signal, **cfar_params)
+        params = dict(cfar_params)
+        variant = params.pop('variant', 'ca')
+        if variant == 'ca':
+            peaks = ca_cfar_detector(signal, **params)
+        else:
+            peaks = np.flatnonzero(cfar_mask(signal, variant, **params))
+        
+        # Interpolate between samples around each hit
+        if refine is not None:
+            peaks_at = refine_peaks(signal, peaks, method=refine)
+        else:
+            peaks_at = peaks
         
-        # Correct for matched filter delay
-        correction_samples = pulse_length // 2
-        corrected_peaks = peaks - correction_samples
-        corrected_peaks = corrected_peaks[corrected_peaks >= 0]
+        # Correct for matched filter delay and the start of the range gate
+        if offset is None:
+            offset = self.output_offset(pulse_length)
+        correction_samples = pulse_length // 2 - offset
+        corrected_peaks = peaks_at - correction_samples
         
         # Convert to distance
         peak_times = corrected_peaks / self.sample_rate
         distances = (peak_times * self.c) / 2
         
-        return peaks, distances
+        # Drop detections before time zero or in the margin around a range gate;
+        # peaks and distances stay aligned
+        keep = (corrected_peaks >= 0) & self.in_gate(distances)
+        return peaks[keep], distances[keep]
     
-    def analyze_performance(self, true_targets, detected_distances):
-        """Analyze detection performance."""
+    @profiled()
+    def range_doppler_processing(self, rd_matrix, pulse_length, window='hanning', cfar_params=None,
+                                 offset=None):
+        """Form the range-Doppler map of a CPI and detect targets in it with 2-D CA-CFAR.
+
+        Returns the map, its velocity axis (one entry per row) and the range
+        and radial velocity (positive = closing) of each detection. *offset*
+        is as for ``detect_targets``.
+        """
+        if cfar_params is None:
+            cfar_params = RANGE_DOPPLER_CFAR
+        
+        rd_map = range_doppler_map(rd_matrix, window=window)
+        velocity_axis = doppler_frequencies(rd_matrix.shape[0], self.prf) * self.wavelength / 2
+        
+        doppler_bins, range_bins = ca_cfar_2d(rd_map, **cfar_params)
+        order = np.argsort(range_bins, kind='stable')
+        doppler_bins, range_bins = doppler_bins[order], range_bins[order]
+        
+        # Correct for matched filter delay and the range gate, and convert to distance
+        if offset is None:
+            offset = self.output_offset(pulse_length)
+        range_bins = range_bins + offset - pulse_length // 2
+        distances = (range_bins / self.sample_rate * self.c) / 2
+        keep = (range_bins >= 0) & self.in_gate(distances)
+        distances = distances[keep]
+        velocities = velocity_axis[doppler_bins[keep]]
+        
+        return rd_map, velocity_axis, distances, velocities
+    
+    def track_targets(self, pulse, targets, n_cpis, tracker=None, noise_std=3e-7, cfar_params=None):
+        """Run *n_cpis* consecutive CPIs and feed their range-Doppler detections to a tracker.
+
+        Moving targets keep walking between CPIs (range ``R0 - v·t`` at the
+        start of each CPI). *tracker* defaults to an alpha-beta
+        ``radar.tracking.RangeTracker`` updated once per CPI. Returns the
+        tracker and the confirmed tracks after every CPI.
+        """
+        cpi = self.n_pulses * self.pri
+        if tracker is None:
+            tracker = RangeTracker(dt=cpi)
+        ranges, velocities, rcs = split_scatterers(targets)
+        
+        history = []
+        for k in range(n_cpis):
+            scene = np.column_stack([ranges - velocities * k * cpi, velocities, rcs])
+            _, rd_matrix = self.coherent_integration(pulse, scene, noise_std=noise_std)
+            _, _, distances, radial_velocities = self.range_doppler_processing(
+                rd_matrix, len(pulse), cfar_params=cfar_params)
+            history.append(tracker.update(distances, radial_velocities))
+        return tracker, history
+    
+    def analyze_performance(self, true_targets, detected_distances, refined_distances=None, gate=None):
+        """Analyze detection performance.
+
+        Detections are matched to targets within *gate* meters (default:
+        one range resolution cell) by ``radar.scoring.score_detections``, so
+        missed targets and false alarms are reported instead of assuming
+        the detections line up with the targets. If *refined_distances*
+        (from ``detect_targets(..., refine=...)``) are given, their errors
+        and the RMSE change from the sample-quantized distances are
+        reported too. With a range gate only the targets inside it are
+        scored. Returns the score of *detected_distances*.
+        """
         print("\n" + "="*50)
         print("PERFORMANCE ANALYSIS")
         print("="*50)
@@ -119,17 +574,39 @@ class RadarSimulator:
         # Convert to numpy arrays for easier manipulation
         true_targets = np.array(true_targets)
         detected_distances = np.array(detected_distances)
+        gate = self.range_resolution if gate is None else gate
+        inside = self.in_gate(true_targets)
+        if not inside.all():
+            print(f"\nScoring the {np.count_nonzero(inside)} of {len(true_targets)} targets inside the range gate")
+            true_targets = true_targets[inside]
         
         print(f"\nTrue target ranges (m): {true_targets}")
         print(f"Detected ranges (m): {detected_distances}")
         
         # Match detections to true targets
-        if len(detected_distances) == len(true_targets):
-            errors = detected_distances - true_targets
-            print(f"\nRange errors (m): {errors}")
-            print(f"Mean error: {np.mean(errors):.2f} m")
-            print(f"RMS error: {np.sqrt(np.mean(errors**2)):.2f} m")
+        score = score_detections(true_targets, detected_distances, gate)
+        print(f"\nTargets detected: {score['n_hits']}/{len(true_targets)}, "
+              f"missed: {score['n_missed']}, false alarms: {score['n_false']}")
+        if score['n_missed']:
+            print(f"Missed targets (m): {true_targets[score['detection'] < 0]}")
+        if score['n_false']:
+            print(f"False alarms (m): {detected_distances[score['target'] < 0]}")
+        
+        if score['n_hits']:
+            # Errors of the matched targets only; misses are listed above
+            print(f"\nRange errors (m): {score['error'][score['detection'] >= 0]}")
+            print(f"Mean error: {score['mean_error']:.2f} m")
+            rms_error = score['range_rmse']
+            print(f"RMS error: {rms_error:.2f} m")
             
-        else:
-            print(f"\nWarning: Detected {len(detected_distances)} targets, "
-                  f"expected {len(true_targets)}")
+            if refined_distances is not None:
+                refined = score_detections(true_targets, refined_distances, gate)
+                if refined['n_hits']:
+                    refined_rms = refined['range_rmse']
+                    refined_errors = refined['error'][refined['detection'] >= 0]
+                    print(f"\nRefined range errors (m): {np.round(refined_errors, 3)}")
+                    change = refined_rms - rms_error
+                    verdict = 'better' if change < 0 else 'worse' if change > 0 else 'unchanged'
+                    print(f"Refined RMS error: {refined_rms:.3f} m "
+                          f"(ΔRMSE = {change:+.3f} m, {verdict})")
+        return score
@@ -0,0 +1,172 @@
+import math
+import numpy as np
+from typing import Optional, Tuple
+
+from radar.noise import Seed, make_rng
+
+# Preset scatterer populations for generate_scenario
+SCENARIO_PRESETS = {
+    # Distributed ground clutter: dense, nearly stationary (internal motion
+    # of vegetation), spiky Weibull RCS
+    'ground_clutter': {
+        'density': 2.0,
+        'rcs_model': 'weibull',
+        'rcs_mean': 1e-2,
+        'rcs_shape': 1.5,
+        'velocity_std': 0.1,
+    },
+    # Random field of independent Swerling I targets
+    'target_field': {
+        'density': 0.01,
+        'rcs_model': 'exponential',
+        'rcs_mean': 1.0,
+        'velocity_std': 15.0,
+    },
+    # Swarm of small drones: tight range cluster with a common velocity
+    'swarm': {
+        'density': 0.05,
+        'range_spread': 50.0,
+        'rcs_model': 'chi2',
+        'rcs_mean': 1e-2,
+        'velocity_mean': 10.0,
+        'velocity_std': 1.0,
+    },
+}
+
+
+def draw_rcs(rng: np.random.Generator,
+             n_scatterers: int,
+             model: str = 'exponential',
+             mean: float = 1.0,
+             shape: Optional[float] = None) -> np.ndarray:
+    """
+    Draw radar cross-sections (m²) from a fluctuation model.
+
+    Parameters
+    ----------
+    rng : np.random.Generator
+        Random generator to draw from.
+    n_scatterers : int
+        Number of values.
+    model : str
+        'constant', 'exponential' (Swerling I/II), 'chi2' (Swerling III/IV,
+        4 degrees of freedom), 'lognormal' (``shape`` = σ of ln RCS,
+        default 1) or 'weibull' (``shape`` = Weibull shape, default 2).
+    mean : float
+        Mean RCS in m².
+    shape : float, optional
+        Shape parameter of the lognormal and Weibull models.
+
+    Returns
+    -------
+    np.ndarray
+        RCS values with the requested mean.
+    """
+    model = model.lower()
+    if model == 'constant':
+        return np.full(n_scatterers, float(mean))
+    elif model == 'exponential':
+        return rng.exponential(mean, n_scatterers)
+    elif model == 'chi2':
+        return rng.gamma(2.0, mean / 2, n_scatterers)
+    elif model == 'lognormal':
+        sigma = 1.0 if shape is None else shape
+        return rng.lognormal(np.log(mean) - sigma**2 / 2, sigma, n_scatterers)
+    elif model == 'weibull':
+        k = 2.0 if shape is None else shape
+        return mean / math.gamma(1 + 1/k) * rng.weibull(k, n_scatterers)
+    raise ValueError(f"Unknown RCS model: {model}")
+
+
+def generate_scatterers(n_scatterers: Optional[int] = None,
+                        density: Optional[float] = None,
+                        range_extent: Tuple[float, float] = (1000.0, 20000.0),
+                        range_spread: Optional[float] = None,
+                        rcs_model: str = 'exponential',
+                        rcs_mean: float = 1.0,
+                        rcs_shape: Optional[float] = None,
+                        velocity_mean: float = 0.0,
+                        velocity_std: float = 0.0,
+                        seed: Seed = None) -> np.ndarray:
+    """
+    Generate a random population of point scatterers.
+
+    Parameters
+    ----------
+    n_scatterers : int, optional
+        Number of scatterers. Either this or ``density`` is required.
+    density : float, optional
+        Scatterers per meter of range extent.
+    range_extent : tuple of float
+        (min_range, max_range) in meters.
+    range_spread : float, optional
+        If given, ranges are Gaussian with this standard deviation around
+        the middle of ``range_extent`` (a cluster) and clipped to it;
+        otherwise they are uniform over the extent.
+    rcs_model, rcs_mean, rcs_shape
+        RCS fluctuation model, see ``draw_rcs``.
+    velocity_mean, velocity_std : float
+        Gaussian radial velocity in m/s (positive = closing).
+    seed : int or SeedSequence, optional
+        Seed for a reproducible population.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (N, 3) with columns (range, radial_velocity, rcs),
+        sorted by range; accepted anywhere a target list is.
+    """
+    min_range, max_range = range_extent
+    if n_scatterers is None:
+        if density is None:
+            raise ValueError("Specify n_scatterers or density")
+        n_scatterers = int(round(density * (max_range - min_range)))
+
+    rng = make_rng(seed)
+    if range_spread is None:
+        ranges = rng.uniform(min_range, max_range, n_scatterers)
+    else:
+        centre = (min_range + max_range) / 2
+        ranges = np.clip(rng.normal(centre, range_spread, n_scatterers), min_range, max_range)
+    velocities = velocity_mean + velocity_std * rng.standard_normal(n_scatterers)
+    rcs = draw_rcs(rng, n_scatterers, rcs_model, rcs_mean, rcs_shape)
+
+    scatterers = np.column_stack([ranges, velocities, rcs])
+    return scatterers[np.argsort(ranges, kind='stable')]
+
+
+def generate_scenario(kind: str,
+                      n_scatterers: Optional[int] = None,
+                      range_extent: Tuple[float, float] = (1000.0, 20000.0),
+                      seed: Seed = None,
+                      **overrides) -> np.ndarray:
+    """
+    Generate one of the preset large-scale scenarios.
+
+    Parameters
+    ----------
+    kind : str
+        'ground_clutter', 'target_field' or 'swarm' (see ``SCENARIO_PRESETS``).
+    n_scatterers : int, optional
+        Number of scatterers; defaults to the preset density over the extent.
+    range_extent : tuple of float
+        (min_range, max_range) in meters.
+    seed : int or SeedSequence, optional
+        Seed for a reproducible population.
+    **overrides
+        Any other ``generate_scatterers`` parameter.
+
+    Returns
+    -------
+    np.ndarray
+        (N, 3) array of (range, radial_velocity, rcs).
+    """
+    try:
+        params = dict(SCENARIO_PRESETS[kind])
+    except KeyError:
+        raise ValueError(f"Unknown scenario: {kind}") from None
+    params.update(overrides)
+    if n_scatterers is not None:
+        params.pop('density', None)
+    return generate_scatterers(n_scatterers=n_scatterers, range_extent=range_extent,
+                               seed=seed, **params)
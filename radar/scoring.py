@@ -0,0 +1,191 @@
+import numpy as np
+from typing import Dict, Optional, Sequence
+
+
+def trial_index_from_offsets(offsets: np.ndarray) -> np.ndarray:
+    """Trial number of every detection for the ``detections[offsets[i]:offsets[i + 1]]`` layout."""
+    offsets = np.asarray(offsets)
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def score_trials(true_ranges: np.ndarray,
+                 detections: np.ndarray,
+                 trial_index: Optional[np.ndarray] = None,
+                 n_trials: Optional[int] = None,
+                 gate: float = 7.5) -> Dict[str, np.ndarray]:
+    """
+    Score the detections of many trials against the same truth in bulk.
+
+    A sorted merge: the true ranges are sorted once and every detection
+    finds its nearest target with ``np.searchsorted``; a detection farther
+    than ``gate`` from it is a false alarm. Among the detections that claim
+    the same target in the same trial, the closest is the hit and the
+    others are false alarms. Every step is a whole-array operation, so
+    millions of trials cost a few sorts of the flattened detections. Each
+    detection is matched to at most one target; for targets closer together
+    than the gate, use ``score_detections(..., method='optimal')``.
+
+    Parameters
+    ----------
+    true_ranges : np.ndarray
+        True target ranges in meters (any order).
+    detections : np.ndarray
+        Detected ranges of all trials, flattened.
+    trial_index : np.ndarray, optional
+        Trial of each detection (see ``trial_index_from_offsets``); all
+        detections belong to trial 0 if omitted.
+    n_trials : int, optional
+        Number of trials (default: highest trial index + 1), so trials
+        without any detection are counted.
+    gate : float
+        Maximum |detected - true| range of a hit in meters.
+
+    Returns
+    -------
+    dict
+        'hit' (n_trials, n_targets) bool, 'error' (n_trials, n_targets)
+        signed detected - true range (NaN on a miss), 'detection'
+        (n_trials, n_targets) index into ``detections`` (-1 on a miss),
+        'target' (n_detections,) matched target index (-1 = false alarm),
+        and per-trial 'n_detections' and 'false_alarms'. Target columns
+        follow the order of ``true_ranges``.
+    """
+    true_ranges = np.asarray(true_ranges, dtype=float)
+    detections = np.asarray(detections, dtype=float)
+    if trial_index is None:
+        trial_index = np.zeros(len(detections), dtype=np.intp)
+    trial_index = np.asarray(trial_index, dtype=np.intp)
+    if n_trials is None:
+        n_trials = int(trial_index.max()) + 1 if len(trial_index) else 1
+    n_targets = len(true_ranges)
+
+    hit = np.zeros((n_trials, n_targets), dtype=bool)
+    error = np.full((n_trials, n_targets), np.nan)
+    matched_detection = np.full((n_trials, n_targets), -1, dtype=np.intp)
+    target = np.full(len(detections), -1, dtype=np.intp)
+
+    if n_targets and len(detections):
+        # Nearest target of every detection: compare the neighbours either side
+        order = np.argsort(true_ranges, kind='stable')
+        sorted_truth = true_ranges[order]
+        right = np.clip(np.searchsorted(sorted_truth, detections), 0, n_targets - 1)
+        left = np.clip(right - 1, 0, n_targets - 1)
+        take_left = np.abs(detections - sorted_truth[left]) <= np.abs(detections - sorted_truth[right])
+        nearest = np.where(take_left, left, right)
+        distance = np.abs(detections - sorted_truth[nearest])
+
+        # Closest gated detection per (trial, target)
+        candidates = np.flatnonzero(distance <= gate)
+        key = trial_index[candidates] * n_targets + nearest[candidates]
+        by_key = np.lexsort((distance[candidates], key))
+        first = np.ones(len(by_key), dtype=bool)
+        first[1:] = key[by_key][1:] != key[by_key][:-1]
+        winners = candidates[by_key[first]]
+
+        trials, columns = trial_index[winners], order[nearest[winners]]
+        hit[trials, columns] = True
+        error[trials, columns] = detections[winners] - true_ranges[columns]
+        matched_detection[trials, columns] = winners
+        target[winners] = columns
+
+    n_detections = np.bincount(trial_index, minlength=n_trials)
+    false_alarms = np.bincount(trial_index[target < 0], minlength=n_trials)
+    return {
+        'hit': hit,
+        'error': error,
+        'detection': matched_detection,
+        'target': target,
+        'n_detections': n_detections,
+        'false_alarms': false_alarms,
+    }
+
+
+def summarize_trials(scores: Dict[str, np.ndarray]) -> Dict[str, object]:
+    """
+    Reduce ``score_trials`` output to Pd, false alarms and range errors.
+
+    Returns
+    -------
+    dict
+        'pd' and 'range_rmse' per target, overall 'mean_error' and
+        'range_rmse' (m) over all hits, and 'false_alarms_per_trial'.
+    """
+    hit, error = scores['hit'], scores['error']
+    hits_per_target = hit.sum(axis=0)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        target_rmse = np.sqrt(np.nansum(error**2, axis=0) / hits_per_target)
+    all_errors = error[hit]
+    return {
+        'pd': hits_per_target / len(hit) if len(hit) else np.zeros(hit.shape[1]),
+        'range_rmse_per_target': target_rmse,
+        'mean_error': float(np.mean(all_errors)) if len(all_errors) else float('nan'),
+        'range_rmse': float(np.sqrt(np.mean(all_errors**2))) if len(all_errors) else float('nan'),
+        'false_alarms_per_trial': float(np.mean(scores['false_alarms'])),
+    }
+
+
+def score_detections(true_ranges: Sequence[float],
+                     detected: Sequence[float],
+                     gate: float = 7.5,
+                     method: str = 'nearest') -> Dict[str, object]:
+    """
+    Match one set of detections to the true targets.
+
+    Parameters
+    ----------
+    true_ranges : sequence of float
+        True target ranges in meters.
+    detected : sequence of float
+        Detected ranges in meters.
+    gate : float
+        Maximum |detected - true| range of a hit in meters.
+    method : str
+        'nearest' (sorted merge, see ``score_trials``) or 'optimal'
+        (Hungarian assignment with ``scipy.optimize.linear_sum_assignment``:
+        the most hits, then the smallest total error; resolves detections
+        between closely spaced targets).
+
+    Returns
+    -------
+    dict
+        'detection' (per target, index into ``detected`` or -1), 'target'
+        (per detection, index into ``true_ranges`` or -1), 'error' (per
+        target, NaN on a miss), and 'n_hits', 'n_missed', 'n_false',
+        'mean_error', 'range_rmse'.
+    """
+    true_ranges = np.asarray(true_ranges, dtype=float)
+    detected = np.asarray(detected, dtype=float)
+
+    if method == 'nearest':
+        scores = score_trials(true_ranges, detected, n_trials=1, gate=gate)
+        detection, target, error = scores['detection'][0], scores['target'], scores['error'][0]
+    elif method == 'optimal':
+        from scipy.optimize import linear_sum_assignment   # deferred: scipy.optimize is slow to import
+        detection = np.full(len(true_ranges), -1, dtype=np.intp)
+        target = np.full(len(detected), -1, dtype=np.intp)
+        error = np.full(len(true_ranges), np.nan)
+        if len(true_ranges) and len(detected):
+            distance = np.abs(np.subtract.outer(true_ranges, detected))
+            # Out-of-gate pairs cost more than any set of gated pairs, so the
+            # number of hits is maximized before the total error is minimized
+            forbidden = gate * (len(true_ranges) + len(detected)) + 1.0
+            rows, cols = linear_sum_assignment(np.where(distance <= gate, distance, forbidden))
+            ok = distance[rows, cols] <= gate
+            rows, cols = rows[ok], cols[ok]
+            detection[rows] = cols
+            target[cols] = rows
+            error[rows] = detected[cols] - true_ranges[rows]
+    else:
+        raise ValueError(f"Unknown scoring method: {method}")
+
+    matched = error[detection >= 0]
+    return {
+        'detection': detection,
+        'target': target,
+        'error': error,
+        'n_hits': int(np.count_nonzero(detection >= 0)),
+        'n_missed': int(np.count_nonzero(detection < 0)),
+        'n_false': int(np.count_nonzero(target < 0)),
+        'mean_error': float(np.mean(matched)) if len(matched) else float('nan'),
+        'range_rmse': float(np.sqrt(np.mean(matched**2))) if len(matched) else float('nan'),
+    }
@@ -1,9 +1,307 @@
+import functools
 import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+from scipy import fft as sp_fft
+from typing import Callable, Dict, Optional, Tuple
 
+from radar.simulator import window_function
+from radar.profiling import profiled
 
+
+def _zero_round_off(output: np.ndarray, nfft: int, axis: int = -1) -> np.ndarray:
+    """
+    Set FFT round-off to exactly zero where a record holds no signal.
+
+    Fast convolution leaves residue of about ``eps * max|y|`` in cells that
+    direct convolution makes exactly zero. CFAR would read that residue as
+    a noise floor and detect against it in noise-free records. Cells below
+    ``eps * sqrt(nfft) * max|y|``, with the maximum taken along ``axis``
+    (one record), are zeroed in place.
+    """
+    if output.shape[axis] == 0:
+        return output
+    magnitude = np.abs(output)
+    floor = np.finfo(magnitude.dtype).eps * np.sqrt(nfft) * magnitude.max(axis=axis, keepdims=True)
+    output[magnitude < floor] = 0
+    return output
+
+
+class MatchedFilter:
+    """
+    Frequency-domain matched filter with a cached reference spectrum.
+
+    The time-reversed, conjugated pulse is transformed once per record
+    length at a fast FFT size (``scipy.fft.next_fast_len``) and reused for
+    every subsequent range line. Filtering then costs one forward and one
+    inverse FFT instead of an O(N·M) direct convolution.
+
+    The output is aligned exactly like ``np.convolve(..., mode='same')``, so
+    the ``pulse_length // 2`` delay correction used in detection still holds.
+
+    Parameters
+    ----------
+    pulse : np.ndarray
+        The transmitted radar pulse (reference signal).
+    normalize : bool, optional
+        If True, normalize the output by the pulse energy. Default is True.
+    spectrum_source : callable, optional
+        ``spectrum_source(nfft)`` returns the final reference spectrum at
+        that FFT size (already divided by the pulse energy if ``normalize``),
+        e.g. a read-only array from a ``WaveformCache``. It is used as is
+        instead of being computed here.
+    pulse_energy : float, optional
+        Precomputed pulse energy.
+    """
+
+    def __init__(self, pulse: np.ndarray, normalize: bool = True,
+                 spectrum_source: Optional[Callable[[int], np.ndarray]] = None,
+                 pulse_energy: Optional[float] = None):
+        self.pulse = np.asarray(pulse)
+        self.normalize = normalize
+        self.pulse_energy = np.sum(np.abs(self.pulse)**2) if pulse_energy is None else pulse_energy
+        self._spectrum_source = spectrum_source
+        self._references: Dict[int, Tuple[int, np.ndarray]] = {}
+        self._spectra: Dict[int, np.ndarray] = {}
+
+    def spectrum(self, nfft: int) -> np.ndarray:
+        """Reference spectrum (normalized if requested) at FFT size ``nfft``."""
+        spectrum = self._spectra.get(nfft)
+        if spectrum is None:
+            if self._spectrum_source is not None:
+                spectrum = self._spectrum_source(nfft)
+            else:
+                spectrum = sp_fft.fft(np.conjugate(self.pulse[::-1]), nfft)
+                if self.normalize:
+                    spectrum /= self.pulse_energy
+            self._spectra[nfft] = spectrum
+        return spectrum
+
+    def reference(self, n_samples: int) -> Tuple[int, np.ndarray]:
+        """Return ``(nfft, spectrum)`` of the reference for records of ``n_samples``."""
+        ref = self._references.get(n_samples)
+        if ref is None:
+            nfft = sp_fft.next_fast_len(n_samples + len(self.pulse) - 1)
+            ref = (nfft, self.spectrum(nfft))
+            self._references[n_samples] = ref
+        return ref
+
+    @profiled()
+    def __call__(self, received_signal: np.ndarray,
+                 n_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Matched-filter ``received_signal`` along its last axis.
+
+        A 2-D input of shape (n_pulses, n_samples) is compressed in a single
+        batched FFT call.
+
+        Parameters
+        ----------
+        received_signal : np.ndarray
+            Received record(s), filtered along the last axis.
+        n_samples : int, optional
+            Record length to produce. A shorter input is treated as if it
+            were zero-padded to this length (without copying it), and the
+            output beyond the support of the input is exactly zero, as with
+            direct convolution. Defaults to the input length.
+        """
+        received_signal = np.asarray(received_signal)
+        n_in = received_signal.shape[-1]
+        n = n_in if n_samples is None else n_samples
+        if n_in > n:
+            raise ValueError(f"Record of {n_in} samples exceeds n_samples={n}")
+        m = len(self.pulse)
+        nfft, spectrum = self.reference(n)
+
+        spec = sp_fft.fft(received_signal, nfft, axis=-1)
+        output = self.compress_spectrum(spec, n)
+        if n_in < n:
+            start = (min(n, m) - 1) // 2
+            output[..., max(n_in + m - 1 - start, 0):] = 0
+
+        if not (np.iscomplexobj(received_signal) or np.iscomplexobj(self.pulse)):
+            output = output.real
+        return output
+
+    @profiled()
+    def overlap_save(self, received_signal: np.ndarray,
+                     nfft: Optional[int] = None,
+                     n_outputs: Optional[int] = None) -> np.ndarray:
+        """
+        Matched-filter output at the fully overlapping lags only.
+
+        Output ``i`` correlates the pulse with ``received_signal[..., i:i + m]``,
+        so an echo delayed by ``i`` samples into the input peaks at index
+        ``i`` and there are ``n_in - m + 1`` outputs. This is what a range
+        gate needs: the input is just the gated span plus ``m - 1`` samples,
+        and cost and memory follow the gate width, not the PRI.
+
+        The input is cut into segments of ``nfft`` samples overlapping by
+        ``m - 1``. All segments are transformed in one batched FFT, and the
+        first ``m - 1`` (circularly wrapped) outputs of each are discarded.
+
+        Parameters
+        ----------
+        received_signal : np.ndarray
+            Received span(s), filtered along the last axis.
+        nfft : int, optional
+            Segment FFT size (default: one segment covering the input).
+        n_outputs : int, optional
+            Number of outputs to produce. A shorter input is treated as if
+            it were zero-padded, and outputs past its end are exactly zero,
+            as with ``__call__``. Defaults to ``n_in - m + 1``.
+        """
+        received_signal = np.asarray(received_signal)
+        m = len(self.pulse)
+        n_in = received_signal.shape[-1]
+        n_out = n_in - m + 1 if n_outputs is None else n_outputs
+        if n_out < 1:
+            raise ValueError(f"Span of {n_in} samples is shorter than the {m}-sample pulse")
+        if n_in < n_out + m - 1:
+            pad = [(0, 0)] * (received_signal.ndim - 1) + [(0, n_out + m - 1 - n_in)]
+            output = self.overlap_save(np.pad(received_signal, pad), nfft)
+            output[..., n_in:] = 0
+            return output
+        n_in = n_out + m - 1   # ignore samples past the last requested output
+        received_signal = received_signal[..., :n_in]
+        nfft = sp_fft.next_fast_len(n_in) if nfft is None else nfft
+        if nfft < m:
+            raise ValueError(f"nfft={nfft} is shorter than the {m}-sample pulse")
+
+        step = nfft - m + 1
+        n_segments = -(-n_out // step)
+        padded_length = (n_segments - 1) * step + nfft
+        if n_segments == 1:
+            segments = received_signal[..., None, :]
+        else:
+            if padded_length > n_in:
+                pad = [(0, 0)] * (received_signal.ndim - 1) + [(0, padded_length - n_in)]
+                received_signal = np.pad(received_signal, pad)
+            segments = sliding_window_view(received_signal, nfft, axis=-1)[..., ::step, :]
+
+        spectrum = sp_fft.fft(segments, nfft, axis=-1)
+        spectrum *= self.spectrum(nfft)
+        output = sp_fft.ifft(spectrum, axis=-1, overwrite_x=True)[..., m - 1:]
+        output = output.reshape(output.shape[:-2] + (-1,))[..., :n_out]
+        _zero_round_off(output, nfft)
+
+        if not (np.iscomplexobj(received_signal) or np.iscomplexobj(self.pulse)):
+            output = output.real
+        return output
+
+    def compress_spectrum(self, spectrum: np.ndarray, n_samples: int) -> np.ndarray:
+        """
+        Matched-filter output from the ``nfft``-point spectrum of the record(s).
+
+        ``spectrum`` (last axis of length ``reference(n_samples)[0]``) is
+        multiplied by the reference in place and inverse transformed; the
+        output has the same alignment as ``__call__``.
+        """
+        m = len(self.pulse)
+        _, reference = self.reference(n_samples)
+        spectrum *= reference
+        output = sp_fft.ifft(spectrum, axis=-1, overwrite_x=True)
+
+        # Same centring as np.convolve(mode='same')
+        start = (min(n_samples, m) - 1) // 2
+        return _zero_round_off(output[..., start:start + max(n_samples, m)], spectrum.shape[-1])
+
+
+class MatchedFilterBank:
+    """
+    Matched filter against several references in one batched FFT.
+
+    The reference spectra (e.g. up- and down-chirps, different bandwidths,
+    phase codes, or Doppler-shifted copies of one pulse) are stacked into
+    an (n_references, nfft) matrix once per record length. A record is then
+    transformed once, multiplied by the whole stack in a single 2-D
+    broadcast and inverse transformed along the last axis.
+
+    Each row is aligned exactly like ``MatchedFilter`` for its own
+    reference: the 'same'-mode start offset of every reference is folded
+    into its stacked spectrum as a linear phase, so all rows are taken from
+    the same output slice and a target's peak sits at
+    ``delay + len(reference_k) // 2`` in row ``k``.
+
+    Parameters
+    ----------
+    references : sequence of MatchedFilter or np.ndarray
+        Reference waveforms. ``MatchedFilter`` objects (e.g. from
+        ``RadarSimulator.matched_filter_engine``) contribute their cached
+        reference spectra; arrays (or the rows of a 2-D array) are wrapped
+        in new filters.
+    normalize : bool, optional
+        Normalize each row by its reference energy (for array references).
+        Default is True.
+    """
+
+    def __init__(self, references, normalize: bool = True):
+        self.filters = [ref if isinstance(ref, MatchedFilter) else MatchedFilter(ref, normalize=normalize)
+                        for ref in references]
+        if not self.filters:
+            raise ValueError("MatchedFilterBank needs at least one reference")
+        self.lengths = np.array([len(f.pulse) for f in self.filters])
+        self._stacks: Dict[int, Tuple[int, np.ndarray]] = {}
+
+    def __len__(self) -> int:
+        return len(self.filters)
+
+    def reference(self, n_samples: int) -> Tuple[int, np.ndarray]:
+        """Return ``(nfft, stacked spectra)`` for records of ``n_samples``."""
+        stack = self._stacks.get(n_samples)
+        if stack is None:
+            nfft = sp_fft.next_fast_len(n_samples + int(self.lengths.max()) - 1)
+            starts = (np.minimum(n_samples, self.lengths) - 1) // 2
+            # Advancing row k by starts[k] samples: multiply by exp(+j2π·f·start/nfft)
+            advance = np.exp(2j * np.pi * np.outer(starts, np.arange(nfft)) / nfft)
+            spectra = np.stack([f.spectrum(nfft) for f in self.filters])
+            stack = (nfft, (spectra * advance).astype(spectra.dtype, copy=False))
+            self._stacks[n_samples] = stack
+        return stack
+
+    @profiled()
+    def __call__(self, received_signal: np.ndarray,
+                 n_samples: Optional[int] = None) -> np.ndarray:
+        """
+        Matched-filter ``received_signal`` against every reference.
+
+        Parameters
+        ----------
+        received_signal : np.ndarray
+            Record of shape (n_samples,) or records of shape
+            (n_pulses, n_samples).
+        n_samples : int, optional
+            Record length to produce (a shorter input is zero-padded), as
+            for ``MatchedFilter``. Defaults to the input length.
+
+        Returns
+        -------
+        np.ndarray
+            Shape (n_references, n_out), or (n_pulses, n_references, n_out)
+            for 2-D input, with ``n_out = max(n_samples, longest reference)``.
+        """
+        received_signal = np.asarray(received_signal)
+        n_in = received_signal.shape[-1]
+        n = n_in if n_samples is None else n_samples
+        if n_in > n:
+            raise ValueError(f"Record of {n_in} samples exceeds n_samples={n}")
+        nfft, stack = self.reference(n)
+
+        spec = sp_fft.fft(received_signal, nfft, axis=-1)
+        products = spec[..., None, :] * stack
+        output = sp_fft.ifft(products, axis=-1, overwrite_x=True)
+        output = _zero_round_off(output[..., :max(n, int(self.lengths.max()))], nfft)
+        if n_in < n:
+            starts = (np.minimum(n, self.lengths) - 1) // 2
+            for k, (m, start) in enumerate(zip(self.lengths, starts)):
+                output[..., k, max(n_in + m - 1 - start, 0):] = 0
+        return output
+
+
+@profiled()
 def matched_filter(received_signal: np.ndarray, 
                   pulse: np.ndarray,
-                  normalize: bool = True) -> np.ndarray:
+                  normalize: bool = True,
+                  method: str = 'fft') -> np.ndarray:
     """
     Apply matched filtering to detect echoes in the received signal.
     
@@ -20,12 +318,20 @@ def matched_filter(received_signal: np.ndarray,
         The transmitted radar pulse (reference signal).
     normalize : bool, optional
         If True, normalize the output by the pulse energy. Default is True.
+    method : str, optional
+        'fft' for fast convolution via ``MatchedFilter`` or 'direct' for
+        time-domain ``np.convolve``. Both give the same output (default 'fft').
     
     Returns
     -------
     np.ndarray
         Matched filter output with same length as received_signal.
     """
+    if method == 'fft':
+        return MatchedFilter(pulse, normalize=normalize)(received_signal)
+    if method != 'direct':
+        raise ValueError(f"Unknown matched filter method: {method}")
+
     # Time-reverse and conjugate the pulse
     matched_pulse = np.conjugate(pulse[::-1])
     
@@ -40,11 +346,189 @@ def matched_filter(received_signal: np.ndarray,
     return output
 
 
+def ca_cfar_mask(signal: np.ndarray,
+                 num_train: int = 35,
+                 num_guard: int = 5,
+                 pfa: float = 1e-3,
+                 peak_guard: int = 2) -> np.ndarray:
+    """
+    Vectorized CA-CFAR detection mask along the last axis of ``signal``.
+
+    Training-cell sums come from a single cumulative sum of the magnitude,
+    so every cell under test is thresholded at once, and the local-maximum
+    test is one sliding maximum filter. A 2-D input (e.g. a batch of range
+    lines) is processed row by row in the same array operations.
+
+    Parameters are as for ``ca_cfar_detector``.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with the shape of ``signal``; True at detected peaks.
+    """
+    return _window_sum_cfar_mask(signal, num_train, num_guard, pfa, peak_guard, 'ca')
+
+
+def _training_sums(abs_signal: np.ndarray, num_train: int,
+                   num_guard: int) -> Tuple[np.ndarray, np.ndarray]:
+    """Left and right training-window sums for cells edge .. n-edge-1."""
+    n = abs_signal.shape[-1]
+    edge = num_train + num_guard
+
+    # csum[..., i] = sum(abs_signal[..., :i]); accumulate in float64 so
+    # single-precision input keeps an accurate noise estimate
+    csum = np.zeros(abs_signal.shape[:-1] + (n + 1,))
+    np.cumsum(abs_signal, axis=-1, out=csum[..., 1:])
+
+    left = csum[..., num_train:n - edge - num_guard] - csum[..., :n - 2*edge]
+    right = csum[..., 2*edge + 1:] - csum[..., edge + num_guard + 1:n - edge + num_guard + 1]
+    return left, right
+
+
+def _threshold_mask(abs_signal: np.ndarray, threshold: np.ndarray,
+                    edge: int, peak_guard: int) -> np.ndarray:
+    """Cells above ``threshold`` that are also local maxima (edges never detect)."""
+    from scipy.ndimage import maximum_filter1d   # deferred: costly import, unused until detection
+
+    n = abs_signal.shape[-1]
+    mask = np.zeros(abs_signal.shape, dtype=bool)
+    cut = abs_signal[..., edge:n - edge]
+    local_max = maximum_filter1d(abs_signal, size=2*peak_guard + 1, axis=-1)[..., edge:n - edge]
+    mask[..., edge:n - edge] = (cut > threshold) & (cut == local_max)
+    return mask
+
+
+def _window_sum_cfar_mask(signal: np.ndarray, num_train: int, num_guard: int,
+                          pfa: float, peak_guard: int, variant: str) -> np.ndarray:
+    """CA / GO / SO-CFAR mask from running training-window sums."""
+    abs_signal = np.abs(signal)
+    edge = num_train + num_guard
+    if abs_signal.shape[-1] <= 2 * edge:
+        return np.zeros(abs_signal.shape, dtype=bool)
+
+    # For Gaussian noise: α = N * (Pfa^(-1/N) - 1)
+    alpha = num_train * (pfa ** (-1/num_train) - 1)
+
+    left, right = _training_sums(abs_signal, num_train, num_guard)
+    if variant == 'ca':
+        noise_estimate = (left + right) / (2 * num_train)
+    else:
+        # Greatest-of / smallest-of the leading and lagging window means
+        pick = np.maximum if variant == 'go' else np.minimum
+        noise_estimate = pick(left, right) / num_train
+    return _threshold_mask(abs_signal, alpha * noise_estimate, edge, peak_guard)
+
+
+def go_cfar_mask(signal: np.ndarray,
+                 num_train: int = 35,
+                 num_guard: int = 5,
+                 pfa: float = 1e-3,
+                 peak_guard: int = 2) -> np.ndarray:
+    """
+    Greatest-of CFAR detection mask along the last axis of ``signal``.
+
+    The noise estimate is the larger of the leading and lagging training
+    window means, which holds false alarms down at clutter edges.
+    Parameters are as for ``ca_cfar_detector``.
+    """
+    return _window_sum_cfar_mask(signal, num_train, num_guard, pfa, peak_guard, 'go')
+
+
+def so_cfar_mask(signal: np.ndarray,
+                 num_train: int = 35,
+                 num_guard: int = 5,
+                 pfa: float = 1e-3,
+                 peak_guard: int = 2) -> np.ndarray:
+    """
+    Smallest-of CFAR detection mask along the last axis of ``signal``.
+
+    The noise estimate is the smaller of the leading and lagging training
+    window means, so a target in one half window does not mask a
+    neighbour. Parameters are as for ``ca_cfar_detector``.
+    """
+    return _window_sum_cfar_mask(signal, num_train, num_guard, pfa, peak_guard, 'so')
+
+
+@functools.lru_cache(maxsize=64)
+def os_cfar_alpha(num_cells: int, rank: int, pfa: float) -> float:
+    """
+    OS-CFAR scale factor α for the ``rank``-th smallest of ``num_cells`` cells.
+
+    Solves Pfa = Π_{i=0}^{k-1} (N - i) / (N - i + α) (exponentially
+    distributed noise) for α.
+    """
+    from scipy.optimize import brentq   # deferred: scipy.optimize is slow to import
+
+    i = np.arange(rank)
+    log_pfa = np.log(pfa)
+    return brentq(lambda alpha: np.sum(np.log((num_cells - i) / (num_cells - i + alpha))) - log_pfa,
+                  1e-9, 1e9)
+
+
+def os_cfar_mask(signal: np.ndarray,
+                 num_train: int = 35,
+                 num_guard: int = 5,
+                 pfa: float = 1e-3,
+                 peak_guard: int = 2,
+                 rank: Optional[int] = None,
+                 chunk_cells: int = 4096) -> np.ndarray:
+    """
+    Ordered-statistic CFAR detection mask along the last axis of ``signal``.
+
+    The noise estimate is the ``rank``-th smallest of the 2·num_train
+    training cells, which ignores a few interfering targets in the window.
+    The training cells of a chunk of ``chunk_cells`` cells under test are
+    gathered from strided sliding-window views and the order statistic is
+    found with one ``np.partition`` call (O(N) per cell, no sort), so
+    memory stays at chunk_cells × 2·num_train values.
+
+    Parameters
+    ----------
+    rank : int, optional
+        1-based order statistic (default: 3/4 of the training cells).
+    chunk_cells : int
+        Cells under test per partition call.
+
+    Other parameters are as for ``ca_cfar_detector``.
+
+    Returns
+    -------
+    np.ndarray
+        Boolean array with the shape of ``signal``; True at detected peaks.
+    """
+    abs_signal = np.abs(signal)
+    n = abs_signal.shape[-1]
+    edge = num_train + num_guard
+    if n <= 2 * edge:
+        return np.zeros(abs_signal.shape, dtype=bool)
+
+    num_cells = 2 * num_train
+    rank = int(0.75 * num_cells) if rank is None else rank
+    if not 1 <= rank <= num_cells:
+        raise ValueError(f"OS-CFAR rank must be in 1..{num_cells}, got {rank}")
+    alpha = os_cfar_alpha(num_cells, rank, pfa)
+
+    # windows[..., j, :] holds abs_signal[..., j:j + num_train]
+    windows = sliding_window_view(abs_signal, num_train, axis=-1)
+    n_cut = n - 2 * edge
+    noise_estimate = np.empty(abs_signal.shape[:-1] + (n_cut,), dtype=abs_signal.dtype)
+    for first in range(0, n_cut, chunk_cells):
+        stop = min(first + chunk_cells, n_cut)
+        # Cell k = edge + j: left window starts at j, right window at j + edge + num_guard + 1
+        training = np.concatenate([windows[..., first:stop, :],
+                                   windows[..., first + edge + num_guard + 1:stop + edge + num_guard + 1, :]],
+                                  axis=-1)
+        noise_estimate[..., first:stop] = np.partition(training, rank - 1, axis=-1)[..., rank - 1]
+    return _threshold_mask(abs_signal, alpha * noise_estimate, edge, peak_guard)
+
+
+@profiled()
 def ca_cfar_detector(signal: np.ndarray,
                     num_train: int = 35,
                     num_guard: int = 5,
                     pfa: float = 1e-3,
-                    peak_guard: int = 2) -> np.ndarray:
+                    peak_guard: int = 2,
+                    method: str = 'vectorized') -> np.ndarray:
     """
     Cell-Averaging Constant False Alarm Rate (CA-CFAR) detector.
     
@@ -64,12 +548,20 @@ def ca_cfar_detector(signal: np.ndarray,
         Desired probability of false alarm.
     peak_guard : int
         Window size for local maximum detection (suppresses sidelobes).
+    method : str
+        'vectorized' (cumulative-sum implementation, see ``ca_cfar_mask``)
+        or 'loop' (reference per-cell loop). Both detect the same cells.
     
     Returns
     -------
     np.ndarray
         Indices of detected peaks in the signal.
     """
+    if method == 'vectorized':
+        return np.flatnonzero(ca_cfar_mask(signal, num_train, num_guard, pfa, peak_guard))
+    if method != 'loop':
+        raise ValueError(f"Unknown CFAR method: {method}")
+
     abs_signal = np.abs(signal)
     n = len(signal)
     
@@ -100,3 +592,324 @@ def ca_cfar_detector(signal: np.ndarray,
                 detected_peaks.append(k)
     
     return np.array(detected_peaks)
+
+
+def go_cfar_detector(signal: np.ndarray,
+                     num_train: int = 35,
+                     num_guard: int = 5,
+                     pfa: float = 1e-3,
+                     peak_guard: int = 2) -> np.ndarray:
+    """Greatest-of CFAR detector; indices of detected peaks (see ``go_cfar_mask``)."""
+    return np.flatnonzero(go_cfar_mask(signal, num_train, num_guard, pfa, peak_guard))
+
+
+def so_cfar_detector(signal: np.ndarray,
+                     num_train: int = 35,
+                     num_guard: int = 5,
+                     pfa: float = 1e-3,
+                     peak_guard: int = 2) -> np.ndarray:
+    """Smallest-of CFAR detector; indices of detected peaks (see ``so_cfar_mask``)."""
+    return np.flatnonzero(so_cfar_mask(signal, num_train, num_guard, pfa, peak_guard))
+
+
+def os_cfar_detector(signal: np.ndarray,
+                     num_train: int = 35,
+                     num_guard: int = 5,
+                     pfa: float = 1e-3,
+                     peak_guard: int = 2,
+                     rank: Optional[int] = None) -> np.ndarray:
+    """Ordered-statistic CFAR detector; indices of detected peaks (see ``os_cfar_mask``)."""
+    return np.flatnonzero(os_cfar_mask(signal, num_train, num_guard, pfa, peak_guard, rank))
+
+
+CFAR_MASKS = {
+    'ca': ca_cfar_mask,
+    'go': go_cfar_mask,
+    'so': so_cfar_mask,
+    'os': os_cfar_mask,
+}
+
+
+@profiled()
+def cfar_mask(signal: np.ndarray, variant: str = 'ca', **params) -> np.ndarray:
+    """
+    Detection mask of the CFAR ``variant`` ('ca', 'go', 'so' or 'os').
+
+    ``params`` are passed to the matching ``*_cfar_mask`` function.
+    """
+    try:
+        mask_func = CFAR_MASKS[variant.lower()]
+    except KeyError:
+        raise ValueError(f"Unknown CFAR variant: {variant}") from None
+    return mask_func(signal, **params)
+
+
+def _parabolic_offset(y: np.ndarray) -> np.ndarray:
+    """Vertex offset (-0.5..0.5) of the parabola through rows (y[-1], y[0], y[+1])."""
+    denom = y[:, 0] - 2 * y[:, 1] + y[:, 2]
+    with np.errstate(divide='ignore', invalid='ignore'):
+        delta = np.where(denom < 0, 0.5 * (y[:, 0] - y[:, 2]) / denom, 0.0)
+    return np.clip(delta, -0.5, 0.5)
+
+
+@profiled()
+def refine_peaks(signal: np.ndarray,
+                 peaks: np.ndarray,
+                 method: str = 'sinc',
+                 half_width: int = 16,
+                 upsample: int = 16) -> np.ndarray:
+    """
+    Sub-sample peak positions around detected cells.
+
+    Only a small neighbourhood of each peak is interpolated, so the cost
+    scales with the number of detections, not the record length.
+
+    Parameters
+    ----------
+    signal : np.ndarray
+        1-D detector input, e.g. the (complex) matched-filter output.
+    peaks : np.ndarray
+        Integer indices of detected peaks.
+    method : str
+        'parabolic' (vertex of a parabola through the peak magnitude and
+        its two neighbours), 'sinc' (band-limited interpolation with a
+        Hann-tapered sinc kernel of ``2·half_width + 1`` taps) or 'fft'
+        (zero-padded FFT of the ``2·half_width + 1`` samples around the
+        peak). The last two search ±1 sample on a 1/``upsample`` grid and
+        finish with a parabolic fit on that grid.
+    half_width : int
+        Neighbourhood half-width in samples for 'sinc' and 'fft'.
+    upsample : int
+        Interpolation factor of the 'sinc' and 'fft' search grid.
+
+    Returns
+    -------
+    np.ndarray
+        Fractional peak indices (float), one per input peak.
+    """
+    signal = np.asarray(signal)
+    peaks = np.asarray(peaks, dtype=int)
+    n = signal.shape[-1]
+    if len(peaks) == 0:
+        return np.zeros(0)
+
+    if method == 'parabolic':
+        idx = np.clip(peaks[:, None] + np.arange(-1, 2), 0, n - 1)
+        return peaks + _parabolic_offset(np.abs(signal[idx]))
+
+    # Neighbourhoods of every peak, zero outside the record: (n_peaks, 2h+1)
+    offsets = np.arange(-half_width, half_width + 1)
+    idx = peaks[:, None] + offsets
+    inside = (idx >= 0) & (idx < n)
+    neighbourhood = np.where(inside, signal[np.clip(idx, 0, n - 1)], 0)
+
+    grid = np.arange(-upsample, upsample + 1) / upsample   # offsets in [-1, 1]
+    if method == 'sinc':
+        # Hann-windowed sinc centred on each interpolation point
+        lag = grid[:, None] - offsets
+        taper = 0.5 * (1 + np.cos(np.pi * np.clip(lag / (half_width + 1), -1, 1)))
+        kernel = np.sinc(lag) * taper
+        interpolated = np.abs(neighbourhood @ kernel.T)
+    elif method == 'fft':
+        n_local = 2 * half_width + 1
+        spectrum = sp_fft.fft(neighbourhood, axis=-1)
+        padded = np.zeros((len(peaks), n_local * upsample), dtype=complex)
+        padded[:, :half_width + 1] = spectrum[:, :half_width + 1]
+        padded[:, -half_width:] = spectrum[:, half_width + 1:]
+        upsampled = sp_fft.ifft(padded, axis=-1) * upsample
+        interpolated = np.abs(upsampled[:, (half_width - 1) * upsample:(half_width + 1) * upsample + 1])
+    else:
+        raise ValueError(f"Unknown refinement method: {method}")
+
+    best = np.clip(np.argmax(interpolated, axis=1), 1, len(grid) - 2)
+    around = np.take_along_axis(interpolated, best[:, None] + np.arange(-1, 2), axis=1)
+    return peaks + grid[best] + _parabolic_offset(around) / upsample
+
+
+# Binomial MTI cancellers: n-pulse = (n - 1) cascaded first differences
+MTI_CANCELLERS = {
+    '2-pulse': (1.0, -1.0),
+    '3-pulse': (1.0, -2.0, 1.0),
+}
+
+
+def mti_coefficients(canceller) -> np.ndarray:
+    """
+    Slow-time FIR taps of an MTI canceller.
+
+    ``canceller`` is a name from ``MTI_CANCELLERS`` or a sequence of taps
+    ``h`` with ``y[n] = sum_k h[k] x[n - k]`` across pulses.
+    """
+    if isinstance(canceller, str):
+        try:
+            return np.array(MTI_CANCELLERS[canceller])
+        except KeyError:
+            raise ValueError(f"Unknown MTI canceller: {canceller}") from None
+    taps = np.asarray(canceller)
+    if taps.ndim != 1 or len(taps) < 1:
+        raise ValueError("MTI taps must be a non-empty 1-D sequence")
+    return taps
+
+
+@profiled()
+def mti_filter(rd_matrix: np.ndarray,
+               canceller='2-pulse',
+               block_rows: int = 8) -> np.ndarray:
+    """
+    Moving-target-indicator filter across slow time, in place.
+
+    Output pulse ``i`` is ``sum_k h[k] x[i + K - 1 - k]`` for the K taps
+    ``h`` of ``canceller``: stationary clutter (zero Doppler) is cancelled
+    and moving echoes pass. The K - 1 pulses needed to prime the filter are
+    dropped, so the result has ``n_pulses - K + 1`` rows. It is written
+    over the first rows of ``rd_matrix`` and returned as a view, with no
+    matrix-sized temporary.
+
+    The binomial cancellers run as cascaded first differences, each one a
+    single overlapping ``np.subtract`` over the whole matrix. Other taps
+    are accumulated ``block_rows`` output pulses at a time; each output row
+    reads only itself and later rows, so writing block by block from the
+    top is safe.
+
+    Parameters
+    ----------
+    rd_matrix : np.ndarray
+        Matched-filter outputs, shape (n_pulses, n_range); overwritten.
+    canceller : str or sequence of float
+        '2-pulse', '3-pulse' (see ``MTI_CANCELLERS``) or FIR taps.
+    block_rows : int
+        Output pulses per block for arbitrary taps.
+
+    Returns
+    -------
+    np.ndarray
+        View of the filtered rows, shape (n_pulses - K + 1, n_range).
+    """
+    taps = mti_coefficients(canceller)
+    n_taps = len(taps)
+    n_out = rd_matrix.shape[0] - n_taps + 1
+    if n_out < 1:
+        raise ValueError(f"{rd_matrix.shape[0]} pulses are too few for a {n_taps}-tap MTI filter")
+
+    if isinstance(canceller, str):
+        filtered = rd_matrix
+        for _ in range(n_taps - 1):
+            np.subtract(filtered[1:], filtered[:-1], out=filtered[:-1])
+            filtered = filtered[:-1]
+        return filtered
+
+    # Correlation form: row i = sum_m g[m] x[i + m] with g = taps reversed
+    g = taps[::-1].astype(rd_matrix.dtype if np.iscomplexobj(taps) else rd_matrix.real.dtype)
+    for first in range(0, n_out, block_rows):
+        stop = min(first + block_rows, n_out)
+        block = g[0] * rd_matrix[first:stop]
+        for m in range(1, n_taps):
+            block += g[m] * rd_matrix[first + m:stop + m]
+        rd_matrix[first:stop] = block
+    return rd_matrix[:n_out]
+
+
+@profiled()
+def range_doppler_map(rd_matrix: np.ndarray,
+                      window: Optional[str] = 'hanning') -> np.ndarray:
+    """
+    Form a range-Doppler map with a slow-time FFT across pulses.
+    
+    Every range bin is windowed and transformed in one batched FFT along
+    axis 0, and the result is shifted so zero Doppler sits in the middle row.
+    
+    Parameters
+    ----------
+    rd_matrix : np.ndarray
+        Matched-filter outputs, shape (n_pulses, n_range).
+    window : str or None
+        Slow-time taper to reduce Doppler sidelobes (default 'hanning').
+    
+    Returns
+    -------
+    np.ndarray
+        Complex range-Doppler map, shape (n_pulses, n_range). Row ``i``
+        corresponds to Doppler ``doppler_frequencies(n_pulses, prf)[i]``.
+    """
+    n_pulses = rd_matrix.shape[0]
+    taper = window_function(window, n_pulses).astype(rd_matrix.real.dtype)
+    tapered = rd_matrix * taper[:, None]
+    rd_map = _zero_round_off(sp_fft.fft(tapered, axis=0, overwrite_x=True, workers=-1), n_pulses, axis=0)
+    return sp_fft.fftshift(rd_map, axes=0)
+
+
+def doppler_frequencies(n_pulses: int, prf: float) -> np.ndarray:
+    """Doppler frequency (Hz) of each row of ``range_doppler_map``."""
+    return sp_fft.fftshift(sp_fft.fftfreq(n_pulses, d=1/prf))
+
+
+@profiled()
+def ca_cfar_2d(signal: np.ndarray,
+               num_train: Tuple[int, int] = (4, 20),
+               num_guard: Tuple[int, int] = (2, 5),
+               pfa: float = 1e-6,
+               peak_guard: Tuple[int, int] = (1, 1)) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Two-dimensional CA-CFAR detector for range-Doppler maps.
+    
+    The training region is a rectangle around each cell with a guard
+    rectangle removed. Window sums come from running sums along each axis,
+    so the whole map is thresholded in a few array operations. The Doppler axis
+    wraps around; range cells closer than the window to either edge are
+    not tested.
+    
+    Parameters
+    ----------
+    signal : np.ndarray
+        Range-Doppler map, shape (n_doppler, n_range).
+    num_train : tuple of int
+        Training cells on each side as (doppler, range).
+    num_guard : tuple of int
+        Guard cells on each side as (doppler, range).
+    pfa : float
+        Desired probability of false alarm.
+    peak_guard : tuple of int
+        Half-size of the local maximum window as (doppler, range).
+    
+    Returns
+    -------
+    tuple
+        (doppler_bins, range_bins) index arrays of detected peaks.
+    """
+    abs_signal = np.abs(signal)
+    n_doppler, n_range = abs_signal.shape
+    train_d, train_r = num_train
+    guard_d, guard_r = num_guard
+    edge_d, edge_r = train_d + guard_d, train_r + guard_r
+    if n_range <= 2 * edge_r:
+        return np.array([], dtype=int), np.array([], dtype=int)
+
+    n_cells = (2*edge_d + 1) * (2*edge_r + 1) - (2*guard_d + 1) * (2*guard_r + 1)
+    alpha = n_cells * (pfa ** (-1/n_cells) - 1)
+
+    # Separable box sums over the Doppler-wrapped map: running sums along
+    # range, then along Doppler. Unlike a single summed-area table, all-zero
+    # regions give exactly zero.
+    padded = np.pad(abs_signal, ((edge_d, edge_d), (0, 0)), mode='wrap')
+    range_csum = np.zeros((padded.shape[0], n_range + 1))
+    np.cumsum(padded, axis=1, out=range_csum[:, 1:])
+
+    def box_sum(half_d, half_r):
+        range_sums = (range_csum[:, edge_r + half_r + 1:n_range - edge_r + half_r + 1]
+                      - range_csum[:, edge_r - half_r:n_range - edge_r - half_r])
+        doppler_csum = np.zeros((range_sums.shape[0] + 1, range_sums.shape[1]))
+        np.cumsum(range_sums, axis=0, out=doppler_csum[1:])
+        return (doppler_csum[edge_d + half_d + 1:edge_d + half_d + 1 + n_doppler]
+                - doppler_csum[edge_d - half_d:edge_d - half_d + n_doppler])
+
+    noise_estimate = (box_sum(edge_d, edge_r) - box_sum(guard_d, guard_r)) / n_cells
+    threshold = alpha * noise_estimate
+
+    cut = abs_signal[:, edge_r:n_range - edge_r]
+    size = (2*peak_guard[0] + 1, 2*peak_guard[1] + 1)
+    from scipy.ndimage import maximum_filter   # deferred: costly import, unused until detection
+    local_max = maximum_filter(abs_signal, size=size, mode=('wrap', 'nearest'))
+    detected = (cut > threshold) & (cut == local_max[:, edge_r:n_range - edge_r])
+
+    doppler_bins, range_bins = np.nonzero(detected)
+    return doppler_bins, range_bins + edge_r
@@ -1,13 +1,17 @@
 import numpy as np
 from typing import Tuple, Optional
 
+from radar.profiling import profiled
 
+
+@profiled()
 def generate_lfm_pulse(start_freq: float = 0.0,
                       bandwidth: float = 20e6,
                       duration: float = 10e-6,
                       sample_rate: float = 100e6,
                       window: Optional[str] = 'hanning',
-                      up_chirp: bool = True) -> Tuple[np.ndarray, np.ndarray]:
+                      up_chirp: bool = True,
+                      dtype=complex) -> Tuple[np.ndarray, np.ndarray]:
     """
     Generate a Linear Frequency Modulation (LFM) chirp pulse.
     
@@ -31,6 +35,10 @@ def generate_lfm_pulse(start_freq: float = 0.0,
     up_chirp : bool
         If True, frequency increases with time (up-chirp).
         If False, frequency decreases (down-chirp).
+    dtype : data-type
+        Complex type of the pulse, e.g. ``np.complex64`` for single
+        precision (default complex128). The phase is always computed in
+        float64.
     
     Returns
     -------
@@ -52,19 +60,149 @@ def generate_lfm_pulse(start_freq: float = 0.0,
     phase = 2 * np.pi * (start_freq * t + 0.5 * k * t**2)
     
     # Generate complex chirp
-    pulse = np.exp(1j * phase)
+    pulse = np.exp(1j * phase).astype(dtype, copy=False)
     
     # Apply window function if specified
     if window is not None:
-        if window.lower() == 'hanning':
-            w = np.hanning(n_samples)
-        elif window.lower() == 'hamming':
-            w = np.hamming(n_samples)
-        elif window.lower() == 'blackman':
-            w = np.blackman(n_samples)
-        else:
-            raise ValueError(f"Unknown window type: {window}")
-        
-        pulse *= w
+        pulse *= window_function(window, n_samples).astype(pulse.real.dtype)
     
     return pulse, t
+
+
+# Binary Barker codes (peak sidelobe 1/N of the mainlobe)
+BARKER_CODES = {
+    2: (1, -1),
+    3: (1, 1, -1),
+    4: (1, 1, -1, 1),
+    5: (1, 1, 1, -1, 1),
+    7: (1, 1, 1, -1, -1, 1, -1),
+    11: (1, 1, 1, -1, -1, -1, 1, -1, -1, 1, -1),
+    13: (1, 1, 1, 1, 1, -1, -1, 1, 1, -1, 1, -1, 1),
+}
+
+
+def _phase_coded_pulse(phases: np.ndarray,
+                       chip_duration: float,
+                       sample_rate: float,
+                       dtype=complex) -> Tuple[np.ndarray, np.ndarray]:
+    """Rectangular chips of constant phase, each ``chip_duration`` long."""
+    samples_per_chip = max(int(round(chip_duration * sample_rate)), 1)
+    pulse = np.repeat(np.exp(1j * np.asarray(phases, dtype=float)), samples_per_chip)
+    t = np.arange(len(pulse)) / sample_rate
+    return pulse.astype(dtype, copy=False), t
+
+
+def generate_barker_pulse(length: int = 13,
+                          chip_duration: float = 50e-9,
+                          sample_rate: float = 100e6,
+                          dtype=complex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a binary phase-coded (BPSK) Barker pulse.
+
+    Parameters
+    ----------
+    length : int
+        Code length: 2, 3, 4, 5, 7, 11 or 13 (default 13).
+    chip_duration : float
+        Duration of one chip in seconds (default 50 ns, i.e. 20 MHz
+        bandwidth).
+    sample_rate : float
+        Sampling frequency in Hz (default 100 MHz).
+    dtype : data-type
+        Complex type of the pulse (default complex128).
+
+    Returns
+    -------
+    tuple
+        (pulse, time_axis).
+    """
+    if length not in BARKER_CODES:
+        raise ValueError(f"Unknown Barker code length: {length}")
+    code = np.array(BARKER_CODES[length])
+    return _phase_coded_pulse(np.where(code > 0, 0.0, np.pi), chip_duration, sample_rate, dtype)
+
+
+def generate_frank_pulse(order: int = 4,
+                         chip_duration: float = 50e-9,
+                         sample_rate: float = 100e6,
+                         dtype=complex) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Generate a polyphase Frank-coded pulse of ``order**2`` chips.
+
+    Chip ``(i, j)`` (row-major, ``0 <= i, j < order``) has phase
+    ``2π·i·j / order``, a stepped approximation of an LFM chirp.
+
+    Parameters
+    ----------
+    order : int
+        Code order M; the pulse has M² chips (default 4).
+    chip_duration : float
+        Duration of one chip in seconds (default 50 ns).
+    sample_rate : float
+        Sampling frequency in Hz (default 100 MHz).
+    dtype : data-type
+        Complex type of the pulse (default complex128).
+
+    Returns
+    -------
+    tuple
+        (pulse, time_axis).
+    """
+    if order < 2:
+        raise ValueError(f"Frank code order must be at least 2, got {order}")
+    i, j = np.divmod(np.arange(order * order), order)
+    return _phase_coded_pulse(2 * np.pi * i * j / order, chip_duration, sample_rate, dtype)
+
+
+def doppler_shifted_references(pulse: np.ndarray,
+                               sample_rate: float,
+                               doppler_freqs: np.ndarray) -> np.ndarray:
+    """
+    Copies of ``pulse`` shifted in frequency, one per Doppler hypothesis.
+
+    Parameters
+    ----------
+    pulse : np.ndarray
+        Complex baseband pulse.
+    sample_rate : float
+        Sampling frequency in Hz.
+    doppler_freqs : np.ndarray
+        Doppler shifts in Hz.
+
+    Returns
+    -------
+    np.ndarray
+        Array of shape (len(doppler_freqs), len(pulse)); row ``k`` is
+        ``pulse · exp(j2π f_k t)``, a reference for a Doppler-mismatch
+        filter bank.
+    """
+    t = np.arange(len(pulse)) / sample_rate
+    shifts = np.exp(2j * np.pi * np.outer(doppler_freqs, t))
+    return (pulse * shifts).astype(np.result_type(pulse.dtype, np.complex64), copy=False)
+
+
+def window_function(window: Optional[str], n_samples: int) -> np.ndarray:
+    """
+    Return a taper of length ``n_samples``.
+    
+    Parameters
+    ----------
+    window : str or None
+        'hanning', 'hamming', 'blackman', or None for a rectangular window.
+    n_samples : int
+        Window length.
+    
+    Returns
+    -------
+    np.ndarray
+        Real window coefficients.
+    """
+    if window is None:
+        return np.ones(n_samples)
+    if window.lower() == 'hanning':
+        return np.hanning(n_samples)
+    elif window.lower() == 'hamming':
+        return np.hamming(n_samples)
+    elif window.lower() == 'blackman':
+        return np.blackman(n_samples)
+    raise ValueError(f"Unknown window type: {window}")
@@ -0,0 +1,181 @@
+import numpy as np
+from typing import Callable, Dict, Optional, Tuple
+
+from radar.signalProcessing import mti_coefficients
+
+
+class CoherentIntegrator:
+    """Running complex sum of range lines; memory is one range line."""
+
+    def __init__(self, n_samples: int, dtype=complex):
+        self.total = np.zeros(n_samples, dtype=dtype)
+        self.count = 0
+
+    def update(self, line: np.ndarray) -> None:
+        self.total += line
+        self.count += 1
+
+    def reset(self) -> None:
+        self.total[:] = 0
+        self.count = 0
+
+
+class NonCoherentIntegrator:
+    """Running sum of range-line magnitudes; memory is one range line."""
+
+    def __init__(self, n_samples: int):
+        self.total = np.zeros(n_samples)
+        self._scratch = np.empty(n_samples)
+        self.count = 0
+
+    def update(self, line: np.ndarray) -> None:
+        self.total += np.abs(line, out=self._scratch)
+        self.count += 1
+
+    def reset(self) -> None:
+        self.total[:] = 0
+        self.count = 0
+
+
+class SlidingWindowIntegrator:
+    """
+    Coherent sum over the most recent ``window`` range lines.
+
+    Lines are kept in a fixed ring buffer; each update adds the newest line
+    and subtracts the one it replaces. The sum is rebuilt from the buffer
+    once per ``window`` updates so rounding errors cannot accumulate.
+    """
+
+    def __init__(self, n_samples: int, window: int, dtype=complex):
+        self.window = window
+        self.buffer = np.zeros((window, n_samples), dtype=dtype)
+        self.total = np.zeros(n_samples, dtype=dtype)
+        self.count = 0
+
+    @property
+    def filled(self) -> int:
+        """Number of lines currently in the window."""
+        return min(self.count, self.window)
+
+    def update(self, line: np.ndarray) -> None:
+        slot = self.count % self.window
+        self.total -= self.buffer[slot]
+        self.buffer[slot] = line
+        self.total += line
+        self.count += 1
+        if self.count % self.window == 0:
+            np.sum(self.buffer, axis=0, out=self.total)
+
+    def reset(self) -> None:
+        self.buffer[:] = 0
+        self.total[:] = 0
+        self.count = 0
+
+
+class MTICanceller:
+    """
+    Moving-target-indicator filter for a stream of range lines.
+
+    The last ``len(taps)`` lines are kept in a ring buffer, and each update
+    forms ``sum_k h[k] x[n - k]`` as one ``np.dot`` of the taps, rotated
+    to the ring order, with the buffer. Memory is ``len(taps)`` range lines
+    plus the output line. Nothing is returned until the filter is primed.
+    See ``radar.signalProcessing.mti_filter`` for the batch version.
+    """
+
+    def __init__(self, n_samples: int, canceller='2-pulse', dtype=complex):
+        self.taps = mti_coefficients(canceller)
+        self.buffer = np.zeros((len(self.taps), n_samples), dtype=dtype)
+        self.output = np.empty(n_samples, dtype=dtype)
+        self._reversed = self.taps[::-1].astype(dtype)
+        self.count = 0
+
+    @property
+    def primed(self) -> bool:
+        """True once the buffer holds a full set of lines."""
+        return self.count >= len(self.taps)
+
+    def update(self, line: np.ndarray) -> Optional[np.ndarray]:
+        """Add one line; return the filtered line (a live buffer) once primed."""
+        n_taps = len(self.taps)
+        self.buffer[self.count % n_taps] = line
+        self.count += 1
+        if not self.primed:
+            return None
+        # Slot (count + i) % n_taps holds the line weighted by taps[n_taps - 1 - i]
+        weights = np.roll(self._reversed, self.count % n_taps)
+        return np.dot(weights, self.buffer, out=self.output)
+
+    def reset(self) -> None:
+        self.buffer[:] = 0
+        self.count = 0
+
+
+class StreamProcessor:
+    """
+    Pulse-by-pulse integration and detection with bounded memory.
+
+    Every pushed range line updates a running coherent sum, a running
+    non-coherent (magnitude) sum and a sliding-window coherent sum over the
+    last ``window`` lines (one CPI). With ``mti``, each line first passes
+    through an ``MTICanceller`` and the sliding window sums the magnitudes
+    of the filtered lines instead, since a coherent sum of canceller
+    outputs cancels moving echoes as well. Every ``detect_every`` lines, once the
+    window is full, ``detector`` runs on the sliding-window sum and a
+    detection event is returned (pulse_index, peaks, distances, and the
+    sliding-window sum as 'line', a live buffer valid until the next push). Memory is O(window × n_samples) however
+    many pulses are streamed.
+
+    Parameters
+    ----------
+    n_samples : int
+        Range-line length.
+    window : int
+        Sliding-window length in pulses.
+    detector : callable
+        ``detector(line) -> (peaks, distances)``, e.g. a bound
+        ``RadarSimulator.detect_targets``.
+    detect_every : int, optional
+        Detection cadence in pulses (default: once per window).
+    mti : str or sequence of float, optional
+        MTI canceller ('2-pulse', '3-pulse' or FIR taps) applied before
+        integration.
+    """
+
+    def __init__(self,
+                 n_samples: int,
+                 window: int,
+                 detector: Callable[[np.ndarray], Tuple[np.ndarray, np.ndarray]],
+                 detect_every: Optional[int] = None,
+                 dtype=complex,
+                 mti=None):
+        self.mti = None if mti is None else MTICanceller(n_samples, mti, dtype)
+        self.coherent = CoherentIntegrator(n_samples, dtype)
+        self.noncoherent = NonCoherentIntegrator(n_samples)
+        self.sliding = SlidingWindowIntegrator(n_samples, window,
+                                               dtype if mti is None else np.finfo(dtype).dtype)
+        self._magnitude = None if mti is None else np.empty(n_samples, dtype=self.sliding.buffer.dtype)
+        self.detector = detector
+        self.detect_every = detect_every or window
+        self.pulse_index = 0
+
+    def push(self, line: np.ndarray) -> Optional[Dict[str, object]]:
+        """Integrate one range line; return a detection event when one is due."""
+        self.pulse_index += 1
+        if self.mti is not None:
+            line = self.mti.update(line)
+            if line is None:
+                return None
+        self.coherent.update(line)
+        self.noncoherent.update(line)
+        self.sliding.update(line if self.mti is None else np.abs(line, out=self._magnitude))
+
+        if self.sliding.filled < self.sliding.window or self.pulse_index % self.detect_every:
+            return None
+        peaks, distances = self.detector(self.sliding.total)
+        return {
+            'pulse_index': self.pulse_index,
+            'peaks': peaks,
+            'distances': distances,
+            'line': self.sliding.total,
+        }
@@ -1,16 +1,263 @@
 import numpy as np
-from typing import List, Tuple, Union
+from scipy import fft as sp_fft
+from typing import List, Optional, Tuple, Union
 
+from radar.noise import add_noise_inplace, fill_complex_noise
+from radar.profiling import profiled
+from radar.signalProcessing import MatchedFilter
 
+
+# Above this many targets, echoes are injected as a delay histogram
+# convolved once with the pulse instead of one target at a time
+HISTOGRAM_MIN_TARGETS = 64
+
+
+def split_scatterers(targets) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """
+    Split a target list into range, radial velocity and RCS arrays.
+
+    Parameters
+    ----------
+    targets : list or np.ndarray
+        Target ranges in meters, (range, radial_velocity) tuples in meters
+        and m/s, or (range, radial_velocity, rcs) tuples. Positive velocity
+        means the target is closing. Plain ranges are stationary targets
+        and a missing RCS is 1. A float array of shape (N,), (N, 2) or
+        (N, 3) is split without a Python loop, e.g. from
+        ``radar.scatterers.generate_scatterers``.
+
+    Returns
+    -------
+    tuple
+        (ranges, velocities, rcs) as float arrays.
+    """
+    if isinstance(targets, np.ndarray) and targets.dtype != object:
+        columns = np.asarray(targets, dtype=float).reshape(len(targets), -1)
+        n_cols = columns.shape[1]
+        ranges = columns[:, 0]
+        velocities = columns[:, 1] if n_cols > 1 else np.zeros(len(ranges))
+        rcs = columns[:, 2] if n_cols > 2 else np.ones(len(ranges))
+        return ranges, velocities, rcs
+
+    ranges = np.zeros(len(targets))
+    velocities = np.zeros(len(targets))
+    rcs = np.ones(len(targets))
+    for i, target in enumerate(targets):
+        if np.ndim(target) == 0:
+            ranges[i] = target
+        elif len(target) == 2:
+            ranges[i], velocities[i] = target
+        else:
+            ranges[i], velocities[i], rcs[i] = target
+    return ranges, velocities, rcs
+
+
+def split_targets(targets: Union[List[float], List[Tuple[float, float]]]
+                  ) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Split a target list into range and radial velocity arrays.
+
+    Parameters
+    ----------
+    targets : list
+        Target ranges in meters, or (range, radial_velocity) tuples in
+        meters and m/s. Positive velocity means the target is closing.
+        Plain ranges are stationary targets. See ``split_scatterers`` for
+        the other accepted forms.
+
+    Returns
+    -------
+    tuple
+        (ranges, velocities) as float arrays.
+    """
+    ranges, velocities, _ = split_scatterers(targets)
+    return ranges, velocities
+
+
+def _echo_record_length(pulse: np.ndarray, sample_rate: float, ranges: np.ndarray) -> int:
+    """Number of samples needed to hold the echo of the farthest target."""
+    c = 3e8  # Speed of light
+
+    # Calculate required signal duration
+    max_distance = np.max(ranges)
+    max_delay = 2 * max_distance / c  # Round-trip time
+    pulse_duration = len(pulse) / sample_rate
+    
+    # Add buffer for visualization
+    total_duration = 5e-6 + max_delay + pulse_duration
+    return int(total_duration * sample_rate)
+
+
+@profiled()
+def _inject_echoes(received: np.ndarray,
+                   pulse: np.ndarray,
+                   sample_rate: float,
+                   ranges: np.ndarray,
+                   velocities: np.ndarray,
+                   pulse_indices: np.ndarray,
+                   pri: float,
+                   carrier_freq: float,
+                   total_samples: Optional[int] = None,
+                   rcs: Optional[np.ndarray] = None,
+                   method: str = 'auto',
+                   first_sample: int = 0) -> None:
+    """
+    Add the echoes of every target to each row of ``received`` in place.
+
+    Row ``i`` holds pulse ``pulse_indices[i]``, transmitted at slow time
+    ``pulse_indices[i] * pri``. Each target is handled for all rows at once
+    ('loop'), or all targets are binned into a delay histogram that is
+    convolved with the pulse once per row ('histogram'; chosen by 'auto'
+    from ``HISTOGRAM_MIN_TARGETS`` targets). Echoes that would exceed the
+    simulated record of ``total_samples`` (default: the row length) are
+    skipped; echoes that fit the record but run past a shorter
+    ``received`` buffer are truncated. Column 0 of ``received`` is sample
+    ``first_sample`` of the record, so a range-gated span can be simulated
+    on its own: echoes entirely outside it are skipped and the rest are
+    clipped to it. Amplitudes scale with √rcs.
+    """
+    if method == 'auto':
+        method = 'histogram' if len(ranges) >= HISTOGRAM_MIN_TARGETS else 'loop'
+    if method == 'histogram':
+        _inject_histogram(received, pulse, sample_rate, ranges, velocities, pulse_indices,
+                          pri, carrier_freq, total_samples, rcs, first_sample=first_sample)
+        return
+    if method != 'loop':
+        raise ValueError(f"Unknown injection method: {method}")
+
+    c = 3e8  # Speed of light
+    width = received.shape[-1]
+    total_samples = first_sample + width if total_samples is None else total_samples
+    wavelength = c / carrier_freq
+    slow_time = pulse_indices * pri
+    offsets = np.arange(len(pulse))
+    scales = np.ones(len(ranges)) if rcs is None else np.sqrt(rcs)
+
+    for range0, velocity, scale in zip(ranges, velocities, scales):
+        # Range walk and round-trip delay of this target on every pulse
+        range_m = range0 - velocity * slow_time
+        delay = 2 * range_m / c
+        delay_samples = (delay * sample_rate).astype(int)
+        
+        # Skip pulses whose echo would exceed the record or miss the buffer
+        rows = np.flatnonzero((delay_samples >= 0) &
+                              (delay_samples + len(pulse) <= total_samples) &
+                              (delay_samples + len(pulse) > first_sample) &
+                              (delay_samples < first_sample + width))
+        if len(rows) == 0:
+            continue
+        
+        # Amplitude proportional to 1/R^2 (power proportional to 1/R^4),
+        # with the pulse-to-pulse Doppler phase exp(j2π·f_d·t), f_d = 2v/λ
+        amplitude = scale / range_m[rows]**2
+        if velocity != 0:
+            doppler_freq = 2 * velocity / wavelength
+            amplitude = amplitude * np.exp(2j * np.pi * doppler_freq * slow_time[rows])
+        amplitude = amplitude.astype(received.dtype)   # keep single-precision buffers single
+        
+        # Add delayed and attenuated echo
+        cols = delay_samples[rows, None] - first_sample + offsets
+        echoes = amplitude[:, None] * pulse
+        if cols[:, 0].min() >= 0 and cols[:, -1].max() < width:
+            received[rows[:, None], cols] += echoes
+        else:
+            keep = (cols >= 0) & (cols < width)
+            received[np.broadcast_to(rows[:, None], cols.shape)[keep], cols[keep]] += echoes[keep]
+
+
+def _inject_histogram(received: np.ndarray,
+                      pulse: np.ndarray,
+                      sample_rate: float,
+                      ranges: np.ndarray,
+                      velocities: np.ndarray,
+                      pulse_indices: np.ndarray,
+                      pri: float,
+                      carrier_freq: float,
+                      total_samples: Optional[int] = None,
+                      rcs: Optional[np.ndarray] = None,
+                      block_elements: int = 1 << 22,
+                      first_sample: int = 0) -> None:
+    """
+    Vectorized ``_inject_echoes`` for large numbers of scatterers.
+
+    The complex amplitudes of all scatterers are accumulated per delay
+    sample with ``np.bincount`` (a weighted histogram; much faster than
+    ``np.add.at``) and the histogram is convolved with the pulse by FFT,
+    so the cost per pulse is O(N + n log n) instead of O(N · pulse length).
+    Rows are processed in blocks of about ``block_elements`` scatterer
+    entries. Without moving scatterers every row is identical and only
+    one histogram is built. With ``first_sample`` > 0 the histogram also
+    covers up to ``len(pulse) - 1`` samples before the buffer, so echoes
+    that start before it and run into it are included.
+    """
+    c = 3e8  # Speed of light
+    n_rows, width = received.shape
+    total_samples = first_sample + width if total_samples is None else total_samples
+    wavelength = c / carrier_freq
+    scales = np.ones(len(ranges)) if rcs is None else np.sqrt(rcs)
+    moving = bool(velocities.any())
+    m = len(pulse)
+    lead = min(m - 1, first_sample)   # histogram bins before the buffer
+    span = lead + width
+    nfft = sp_fft.next_fast_len(span + m - 1)
+    pulse_spectrum = sp_fft.fft(pulse, nfft)
+
+    rows_per_block = max(1, min(n_rows, block_elements // max(len(ranges), span)))
+    if not moving:
+        rows_per_block = 1   # one histogram serves every row
+    for first in range(0, n_rows if moving else 1, rows_per_block):
+        slow_time = pulse_indices[first:first + rows_per_block] * pri
+        n_block = len(slow_time)
+        range_m = ranges - slow_time[:, None] * velocities
+        delay_samples = (2 * range_m / c * sample_rate).astype(int)
+        bin_index = delay_samples - first_sample + lead
+        valid = ((delay_samples >= 0) & (delay_samples + m <= total_samples)
+                 & (bin_index >= 0) & (bin_index < span))
+
+        amplitude = scales / range_m**2
+        if moving:
+            amplitude = amplitude * np.exp(2j * np.pi * (2 * velocities / wavelength) * slow_time[:, None])
+        weights = amplitude[valid]
+        bins = (np.arange(n_block)[:, None] * span + bin_index)[valid]
+        size = n_block * span
+        histogram = np.bincount(bins, weights.real, size).astype(complex)
+        if moving:
+            histogram.imag = np.bincount(bins, weights.imag, size)
+
+        spectrum = sp_fft.fft(histogram.reshape(n_block, span), nfft, axis=-1)
+        spectrum *= pulse_spectrum
+        echoes = sp_fft.ifft(spectrum, axis=-1, overwrite_x=True)[:, lead:lead + width]
+        if moving:
+            received[first:first + n_block] += echoes
+        else:
+            received += echoes
+
+
+def _noise_buffer(shape: Tuple[int, ...],
+                  noise_std: float,
+                  rng: Optional[np.random.Generator],
+                  dtype=complex) -> np.ndarray:
+    """Allocate a receive buffer holding thermal noise (zeros if noise_std is 0)."""
+    if noise_std > 0:
+        return fill_complex_noise(np.empty(shape, dtype=dtype), noise_std, rng)
+    return np.zeros(shape, dtype=dtype)
+
+
+@profiled()
 def simulate_echoes(pulse: np.ndarray,
                    sample_rate: float,
                    targets: Union[List[float], List[Tuple[float, float]]],
-                   noise_std: float = 0.0) -> Tuple[np.ndarray, np.ndarray]:
+                   noise_std: float = 0.0,
+                   pulse_index: int = 0,
+                   pri: float = 0.0,
+                   carrier_freq: float = 10e9,
+                   rng: Optional[np.random.Generator] = None,
+                   dtype=complex) -> Tuple[np.ndarray, np.ndarray]:
     """
     Simulate radar echoes from multiple targets with realistic effects.
     
     This function models the complete radar channel including propagation
-    delays, path loss, and additive noise. 
+    delays, path loss, Doppler and additive noise. 
     
     Parameters
     ----------
@@ -19,9 +266,23 @@ def simulate_echoes(pulse: np.ndarray,
     sample_rate : float
         Sampling frequency in Hz.
     targets : list
-        List of target ranges in meters.
+        List of target ranges in meters, or (range, radial_velocity)
+        tuples for moving targets (see ``split_targets``).
     noise_std : float, optional
         Standard deviation of complex Gaussian noise. Default is 0.0.
+    pulse_index : int, optional
+        Index of this pulse within the dwell. Moving targets have walked
+        ``velocity * pulse_index * pri`` meters and picked up the matching
+        Doppler phase. Default is 0.
+    pri : float, optional
+        Pulse repetition interval in seconds. Default is 0.0.
+    carrier_freq : float, optional
+        Carrier frequency in Hz, sets the Doppler shift (default 10 GHz).
+    rng : np.random.Generator, optional
+        Random generator for the noise (default: a fresh unseeded one).
+    dtype : data-type, optional
+        Complex type of the record (default complex128; ``np.complex64``
+        halves memory traffic).
     Returns
     -------
     tuple
@@ -34,57 +295,336 @@ def simulate_echoes(pulse: np.ndarray,
         Pr = Pt * G^2 * λ^2 * σ / ((4π)^3 * R^4)
     
     For simplicity, we model this as amplitude ∝ 1/R^2.
+
+    The record length is set by the ranges at the first pulse, so every
+    pulse of a dwell shares the same layout.
     """
-    c = 3e8  # Speed of light
-    
-    target_ranges = [t for t in targets]
+    ranges, velocities, rcs = split_scatterers(targets)
+    total_samples = _echo_record_length(pulse, sample_rate, ranges)
     
-    # Calculate required signal duration
-    max_distance = max(target_ranges)
-    max_delay = 2 * max_distance / c  # Round-trip time
-    pulse_duration = len(pulse) / sample_rate
+    # Initialize received signal with thermal noise, then add the echoes
+    received_signal = _noise_buffer((1, total_samples), noise_std, rng, dtype)
+    _inject_echoes(received_signal, pulse, sample_rate, ranges, velocities,
+                   np.array([pulse_index]), pri, carrier_freq, rcs=rcs)
+    received_signal = received_signal[0]
     
-    # Add buffer for visualization
-    total_duration = 5e-6 + max_delay + pulse_duration
-    total_samples = int(total_duration * sample_rate)
+    # Generate time axis
+    t = np.arange(len(received_signal)) / sample_rate
     
-    # Initialize received signal
-    received_signal = np.zeros(total_samples, dtype=complex)
+    return received_signal, t
+
+
+@profiled()
+def simulate_pulse_matrix(pulse: np.ndarray,
+                          sample_rate: float,
+                          targets: Union[List[float], List[Tuple[float, float]]],
+                          n_pulses: int,
+                          noise_std: float = 0.0,
+                          max_samples: Optional[int] = None,
+                          first_pulse: int = 0,
+                          pri: float = 0.0,
+                          carrier_freq: float = 10e9,
+                          rng: Optional[np.random.Generator] = None,
+                          dtype=complex,
+                          injection: str = 'auto',
+                          first_sample: int = 0) -> np.ndarray:
+    """
+    Simulate the received records of ``n_pulses`` pulses in one array.
+
+    Each row has the same layout as the record returned by
+    ``simulate_echoes`` for the corresponding pulse; echoes are injected
+    into a preallocated (n_pulses, n_samples) matrix one target at a time
+    across all pulses. The noise for all pulses is drawn in a single call
+    straight into the matrix before the echoes are added, so no separate
+    noise array is allocated.
     
-    # Add echo from each target
-    for range_m in target_ranges:
-        # Calculate round-trip delay
-        delay = 2 * range_m / c
-        delay_samples = int(delay * sample_rate)
-        
-        # Skip if echo would exceed buffer
-        if delay_samples + len(pulse) > total_samples:
+    Parameters
+    ----------
+    pulse : np.ndarray
+        Transmitted radar pulse (complex baseband signal).
+    sample_rate : float
+        Sampling frequency in Hz.
+    targets : list
+        List of target ranges in meters, or (range, radial_velocity) tuples.
+    n_pulses : int
+        Number of pulses (rows) to simulate.
+    noise_std : float, optional
+        Standard deviation of complex Gaussian noise. Default is 0.0.
+    max_samples : int, optional
+        Truncate each record to at most this many samples (e.g. one PRI).
+    first_pulse : int, optional
+        Pulse index of the first row within the dwell. Default is 0.
+    pri : float, optional
+        Pulse repetition interval in seconds. Default is 0.0.
+    carrier_freq : float, optional
+        Carrier frequency in Hz (default 10 GHz).
+    rng : np.random.Generator, optional
+        Random generator for the noise (default: a fresh unseeded one).
+    dtype : data-type, optional
+        Complex type of the matrix (default complex128).
+    injection : str, optional
+        'loop' (per target), 'histogram' (delay histogram convolved with
+        the pulse, for large scatterer counts) or 'auto' (default).
+    first_sample : int, optional
+        Simulate only record samples ``first_sample`` to ``max_samples``
+        (e.g. the span feeding a range gate); column 0 is that sample.
+
+    Returns
+    -------
+    np.ndarray
+        Complex matrix of shape (n_pulses, n_samples).
+    """
+    ranges, velocities, rcs = split_scatterers(targets)
+    total_samples = _echo_record_length(pulse, sample_rate, ranges)
+
+    end = total_samples if max_samples is None else min(total_samples, max_samples)
+    n_samples = max(end - first_sample, 0)
+
+    received = _noise_buffer((n_pulses, n_samples), noise_std, rng, dtype)
+    _inject_echoes(received, pulse, sample_rate, ranges, velocities,
+                   np.arange(first_pulse, first_pulse + n_pulses), pri, carrier_freq,
+                   total_samples=total_samples, rcs=rcs, method=injection,
+                   first_sample=first_sample)
+    return received
+
+
+@profiled()
+def simulate_into(out: np.ndarray,
+                  pulse: np.ndarray,
+                  sample_rate: float,
+                  targets: Union[List[float], List[Tuple[float, float]]],
+                  noise_std: float = 0.0,
+                  first_pulse: int = 0,
+                  pri: float = 0.0,
+                  carrier_freq: float = 10e9,
+                  rng: Optional[np.random.Generator] = None,
+                  injection: str = 'auto',
+                  first_sample: int = 0) -> np.ndarray:
+    """
+    Simulate received records directly into a caller-provided buffer.
+
+    ``out`` is overwritten with what ``simulate_pulse_matrix`` would return
+    for ``len(out)`` pulses, zero-padded to the buffer width (typically one
+    PRI). Noise covers the simulated record only, exactly as in the
+    allocating functions, and no intermediate record is allocated or copied.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Complex buffer, 1-D (one pulse) or (n_pulses, n_samples).
+    pulse, sample_rate, targets, noise_std, first_pulse, pri, carrier_freq, rng, injection
+        As for ``simulate_pulse_matrix``.
+    first_sample : int, optional
+        Record sample held in column 0 of ``out`` (default 0).
+
+    Returns
+    -------
+    np.ndarray
+        ``out``.
+    """
+    ranges, velocities, rcs = split_scatterers(targets)
+    total_samples = _echo_record_length(pulse, sample_rate, ranges)
+    rows = out.reshape(-1, out.shape[-1])
+    n_rec = min(max(total_samples - first_sample, 0), rows.shape[-1])
+
+    rows[:, n_rec:] = 0
+    if noise_std == 0:
+        rows[:, :n_rec] = 0
+    elif rows.flags.c_contiguous:
+        for row in rows:   # each row's record is contiguous: draw noise straight into it
+            fill_complex_noise(row[:n_rec], noise_std, rng)
+    else:
+        rows[:, :n_rec] = 0
+        add_noise_inplace(rows[:, :n_rec], noise_std, rng)
+    _inject_echoes(rows, pulse, sample_rate, ranges, velocities,
+                   np.arange(first_pulse, first_pulse + len(rows)), pri, carrier_freq,
+                   total_samples=total_samples, rcs=rcs, method=injection,
+                   first_sample=first_sample)
+    return out
+
+
+@profiled()
+def echo_transfer_function(sample_rate: float,
+                           targets: Union[List[float], List[Tuple[float, float]]],
+                           nfft: int,
+                           n_pulses: int = 1,
+                           first_pulse: int = 0,
+                           pri: float = 0.0,
+                           carrier_freq: float = 10e9,
+                           block_targets: int = 64) -> np.ndarray:
+    """
+    Frequency response of the target channel for each pulse.
+
+    ``H[p, f] = Σ_k a_pk · exp(-j2π f τ_pk)``, with the same 1/R² amplitude,
+    Doppler phase and range walk as the time-domain model, but with the
+    exact round-trip delay τ rather than a whole number of samples.
+    Phasors are built ``block_targets`` targets at a time and summed with
+    a matrix product; for moving targets the phasors of the next pulse are
+    obtained by one complex multiply (the range walk per PRI is a fixed
+    phase ramp), so only the first pulse needs complex exponentials.
+
+    Parameters
+    ----------
+    sample_rate : float
+        Sampling frequency in Hz.
+    targets : list
+        Target ranges or (range, radial_velocity) tuples.
+    nfft : int
+        Number of frequency bins (``scipy.fft.fftfreq`` order).
+    n_pulses, first_pulse, pri, carrier_freq
+        Pulses to model, as for ``simulate_pulse_matrix``.
+    block_targets : int
+        Targets per phasor block (bounds memory at block_targets × nfft).
+
+    Returns
+    -------
+    np.ndarray
+        Complex array of shape (n_pulses, nfft).
+    """
+    c = 3e8  # Speed of light
+    ranges, velocities, rcs = split_scatterers(targets)
+    slow_time = np.arange(first_pulse, first_pulse + n_pulses) * pri
+    freqs = sp_fft.fftfreq(nfft, 1 / sample_rate)
+
+    wavelength = c / carrier_freq
+
+    # Amplitude and Doppler phase of every (pulse, target), as in _inject_echoes
+    range_m = ranges - slow_time[:, None] * velocities
+    doppler_freq = 2 * velocities / wavelength
+    amplitude = np.sqrt(rcs) / range_m**2 * np.exp(2j * np.pi * doppler_freq * slow_time[:, None])
+
+    H = np.zeros((n_pulses, nfft), dtype=complex)
+    for first in range(0, len(ranges), block_targets):
+        block = slice(first, first + block_targets)
+        phasor = np.exp(-2j * np.pi * np.outer(2 * range_m[0, block] / c, freqs))
+        if not velocities[block].any():
+            H += amplitude[:, block] @ phasor
             continue
-        
-        # Calculate signal attenuation (simplified radar equation)
-        # Amplitude proportional to 1/R^2 (power proportional to 1/R^4)
-        amplitude = 1 / range_m**2
-        
-        # Add delayed and attenuated echo
-        received_signal[delay_samples:delay_samples + len(pulse)] += amplitude * pulse
+        # Range walk: τ shrinks by 2·v·PRI/c from one pulse to the next
+        step = np.exp(2j * np.pi * np.outer(2 * velocities[block] * pri / c, freqs))
+        for p in range(n_pulses):
+            H[p] += amplitude[p, block] @ phasor
+            phasor *= step
+    return H
 
-    
-    # Add thermal noise
+
+@profiled()
+def synthesize_echoes_fd(out: np.ndarray,
+                         pulse: np.ndarray,
+                         sample_rate: float,
+                         targets: Union[List[float], List[Tuple[float, float]]],
+                         noise_std: float = 0.0,
+                         first_pulse: int = 0,
+                         pri: float = 0.0,
+                         carrier_freq: float = 10e9,
+                         rng: Optional[np.random.Generator] = None) -> np.ndarray:
+    """
+    Synthesize received records in the frequency domain into ``out``.
+
+    Each record is ``IFFT(P(f) · H(f))`` with ``H`` from
+    ``echo_transfer_function``, so echoes land at fractional-sample delays
+    with no per-target time-domain work. Noise, if any, covers the whole
+    buffer. Echoes must end inside the FFT length (record + pulse), or
+    they wrap around.
+
+    Parameters
+    ----------
+    out : np.ndarray
+        Complex buffer, 1-D (one pulse) or (n_pulses, n_samples).
+    pulse, sample_rate, targets, noise_std, first_pulse, pri, carrier_freq, rng
+        As for ``simulate_pulse_matrix``.
+
+    Returns
+    -------
+    np.ndarray
+        ``out``.
+    """
+    rows = out.reshape(-1, out.shape[-1])
+    n_samples = rows.shape[-1]
+    nfft = sp_fft.next_fast_len(n_samples + len(pulse) - 1)
+
+    spectrum = echo_transfer_function(sample_rate, targets, nfft, len(rows), first_pulse,
+                                      pri, carrier_freq).astype(rows.dtype, copy=False)
+    spectrum *= sp_fft.fft(pulse, nfft)
+    rows[...] = sp_fft.ifft(spectrum, axis=-1, overwrite_x=True)[:, :n_samples]
     if noise_std > 0:
-        received_signal = add_complex_noise(received_signal, noise_std)
-    
-    # Generate time axis
-    t = np.arange(len(received_signal)) / sample_rate
-    
-    return received_signal, t
+        add_noise_inplace(rows, noise_std, rng)
+    return out
 
 
-def add_complex_noise(signal: np.ndarray, noise_std: float) -> np.ndarray:
+@profiled()
+def compressed_echoes(pulse: np.ndarray,
+                      sample_rate: float,
+                      targets: Union[List[float], List[Tuple[float, float]]],
+                      n_samples: int,
+                      n_pulses: int = 1,
+                      noise_std: float = 0.0,
+                      first_pulse: int = 0,
+                      pri: float = 0.0,
+                      carrier_freq: float = 10e9,
+                      rng: Optional[np.random.Generator] = None,
+                      matched_filter: Optional[MatchedFilter] = None,
+                      integrate: bool = False) -> np.ndarray:
+    """
+    Matched-filter output of simulated pulses, without forming the records.
+
+    The compressed echo spectrum is ``|P(f)|² · H(f)`` (up to the filter's
+    delay and normalization), so each range line costs one inverse FFT:
+    there is no time-domain synthesis and no forward FFT of the record.
+    Noise is drawn as a white complex Gaussian spectrum of matching power,
+    i.e. receiver noise over the whole record, and is compressed with it.
+
+    Parameters
+    ----------
+    pulse : np.ndarray
+        Transmitted radar pulse.
+    sample_rate : float
+        Sampling frequency in Hz.
+    targets : list
+        Target ranges or (range, radial_velocity) tuples.
+    n_samples : int
+        Range-line length (e.g. samples per PRI).
+    n_pulses, noise_std, first_pulse, pri, carrier_freq, rng
+        As for ``simulate_pulse_matrix``.
+    matched_filter : MatchedFilter, optional
+        Filter whose reference spectrum and normalization are used, e.g.
+        ``RadarSimulator.matched_filter_engine(pulse)``.
+    integrate : bool
+        If True, sum the pulses before the inverse FFT and return their
+        coherently integrated line only, shape (1, n_samples).
+
+    Returns
+    -------
+    np.ndarray
+        Range lines of shape (n_pulses, n_samples), aligned exactly like
+        ``MatchedFilter`` output of the equivalent records.
+    """
+    mf = MatchedFilter(pulse) if matched_filter is None else matched_filter
+    nfft, _ = mf.reference(n_samples)
+    dtype = np.result_type(pulse, np.complex64)
+
+    spectrum = echo_transfer_function(sample_rate, targets, nfft, n_pulses, first_pulse,
+                                      pri, carrier_freq).astype(dtype, copy=False)
+    if integrate:
+        spectrum = np.sum(spectrum, axis=0, keepdims=True)
+        noise_std = noise_std * np.sqrt(n_pulses)
+    spectrum *= sp_fft.fft(pulse, nfft)
+    if noise_std > 0:
+        # FFT of white noise of std σ over nfft samples: white, std σ·√nfft
+        noise = fill_complex_noise(np.empty_like(spectrum), noise_std * np.sqrt(nfft), rng)
+        spectrum += noise
+    return mf.compress_spectrum(spectrum, n_samples)
+
+
+def add_complex_noise(signal: np.ndarray, noise_std: float,
+                      rng: Optional[np.random.Generator] = None) -> np.ndarray:
     """
     Add complex Gaussian noise to a signal.
     
     For complex signals, noise is added to both I and Q channels
-    independently with variance noise_std^2/2 each
+    independently with variance noise_std^2/2 each. The input is left
+    untouched; see ``radar.noise.add_noise_inplace`` to add noise to a
+    preallocated buffer without copying it.
     
     Parameters
     ----------
@@ -92,23 +632,16 @@ def add_complex_noise(signal: np.ndarray, noise_std: float) -> np.ndarray:
         Input signal (complex or real).
     noise_std : float
         Standard deviation of the complex noise.
+    rng : np.random.Generator, optional
+        Random generator to draw from (default: a fresh unseeded one).
     
     Returns
     -------
     np.ndarray
         Signal with added noise.
     """
-    # For complex Gaussian noise: σ_I = σ_Q = σ_total / √2
-    sigma_component = noise_std / np.sqrt(2)
-    
-    # Generate independent Gaussian noise for I and Q
-    noise_i = np.random.normal(0, sigma_component, size=signal.shape)
-    noise_q = np.random.normal(0, sigma_component, size=signal.shape)
-    
-    # Combine into complex noise
-    noise = noise_i + 1j * noise_q
-    
-    return signal + noise
+    noisy = np.array(signal, dtype=np.result_type(signal, np.complex64))
+    return add_noise_inplace(noisy, noise_std, rng)
 
 
 
@@ -119,12 +652,13 @@ def create_target_scenario(scenario_type: str = "simple") -> List[Tuple[float, f
     Parameters
     ----------
     scenario_type : str
-        Type of scenario: "simple", "dense", "extended", "challenging"
+        Type of scenario: "simple", "dense", "extended", "moving"
     
     Returns
     -------
     list
-        List of targets ranges (ints) defining the target scenario.
+        List of targets ranges (ints) defining the target scenario, or
+        (range, radial_velocity) tuples for the "moving" scenario.
     """
     scenarios = {
         "simple": [
@@ -149,6 +683,12 @@ def create_target_scenario(scenario_type: str = "simple") -> List[Tuple[float, f
             6000,
             8000,
             9000,
+        ],
+        "moving": [   # (range m, radial velocity m/s)
+            (1500, 0.0),
+            (2500, 12.0),
+            (4000, -20.0),
+            (6000, 30.0),
         ]
     }
     
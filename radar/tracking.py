@@ -0,0 +1,285 @@
+import numpy as np
+from typing import Dict, Optional, Tuple
+
+# Per-track state arrays, kept aligned (one entry per live track)
+_TRACK_FIELDS = ('ids', 'ranges', 'velocities', 'p_rr', 'p_rv', 'p_vv', 'hits', 'misses', 'age')
+
+
+def gate_pairs(predicted: np.ndarray,
+               detections: np.ndarray,
+               gate: float) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Candidate (detection, track) pairs closer than ``gate`` in range.
+
+    The predicted ranges are sorted once and each detection's gate is
+    located with ``np.searchsorted``, so the cost is
+    O((T + D) log T + pairs) instead of the O(T·D) of comparing every pair.
+
+    Parameters
+    ----------
+    predicted : np.ndarray
+        Predicted track ranges (any order).
+    detections : np.ndarray
+        Detected ranges.
+    gate : float
+        Maximum range difference of a candidate pair.
+
+    Returns
+    -------
+    tuple
+        (detection_index, track_index) arrays of the candidate pairs.
+    """
+    order = np.argsort(predicted, kind='stable')
+    sorted_ranges = predicted[order]
+    lo = np.searchsorted(sorted_ranges, detections - gate, side='left')
+    hi = np.searchsorted(sorted_ranges, detections + gate, side='right')
+    counts = hi - lo
+    det_index = np.repeat(np.arange(len(detections)), counts)
+    offsets = np.arange(len(det_index)) - np.repeat(np.cumsum(counts) - counts, counts)
+    return det_index, order[lo[det_index] + offsets]
+
+
+def assign_pairs(rows: np.ndarray, cols: np.ndarray, cost: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Greedy one-to-one assignment of candidate pairs by increasing cost.
+
+    Rounds of vectorized mutual-best matching: every pair that is the
+    cheapest of both its row and its column is accepted, pairs touching an
+    accepted row or column are dropped, and the rest are matched again.
+    The cheapest remaining pair is always mutual-best, so each round makes
+    progress; the result equals sequential greedy assignment (for distinct
+    costs) in a few array passes.
+
+    Returns
+    -------
+    tuple
+        (rows, cols) of the accepted pairs.
+    """
+    accepted_rows, accepted_cols = [], []
+    while len(cost):
+        by_row = np.lexsort((cost, rows))
+        row_best = by_row[np.r_[True, rows[by_row][1:] != rows[by_row][:-1]]]
+        by_col = np.lexsort((cost, cols))
+        col_best = by_col[np.r_[True, cols[by_col][1:] != cols[by_col][:-1]]]
+        mutual = np.intersect1d(row_best, col_best, assume_unique=True)
+        accepted_rows.append(rows[mutual])
+        accepted_cols.append(cols[mutual])
+
+        keep = ~(np.isin(rows, rows[mutual]) | np.isin(cols, cols[mutual]))
+        rows, cols, cost = rows[keep], cols[keep], cost[keep]
+    if not accepted_rows:
+        return np.array([], dtype=np.intp), np.array([], dtype=np.intp)
+    return np.concatenate(accepted_rows), np.concatenate(accepted_cols)
+
+
+class RangeTracker:
+    """
+    Multi-target range/velocity tracker over consecutive CPIs.
+
+    Every track carries a constant-velocity state (range, radial velocity;
+    positive velocity = closing, as in ``radar.targets``) and its 2×2
+    covariance. Tracks live in aligned NumPy arrays, so prediction, update,
+    confirmation and deletion are whole-array operations and thousands of
+    simultaneous tracks cost a few milliseconds per CPI. Detections are
+    gated through a sorted range index (``gate_pairs``) and assigned
+    greedily by normalized distance (``assign_pairs``).
+
+    Parameters
+    ----------
+    dt : float
+        Time between updates (one CPI: ``n_pulses / prf``).
+    method : str
+        'alpha-beta' (fixed gains) or 'kalman' (per-track covariance).
+    alpha, beta : float
+        Range and velocity gains of the alpha-beta filter. With measured
+        velocities, ``beta`` smooths them instead of the range residual.
+    gate : float
+        Range gate in meters around each predicted range.
+    velocity_gate : float, optional
+        Velocity gate in m/s, applied when detections carry velocities.
+    range_std, velocity_std : float
+        Measurement noise of detected ranges (m) and velocities (m/s).
+    process_noise : float
+        Kalman white-acceleration spectral density (m²/s³).
+    initial_velocity_std : float
+        Velocity uncertainty of a new track without a measured velocity.
+    confirm_hits : int
+        Associations needed before a track is confirmed.
+    max_misses : int
+        Consecutive missed updates after which a track is deleted.
+    """
+
+    def __init__(self,
+                 dt: float,
+                 method: str = 'alpha-beta',
+                 alpha: float = 0.5,
+                 beta: float = 0.2,
+                 gate: float = 15.0,
+                 velocity_gate: Optional[float] = 10.0,
+                 range_std: float = 1.0,
+                 velocity_std: float = 1.0,
+                 process_noise: float = 10.0,
+                 initial_velocity_std: float = 30.0,
+                 confirm_hits: int = 3,
+                 max_misses: int = 2):
+        if method not in ('alpha-beta', 'kalman'):
+            raise ValueError(f"Unknown tracking method: {method}")
+        self.dt = dt
+        self.method = method
+        self.alpha = alpha
+        self.beta = beta
+        self.gate = gate
+        self.velocity_gate = velocity_gate
+        self.range_std = range_std
+        self.velocity_std = velocity_std
+        self.process_noise = process_noise
+        self.initial_velocity_std = initial_velocity_std
+        self.confirm_hits = confirm_hits
+        self.max_misses = max_misses
+        self.n_updates = 0
+        self._next_id = 0
+
+        self.ids = np.array([], dtype=np.int64)
+        for field in _TRACK_FIELDS[1:6]:
+            setattr(self, field, np.array([]))
+        self.hits = np.array([], dtype=np.int64)
+        self.misses = np.array([], dtype=np.int64)
+        self.age = np.array([], dtype=np.int64)
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def predict(self) -> None:
+        """Propagate every track by ``dt`` (range decreases for closing targets)."""
+        dt = self.dt
+        self.ranges = self.ranges - self.velocities * dt
+        if self.method == 'kalman':
+            # P ← F P Fᵀ + Q with F = [[1, -dt], [0, 1]]
+            q = self.process_noise
+            self.p_rr = self.p_rr - 2 * dt * self.p_rv + dt**2 * self.p_vv + q * dt**3 / 3
+            self.p_rv = self.p_rv - dt * self.p_vv - q * dt**2 / 2
+            self.p_vv = self.p_vv + q * dt
+
+    def update(self, distances: np.ndarray,
+               velocities: Optional[np.ndarray] = None) -> Dict[str, np.ndarray]:
+        """
+        Advance one CPI: predict, associate ``distances`` (and optional
+        measured ``velocities``), update, start and delete tracks.
+
+        Returns
+        -------
+        dict
+            The confirmed tracks after the update (see ``tracks``).
+        """
+        distances = np.asarray(distances, dtype=float)
+        if velocities is not None:
+            velocities = np.asarray(velocities, dtype=float)
+        self.predict()
+
+        det, trk = gate_pairs(self.ranges, distances, self.gate)
+        cost = ((distances[det] - self.ranges[trk]) / self.gate)**2
+        if velocities is not None and self.velocity_gate is not None and len(det):
+            dv = velocities[det] - self.velocities[trk]
+            inside = np.abs(dv) <= self.velocity_gate
+            det, trk = det[inside], trk[inside]
+            cost = cost[inside] + (dv[inside] / self.velocity_gate)**2
+        det, trk = assign_pairs(det, trk, cost)
+
+        self._correct(trk, distances[det], None if velocities is None else velocities[det])
+        missed = np.ones(len(self.ids), dtype=bool)
+        missed[trk] = False
+        self.hits[trk] += 1
+        self.misses[trk] = 0
+        self.misses[missed] += 1
+        self.age += 1
+
+        # Tentative tracks die on their first miss, confirmed ones after max_misses
+        confirmed = self.hits >= self.confirm_hits
+        alive = np.where(confirmed, self.misses <= self.max_misses, self.misses == 0)
+        self._keep(alive)
+
+        new = np.ones(len(distances), dtype=bool)
+        new[det] = False
+        self._start(distances[new], None if velocities is None else velocities[new])
+        self.n_updates += 1
+        return self.tracks()
+
+    def _correct(self, trk: np.ndarray, z_range: np.ndarray, z_velocity: Optional[np.ndarray]) -> None:
+        residual = z_range - self.ranges[trk]
+        if self.method == 'alpha-beta':
+            self.ranges[trk] += self.alpha * residual
+            if z_velocity is None:
+                self.velocities[trk] -= self.beta * residual / self.dt
+            else:
+                # A measured (Doppler) velocity is far less noisy than residual / dt
+                self.velocities[trk] += self.beta * (z_velocity - self.velocities[trk])
+            return
+
+        # Sequential scalar Kalman updates: range (H = [1, 0]) then velocity (H = [0, 1])
+        p_rr, p_rv, p_vv = self.p_rr[trk], self.p_rv[trk], self.p_vv[trk]
+        s = p_rr + self.range_std**2
+        k_r, k_v = p_rr / s, p_rv / s
+        self.ranges[trk] += k_r * residual
+        self.velocities[trk] += k_v * residual
+        p_rr, p_rv, p_vv = (1 - k_r) * p_rr, (1 - k_r) * p_rv, p_vv - k_v * p_rv
+        if z_velocity is not None:
+            residual = z_velocity - self.velocities[trk]
+            s = p_vv + self.velocity_std**2
+            k_r, k_v = p_rv / s, p_vv / s
+            self.ranges[trk] += k_r * residual
+            self.velocities[trk] += k_v * residual
+            p_rr, p_rv, p_vv = p_rr - k_r * p_rv, (1 - k_v) * p_rv, (1 - k_v) * p_vv
+        self.p_rr[trk], self.p_rv[trk], self.p_vv[trk] = p_rr, p_rv, p_vv
+
+    def _keep(self, mask: np.ndarray) -> None:
+        for field in _TRACK_FIELDS:
+            setattr(self, field, getattr(self, field)[mask])
+
+    def _start(self, z_range: np.ndarray, z_velocity: Optional[np.ndarray]) -> None:
+        n = len(z_range)
+        if not n:
+            return
+        if z_velocity is None:
+            velocity, velocity_var = np.zeros(n), self.initial_velocity_std**2
+        else:
+            velocity, velocity_var = z_velocity, self.velocity_std**2
+        new = {
+            'ids': np.arange(self._next_id, self._next_id + n),
+            'ranges': z_range,
+            'velocities': velocity,
+            'p_rr': np.full(n, self.range_std**2),
+            'p_rv': np.zeros(n),
+            'p_vv': np.full(n, velocity_var),
+            'hits': np.ones(n, dtype=np.int64),
+            'misses': np.zeros(n, dtype=np.int64),
+            'age': np.ones(n, dtype=np.int64),
+        }
+        self._next_id += n
+        for field in _TRACK_FIELDS:
+            setattr(self, field, np.concatenate([getattr(self, field), new[field]]))
+
+    def tracks(self, confirmed_only: bool = True) -> Dict[str, np.ndarray]:
+        """
+        Current tracks sorted by range.
+
+        Returns
+        -------
+        dict
+            'ids', 'ranges', 'velocities', 'range_std', 'hits', 'misses'
+            and 'age' arrays.
+        """
+        mask = self.hits >= self.confirm_hits if confirmed_only else np.ones(len(self.ids), dtype=bool)
+        order = np.argsort(self.ranges[mask], kind='stable')
+        if self.method == 'kalman':
+            range_std = np.sqrt(self.p_rr[mask][order])
+        else:
+            range_std = np.full(len(order), np.nan)
+        return {
+            'ids': self.ids[mask][order],
+            'ranges': self.ranges[mask][order],
+            'velocities': self.velocities[mask][order],
+            'range_std': range_std,
+            'hits': self.hits[mask][order],
+            'misses': self.misses[mask][order],
+            'age': self.age[mask][order],
+        }
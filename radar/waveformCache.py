@@ -0,0 +1,148 @@
+import threading
+import numpy as np
+from collections import OrderedDict
+from scipy import fft as sp_fft
+from typing import Dict, Optional
+
+from radar.signalProcessing import MatchedFilter
+from radar.simulator import generate_lfm_pulse
+
+
+class WaveformEntry:
+    """Cached LFM pulse with its energy and, for a given FFT size, reference spectrum."""
+
+    __slots__ = ('pulse', 't', 'energy', 'spectrum', 'nbytes')
+
+    def __init__(self, pulse: np.ndarray, t: np.ndarray, energy: float,
+                 spectrum: Optional[np.ndarray] = None):
+        for array in (pulse, t, spectrum):
+            if array is not None:
+                array.setflags(write=False)   # shared between callers
+        self.pulse = pulse
+        self.t = t
+        self.energy = energy
+        self.spectrum = spectrum
+        self.nbytes = pulse.nbytes + t.nbytes + (0 if spectrum is None else spectrum.nbytes)
+
+
+class WaveformCache:
+    """
+    LRU cache of transmit pulses and matched-filter reference spectra.
+
+    Entries are keyed on (bandwidth, duration, sample_rate, window,
+    up_chirp, dtype, nfft) for the baseband chirp centred on 0 Hz that
+    ``RadarSimulator.generate_pulse`` transmits. An entry with ``nfft=None``
+    holds the pulse, its time axis and energy; an entry with an FFT size
+    also holds the matched-filter reference at that size: the FFT of the
+    time-reversed, conjugated pulse divided by the pulse energy, ready to
+    multiply record spectra as is. When the cached arrays exceed ``max_bytes`` the least
+    recently used entries are evicted. Cached arrays are read-only.
+
+    Parameters
+    ----------
+    max_bytes : int
+        Memory budget for all cached arrays (default 64 MiB).
+    """
+
+    def __init__(self, max_bytes: int = 64 * 2**20):
+        self.max_bytes = max_bytes
+        self.nbytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries: "OrderedDict[tuple, WaveformEntry]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self,
+            bandwidth: float,
+            duration: float,
+            sample_rate: float,
+            window: Optional[str] = 'hanning',
+            up_chirp: bool = True,
+            dtype=complex,
+            nfft: Optional[int] = None) -> WaveformEntry:
+        """Return the cached entry for these parameters, building it on a miss."""
+        dtype = np.dtype(dtype).name
+        key = (bandwidth, duration, sample_rate, window, up_chirp, dtype, nfft)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self.hits += 1
+                self._entries.move_to_end(key)
+                return entry
+            self.misses += 1
+
+        if nfft is None:
+            pulse, t = generate_lfm_pulse(start_freq=-bandwidth/2, bandwidth=bandwidth,
+                                          duration=duration, sample_rate=sample_rate,
+                                          window=window, up_chirp=up_chirp, dtype=dtype)
+            entry = WaveformEntry(pulse, t, float(np.sum(np.abs(pulse)**2)))
+        else:
+            base = self.get(bandwidth, duration, sample_rate, window, up_chirp, dtype)
+            spectrum = sp_fft.fft(np.conjugate(base.pulse[::-1]), nfft)
+            spectrum /= base.energy
+            entry = WaveformEntry(base.pulse, base.t, base.energy, spectrum)
+            entry.nbytes = spectrum.nbytes   # pulse is shared with the base entry
+
+        with self._lock:
+            if key in self._entries:   # built concurrently by another thread
+                return self._entries[key]
+            self._entries[key] = entry
+            self.nbytes += entry.nbytes
+            self._evict()
+        return entry
+
+    def find(self, pulse: np.ndarray) -> Optional[tuple]:
+        """Return the parameter key of ``pulse`` if it is a cached pulse object."""
+        with self._lock:
+            for key, entry in self._entries.items():
+                if entry.pulse is pulse and key[-1] is None:
+                    return key[:-1]
+        return None
+
+    def matched_filter(self, pulse: np.ndarray, normalize: bool = True) -> MatchedFilter:
+        """
+        Build a ``MatchedFilter`` for ``pulse``.
+
+        If ``pulse`` is a pulse handed out by this cache and ``normalize``
+        is True, the filter takes its energy and normalized reference
+        spectra from the cache, so they are computed once and shared across
+        every CPI and simulator using the same waveform. Any other pulse
+        (or an unnormalized filter) gets a plain, self-contained filter.
+        """
+        key = self.find(pulse) if normalize else None
+        if key is None:
+            return MatchedFilter(pulse, normalize=normalize)
+        return MatchedFilter(pulse, normalize=True,
+                             spectrum_source=lambda nfft: self.get(*key, nfft=nfft).spectrum,
+                             pulse_energy=self.get(*key).energy)
+
+    def _evict(self) -> None:
+        # Always keep the most recent entry, even if it alone exceeds the budget
+        while self.nbytes > self.max_bytes and len(self._entries) > 1:
+            _, entry = self._entries.popitem(last=False)
+            self.nbytes -= entry.nbytes
+            self.evictions += 1
+
+    def clear(self) -> None:
+        """Drop every entry and reset the statistics."""
+        with self._lock:
+            self._entries.clear()
+            self.nbytes = self.hits = self.misses = self.evictions = 0
+
+    def stats(self) -> Dict[str, float]:
+        """Hit/miss statistics and current memory use."""
+        lookups = self.hits + self.misses
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': self.hits / lookups if lookups else 0.0,
+            'evictions': self.evictions,
+            'entries': len(self._entries),
+            'nbytes': self.nbytes,
+        }
+
+
+# Shared by every RadarSimulator unless one is given its own cache
+DEFAULT_WAVEFORM_CACHE = WaveformCache()
+
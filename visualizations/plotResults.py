@@ -1,15 +1,100 @@
+from concurrent.futures import Future, ThreadPoolExecutor
+from time import perf_counter
+
 import matplotlib.pyplot as plt
 import numpy as np
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
 from matplotlib.gridspec import GridSpec
-import seaborn as sns
 
-sns.set_theme(style="darkgrid")
-sns.set_palette("husl")
+from radar.scoring import score_detections
+
+_THEMED = False
+
+# One background thread renders figures to files; Agg figures created
+# without pyplot never touch the GUI event loop, so this is safe.
+_RENDER_POOL = None
+
+
+def _apply_theme():
+    """Import seaborn and set the plot style, once, just before the first figure."""
+    global _THEMED
+    if not _THEMED:
+        import seaborn as sns
+        sns.set_theme(style="darkgrid")
+        sns.set_palette("husl")
+        _THEMED = True
+
+
+def _new_figure(figsize, output=None):
+    """Interactive pyplot figure, or a bare Agg figure when rendering to a file."""
+    _apply_theme()
+    if output is None:
+        return plt.figure(figsize=figsize)
+    fig = Figure(figsize=figsize)
+    FigureCanvasAgg(fig)
+    return fig
+
+
+def _finish(fig, output=None):
+    """Show the figure, or write it to *output*."""
+    if output is None:
+        plt.show()
+    else:
+        fig.savefig(output)
+
+
+def _pixel_width(ax):
+    """Width of the axes in device pixels."""
+    return max(int(ax.get_window_extent().width), 1)
+
+
+def minmax_decimate(x, y, n_bins):
+    """
+    Reduce a trace to the minimum and maximum of ``n_bins`` equal buckets.
+
+    With one bucket per pixel column the plotted envelope is identical to
+    plotting every sample (narrow peaks are never dropped), while only
+    ``2 * n_bins`` points reach the renderer. Traces already that short
+    are returned unchanged.
+    """
+    n = len(y)
+    if n <= 2 * n_bins:
+        return x, y
+    starts = np.linspace(0, n, n_bins + 1).astype(np.intp)[:-1]
+    low = np.minimum.reduceat(y, starts)
+    high = np.maximum.reduceat(y, starts)
+    return np.repeat(x[starts], 2), np.column_stack([low, high]).ravel()
+
 
+def _plot_decimated(ax, x, y, x_stop=None, max_points=None, **kwargs):
+    """Plot the part of (x, y) left of *x_stop*, min/max decimated to the axes width."""
+    if x_stop is not None:
+        stop = np.searchsorted(x, x_stop, side='right') + 1
+        x, y = x[:stop], y[:stop]
+    xd, yd = minmax_decimate(x, y, max_points or _pixel_width(ax))
+    return ax.plot(xd, yd, **kwargs)
+
+
+def render_async(plot_func, output, *args, **kwargs) -> Future:
+    """
+    Run ``plot_func(*args, output=output, **kwargs)`` on a background thread.
 
-def plot_pulse(pulse, time, title):
+    The figure is drawn with the Agg canvas and written to *output*, so the
+    caller keeps processing while it renders. Returns a Future; call
+    ``result()`` to wait for the file (and re-raise any plotting error).
+    """
+    global _RENDER_POOL
+    _apply_theme()   # style rcParams on the caller's thread, before any render starts
+    if _RENDER_POOL is None:
+        _RENDER_POOL = ThreadPoolExecutor(max_workers=1, thread_name_prefix='render')
+    return _RENDER_POOL.submit(plot_func, *args, output=output, **kwargs)
+
+
+def plot_pulse(pulse, time, title, output=None):
     """Plot real-valued pulse with enhanced formatting."""
-    fig, ax = plt.subplots(figsize=(10, 4))
+    fig = _new_figure((10, 4), output)
+    ax = fig.add_subplot(111)
     
     ax.plot(time * 1e6, pulse, linewidth=2)
     ax.set_xlabel("Time (μs)", fontsize=12)
@@ -24,14 +109,14 @@ def plot_pulse(pulse, time, title):
             verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='wheat', alpha=0.5))
     
-    plt.tight_layout()
-    plt.show()
+    fig.tight_layout()
+    _finish(fig, output)
 
 
 
-def plot_complex_pulse(pulse, t, title="Complex Pulse"):
+def plot_complex_pulse(pulse, t, title="Complex Pulse", output=None):
     """Comprehensive complex pulse visualization."""
-    fig = plt.figure(figsize=(12, 10))
+    fig = _new_figure((12, 10), output)
     fig.subplots_adjust(top=0.93, hspace=0.4, wspace=0.3)  # manually control spacing
     gs = GridSpec(3, 2, figure=fig, hspace=0.3, wspace=0.3)
     
@@ -64,9 +149,9 @@ def plot_complex_pulse(pulse, t, title="Complex Pulse"):
     ax3.set_title("Instantaneous Frequency", fontsize=12)
     ax3.grid(True, alpha=0.3)
     
-    plt.suptitle(f"LFM Chirp Analysis - Bandwidth: 20 MHz, Duration: 10 μs", 
+    fig.suptitle(f"LFM Chirp Analysis - Bandwidth: 20 MHz, Duration: 10 μs", 
                  fontsize=14, fontweight='bold')
-    plt.show()
+    _finish(fig, output)
 
 def calc_window_usec(echo_time, peaks, targets, safety_factor=1.1):
     """
@@ -89,15 +174,32 @@ def calc_window_usec(echo_time, peaks, targets, safety_factor=1.1):
 
 
 def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses, 
-                             echo_time, peaks, distances, targets):
-    """Create comprehensive multi-panel results visualization."""
-    fig = plt.figure(figsize=(16, 12))
+                             echo_time, peaks, distances, targets, output=None,
+                             max_points=None, gate=7.5):
+    """Create comprehensive multi-panel results visualization.
+
+    Detections are matched to *targets* within *gate* meters
+    (``radar.scoring.score_detections``), so extra or missed detections
+    are labelled as false alarms / listed as missed rather than paired by
+    position. Only the displayed part of each trace is drawn, min/max decimated to
+    the axes' pixel width (or *max_points* buckets), and every magnitude is
+    computed once. With *output* the figure is rendered by Agg straight to
+    that file instead of being shown.
+    """
+    fig = _new_figure((16, 12), output)
     fig.subplots_adjust(top=0.93, hspace=0.4, wspace=0.3)  # manually control spacing
     gs = GridSpec(3, 2, figure=fig, hspace=0.4, wspace=0.2)
     
+    time_us = echo_time * 1e6
+    integrated_mag = np.abs(integrated)
+    targets = np.asarray(targets, dtype=float)
+    score = score_detections(targets, distances, gate)
+    x_stop = calc_window_usec(echo_time, peaks, targets)
+    
     # 1. Raw received signal
     ax1 = fig.add_subplot(gs[0, 0])
-    ax1.plot(echo_time*1e6, np.abs(received_signal), linewidth=1, alpha=0.8)
+    _plot_decimated(ax1, time_us, np.abs(received_signal), x_stop, max_points,
+                    linewidth=1, alpha=0.8)
     ax1.set_xlabel("Time (μs)")
     ax1.set_ylabel("Amplitude")
     ax1.set_title("Raw Received Signal (Single Pulse)", fontweight='normal', fontsize=12)
@@ -105,7 +207,8 @@ def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses,
     
     # 2. Single pulse matched filter output
     ax2 = fig.add_subplot(gs[0, 1])
-    ax2.plot(echo_time*1e6, np.abs(mf_single), linewidth=1.5, color='orange')
+    _plot_decimated(ax2, time_us, np.abs(mf_single), x_stop, max_points,
+                    linewidth=1.5, color='orange')
     ax2.set_xlabel("Time (μs)")
     ax2.set_ylabel("Amplitude")
     ax2.set_title("Matched Filter Output (Single Pulse)", fontweight='normal', fontsize=12)
@@ -113,8 +216,8 @@ def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses,
     
     # Integrated signal
     ax3 = fig.add_subplot(gs[1, :])
-    ax3.plot(echo_time*1e6, np.abs(integrated), linewidth=2, 
-             label='Integrated Signal', color='darkblue')
+    _plot_decimated(ax3, time_us, integrated_mag, x_stop, max_points, linewidth=2,
+                    label='Integrated Signal', color='darkblue')
     ax3.set_xlabel("Time (μs)")
     ax3.set_ylabel("Amplitude")
     ax3.set_title(f"Coherently Integrated Signal ({n_pulses} Pulses)", fontweight='normal', fontsize=12)
@@ -122,19 +225,19 @@ def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses,
 
     # 4. Integrated signal with detections
     ax4 = fig.add_subplot(gs[2, :])
-    ax4.plot(echo_time*1e6, np.abs(integrated), linewidth=2, 
-             label='Integrated Signal', color='darkblue')
+    _plot_decimated(ax4, time_us, integrated_mag, x_stop, max_points, linewidth=2,
+                    label='Integrated Signal', color='darkblue')
     
     # Plot detected peaks
-    ax4.plot(echo_time[peaks]*1e6, np.abs(integrated[peaks]), 'rx', 
+    ax4.plot(time_us[peaks], integrated_mag[peaks], 'rx', 
              markersize=12, markeredgewidth=3, label='Detected Targets')
     
     # Add annotations
-    peak_times_us = echo_time[peaks] * 1e6
+    peak_times_us = time_us[peaks]
     cluster_thresh = 3.0                      # μs → tweak if you like
 
     # 1) build clusters of neighbouring peaks
-    clusters = [[0]]
+    clusters = [[0]] if len(peaks) else []
     for idx in range(1, len(peaks)):
         if peak_times_us[idx] - peak_times_us[idx - 1] <= cluster_thresh:
             clusters[-1].append(idx)
@@ -146,15 +249,17 @@ def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses,
         for j, p_idx in enumerate(cluster):
             peak   = peaks[p_idx]
             dist   = distances[p_idx]
-            true_d = targets[p_idx]
-            error  = dist - true_d
+            t_idx  = score['target'][p_idx]
 
             h_off = base_h_offsets[j % len(base_h_offsets)]
             v_off = 20
 
-            label = f'{dist:.1f}m\n(Δ={error:+.2f}m)'
+            if t_idx >= 0:
+                label = f'{dist:.1f}m\n(Δ={dist - targets[t_idx]:+.2f}m)'
+            else:
+                label = f'{dist:.1f}m\n(false alarm)'
             ax4.annotate(label,
-                         xy=(echo_time[peak]*1e6, np.abs(integrated[peak])),
+                         xy=(time_us[peak], integrated_mag[peak]),
                          xytext=(h_off, v_off),
                          textcoords='offset points',
                          bbox=dict(boxstyle='round,pad=0.5',
@@ -172,22 +277,147 @@ def plot_comprehensive_results(received_signal, mf_single, integrated, n_pulses,
     ax4.legend(loc='upper right')
     ax4.grid(True, alpha=0.3)
 
-    x_stop = calc_window_usec(echo_time, peaks, targets)
     for ax in (ax1, ax2, ax3, ax4):
         ax.set_xlim(0, x_stop)
     
     # Add performance summary
-    textstr = f'Targets Detected: {len(distances)}/{len(targets)}\n'
-    if len(distances) == len(targets):
-        errors = np.array(distances) - np.array(targets)
-        textstr += f'Mean Error: {np.mean(errors):.2f} m\n'
-        textstr += f'RMS Error: {np.sqrt(np.mean(errors**2)):.2f} m'
+    textstr = f'Targets Detected: {score["n_hits"]}/{len(targets)}\n'
+    if score['n_false']:
+        textstr += f'False Alarms: {score["n_false"]}\n'
+    if score['n_hits']:
+        textstr += f'Mean Error: {score["mean_error"]:.2f} m\n'
+        textstr += f'RMS Error: {score["range_rmse"]:.2f} m'
     
     ax4.text(0.02, 0.95, textstr, transform=ax4.transAxes, 
             verticalalignment='top',
             bbox=dict(boxstyle='round', facecolor='lightblue', alpha=0.8),
             fontsize=11)
     
-    plt.suptitle("Radar Signal Processing Results", 
+    fig.suptitle("Radar Signal Processing Results", 
                 fontsize=14, fontweight='bold')
-    plt.show()
+    _finish(fig, output)
+
+
+def _max_pool_columns(image, n_cols):
+    """Reduce the columns of *image* to at most ``n_cols`` by block maxima."""
+    n_rows, n = image.shape
+    block = -(-n // n_cols)
+    if block <= 1:
+        return image
+    padded = np.full((n_rows, -(-n // block) * block), -np.inf)
+    padded[:, :n] = image
+    return padded.reshape(n_rows, -1, block).max(axis=2)
+
+
+def plot_range_doppler(rd_map, velocity_axis, range_axis, detections=None,
+                       dynamic_range_db=60, max_range=None, output=None, max_points=None):
+    """Plot a range-Doppler map in dB.
+
+    Range columns are max-pooled to the axes' pixel width (or
+    *max_points*) before ``imshow``, so a 20k-bin map is drawn as a few
+    hundred columns with every strong cell still visible. *detections* is
+    an optional (distances, velocities) pair to overlay.
+    """
+    fig = _new_figure((12, 6), output)
+    ax = fig.add_subplot(111)
+
+    if max_range is not None:
+        stop = np.searchsorted(range_axis, max_range, side='right')
+        rd_map, range_axis = rd_map[:, :stop], range_axis[:stop]
+    power_db = 20 * np.log10(np.abs(rd_map) + np.finfo(float).tiny)
+    peak_db = power_db.max()
+    image = _max_pool_columns(power_db, max_points or _pixel_width(ax))
+
+    mesh = ax.imshow(image, aspect='auto', origin='lower', interpolation='nearest',
+                     cmap='viridis', vmin=peak_db - dynamic_range_db, vmax=peak_db,
+                     extent=(range_axis[0] / 1e3, range_axis[-1] / 1e3,
+                             velocity_axis[0], velocity_axis[-1]))
+    fig.colorbar(mesh, ax=ax, label="Power (dB)")
+
+    if detections is not None:
+        distances, velocities = detections
+        ax.plot(np.asarray(distances) / 1e3, velocities, 'rx', markersize=10,
+                markeredgewidth=2, label='Detections')
+        ax.legend(loc='upper right')
+
+    ax.set_xlabel("Range (km)", fontsize=12)
+    ax.set_ylabel("Radial velocity (m/s)", fontsize=12)
+    ax.set_title("Range-Doppler Map", fontsize=14, fontweight='bold')
+    ax.grid(False)
+    _finish(fig, output)
+
+
+class LiveRangeProfile:
+    """
+    Range profile that is updated in place during streaming integration.
+
+    The figure, line and marker artists are created once; ``update`` only
+    swaps their data (min/max decimated to the axes width) and redraws.
+    Redraws closer together than *min_interval* seconds are skipped so
+    plotting never throttles the stream. With *output* every redraw
+    overwrites that image file instead of refreshing a window.
+
+    Example
+    -------
+    >>> live = LiveRangeProfile(echo_time)
+    >>> for event in radar.process_stream(lines, len(pulse), pulse=pulse):
+    ...     live.update_event(event)
+    """
+
+    def __init__(self, echo_time, min_interval=0.1, output=None, max_points=None,
+                 title="Streaming Integration"):
+        self.output = output
+        self.min_interval = min_interval
+        self.title = title
+        self.time_us = echo_time * 1e6
+        self.fig = _new_figure((12, 4), output)
+        self.ax = self.fig.add_subplot(111)
+        self.line, = self.ax.plot([], [], linewidth=1.5, color='darkblue',
+                                  label='Integrated Signal')
+        self.markers, = self.ax.plot([], [], 'rx', markersize=10, markeredgewidth=2,
+                                     label='Detected Targets')
+        self.ax.set_xlim(self.time_us[0], self.time_us[-1])
+        self.ax.set_xlabel("Time (μs)", fontsize=12)
+        self.ax.set_ylabel("Amplitude", fontsize=12)
+        self.ax.legend(loc='upper right')
+        self.n_bins = max_points or _pixel_width(self.ax)
+        self._last_draw = -np.inf
+        self._top = 0.0
+        if output is None:
+            plt.ion()
+            self.fig.show()
+
+    def update(self, line, peaks=(), label=None, force=False):
+        """Show a new integrated line; returns False if the redraw was skipped."""
+        now = perf_counter()
+        if not force and now - self._last_draw < self.min_interval:
+            return False
+        magnitude = np.abs(line)
+        self.line.set_data(*minmax_decimate(self.time_us, magnitude, self.n_bins))
+        peaks = np.asarray(peaks, dtype=np.intp)
+        self.markers.set_data(self.time_us[peaks], magnitude[peaks])
+
+        # Rescale only when the peak leaves the current view or shrinks a lot
+        top = float(magnitude.max()) if len(magnitude) else 0.0
+        if top > self._top or top < 0.5 * self._top:
+            self._top = 1.1 * top
+            self.ax.set_ylim(0, self._top or 1.0)
+        self.ax.set_title(self.title if label is None else f"{self.title} - {label}",
+                          fontsize=12)
+
+        if self.output is None:
+            self.fig.canvas.draw_idle()
+            self.fig.canvas.flush_events()
+        else:
+            self.fig.savefig(self.output)
+        self._last_draw = now
+        return True
+
+    def update_event(self, event, force=False):
+        """Update from a ``RadarSimulator.process_stream`` detection event."""
+        return self.update(event['line'], event['peaks'],
+                           label=f"pulse {event['pulse_index']}", force=force)
+
+    def close(self):
+        if self.output is None:
+            plt.close(self.fig)